@@ -8,6 +8,7 @@ from routes.users import users_bp
 from routes.admin import admin_bp
 from routes.email_worker import email_worker_bp
 from routes.private_groups import private_groups_bp
+from utils.email import resume_local_email_queue
 
 app = Flask(__name__, template_folder='templates')
 
@@ -37,10 +38,24 @@ app.register_blueprint(admin_bp, url_prefix='/api/admin')
 app.register_blueprint(email_worker_bp, url_prefix='/api')
 app.register_blueprint(private_groups_bp, url_prefix='/api/private-groups')
 
+# Resume emails a previous process left in the local queue. Under `python app.py`
+# only the reloader's child process (WERKZEUG_RUN_MAIN) serves requests, so skip the parent.
+if __name__ != '__main__' or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+    resume_local_email_queue(app)
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     return {'status': 'ok'}, 200
 
+@app.cli.command('rebuild-run-counters')
+def rebuild_run_counters_command():
+    """Recompute every run's denormalized participant counters"""
+    from database import db
+    from utils.rsvp import rebuild_run_counters
+    updated = rebuild_run_counters()
+    db.session.commit()
+    print(f"Rebuilt participant counters for {updated} runs")
+
 if __name__ == '__main__':
     app.run(debug=True, port=5001)
 
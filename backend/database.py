@@ -1,6 +1,7 @@
 from flask_sqlalchemy import SQLAlchemy
 from werkzeug.security import generate_password_hash
 from sqlalchemy import create_engine
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.pool import NullPool
 import os
 from dotenv import load_dotenv
@@ -53,7 +54,7 @@ def init_db(app):
     db.init_app(app)
     
     with app.app_context():
-        from models import User, Run, RunParticipant, Announcement, PrivateGroup, PrivateGroupMember
+        from models import User, Run, RunParticipant, Announcement, PrivateGroup, PrivateGroupMember, EmailDeadLetter
         # Drop all tables and recreate them (clean slate for first release)
         # COMMENTED OUT - Database persistence enabled
         # db.drop_all()
@@ -74,7 +75,44 @@ def init_db(app):
             print("Added is_active column to users table")
         except Exception:
             db.session.rollback()
-        
+
+        # Add denormalized participant counters to runs table if they don't exist
+        added_counters = False
+        for column in ('confirmed_count', 'interested_count', 'out_count', 'waitlisted_count', 'attended_count'):
+            try:
+                db.session.execute(db.text(f'ALTER TABLE runs ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0'))
+                db.session.commit()
+                added_counters = True
+                print(f"Added {column} column to runs table")
+            except Exception:
+                db.session.rollback()
+        if added_counters:
+            from utils.rsvp import rebuild_run_counters
+            rebuild_run_counters()
+            db.session.commit()
+
+        # Add waitlist position column to run_participants if it doesn't exist
+        try:
+            db.session.execute(db.text('ALTER TABLE run_participants ADD COLUMN waitlisted_at TIMESTAMP'))
+            db.session.commit()
+            print("Added waitlisted_at column to run_participants table")
+        except Exception:
+            db.session.rollback()
+
+        # Create run_participants indexes added after the table (waitlist queue, per-user stats)
+        for index in RunParticipant.__table__.indexes:
+            index.create(db.engine, checkfirst=True)
+
+        # Create users autocomplete prefix indexes added after the table
+        # (IF NOT EXISTS: reflection can't see expression indexes, so checkfirst doesn't work here)
+        for index in User.__table__.indexes:
+            db.session.execute(CreateIndex(index, if_not_exists=True))
+        db.session.commit()
+
+        # Full-text search index (FTS5 + triggers on SQLite, GIN over to_tsvector on Postgres)
+        from utils.search import setup_search_index
+        setup_search_index()
+
         # Clear all data for first release (remove this section after initial deployment)
         # This ensures a clean database state for the first release
         # COMMENTED OUT - Database clearing disabled
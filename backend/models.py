@@ -1,4 +1,5 @@
 from database import db
+from sqlalchemy.orm import joinedload
 from datetime import datetime
 import uuid
 import json
@@ -26,6 +27,16 @@ class User(db.Model):
     # Relationships
     referrer = db.relationship('User', remote_side=[id], backref='referred_users')
     
+    # Normalized prefix indexes for admin user autocomplete (text_pattern_ops lets Postgres use them for LIKE 'abc%')
+    __table_args__ = (
+        db.Index('ix_users_username_lower', db.func.lower(username).label('username_lower'),
+                 postgresql_ops={'username_lower': 'text_pattern_ops'}),
+        db.Index('ix_users_first_name_lower', db.func.lower(first_name).label('first_name_lower'),
+                 postgresql_ops={'first_name_lower': 'text_pattern_ops'}),
+        db.Index('ix_users_last_name_lower', db.func.lower(last_name).label('last_name_lower'),
+                 postgresql_ops={'last_name_lower': 'text_pattern_ops'}),
+    )
+    
     def to_dict(self, include_no_shows=False):
         from models import Run, RunParticipant
         # Public-only stats: count completed public runs and this user's attendance in them
@@ -114,6 +125,12 @@ class Run(db.Model):
     completed_by = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=True)
     guest_attendees = db.Column(db.Text, nullable=True)  # JSON array of guest names
     private_group_id = db.Column(db.String(36), db.ForeignKey('private_groups.id'), nullable=True)
+    # Denormalized participant counters, kept in sync by the RSVP and completion paths (utils/rsvp.py)
+    confirmed_count = db.Column(db.Integer, default=0, nullable=False)
+    interested_count = db.Column(db.Integer, default=0, nullable=False)
+    out_count = db.Column(db.Integer, default=0, nullable=False)
+    waitlisted_count = db.Column(db.Integer, default=0, nullable=False)
+    attended_count = db.Column(db.Integer, default=0, nullable=False)
     
     # Relationships
     location_entity = db.relationship('Location', backref='runs')
@@ -121,6 +138,29 @@ class Run(db.Model):
     completer = db.relationship('User', foreign_keys=[completed_by], backref='completed_runs')
     participants = db.relationship('RunParticipant', back_populates='run', cascade='all, delete-orphan')
     
+    def cost_per_person(self):
+        """Per-person cost for display, from the counter columns (no participant scan)"""
+        # Completed runs store the final per-person cost; otherwise if variable,
+        # divide total by confirmed participants
+        if not self.is_completed and self.is_variable_cost and self.total_cost:
+            confirmed_count = self.confirmed_count or 0
+            if confirmed_count > 0:
+                return round(float(self.total_cost) / confirmed_count, 2)
+            return round(float(self.total_cost), 2)  # Show total if no participants yet
+        return round(float(self.cost), 2) if self.cost else None
+    
+    def participant_counts(self):
+        """Participant counts by status, from the counter columns"""
+        if self.is_completed:
+            guest_count = len(json.loads(self.guest_attendees)) if self.guest_attendees else 0
+            return {'attended': (self.attended_count or 0) + guest_count}
+        return {
+            'confirmed': self.confirmed_count or 0,
+            'interested': self.interested_count or 0,
+            'out': self.out_count or 0,
+            'waitlisted': self.waitlisted_count or 0
+        }
+    
     def to_dict(self, include_participants=True):
         # Load location entity
         location_data = None
@@ -171,6 +211,9 @@ class Run(db.Model):
             'private_group_name': self.private_group.name if self.private_group_id and self.private_group else None
         }
         
+        result['cost'] = self.cost_per_person()
+        result['participant_counts'] = self.participant_counts()
+        
         if include_participants:
             if self.is_completed:
                 # For completed runs, only show attended participants
@@ -181,22 +224,11 @@ class Run(db.Model):
                 )
                 attended_users = [p.user for p in attended_participants_list]
                 
-                # Include guest attendees in the count
-                guest_count = len(json.loads(self.guest_attendees)) if self.guest_attendees else 0
-                total_attended = len(attended_users) + guest_count
-                
-                # Use the final cost (already calculated per person)
-                result['cost'] = round(float(self.cost), 2) if self.cost else None
-                
                 attended = [{'username': u.username, 'first_name': u.first_name, 'last_name': u.last_name, 'badge': u.badge, 'attended': True} for u, p in zip(attended_users, attended_participants_list)]
                 
                 result['participants'] = {
                     'attended': attended
                 }
-                
-                result['participant_counts'] = {
-                    'attended': total_attended
-                }
             else:
                 # For non-completed runs, show all statuses
                 # Sort confirmed participants by updated_at (earliest confirmed first)
@@ -206,6 +238,11 @@ class Run(db.Model):
                 )
                 interested_participants_list = [p for p in self.participants if p.status == 'interested']
                 out_participants_list = [p for p in self.participants if p.status == 'out']
+                # Waitlist in promotion order (first come, first served)
+                waitlisted_participants_list = sorted(
+                    [p for p in self.participants if p.status == 'waitlisted'],
+                    key=lambda p: (p.waitlisted_at or datetime.utcnow(), p.id)
+                )
                 no_show_participants_list = [p for p in self.participants if p.no_show]
                 
                 # Get participant user objects with names (confirmed in sorted order)
@@ -214,35 +251,21 @@ class Run(db.Model):
                 out_users = [p.user for p in out_participants_list]
                 no_show_users = [p.user for p in no_show_participants_list]
                 
-                confirmed_count = len(confirmed_users)
-                
-                # Calculate cost: if variable, divide total by confirmed participants; otherwise use fixed cost
-                if self.is_variable_cost and self.total_cost:
-                    if confirmed_count > 0:
-                        result['cost'] = round(float(self.total_cost) / confirmed_count, 2)
-                    else:
-                        result['cost'] = round(float(self.total_cost), 2)  # Show total if no participants yet
-                else:
-                    result['cost'] = round(float(self.cost), 2) if self.cost else None
-                
                 confirmed = [{'username': u.username, 'first_name': u.first_name, 'last_name': u.last_name, 'badge': u.badge, 'attended': p.attended, 'no_show': p.no_show} for u, p in zip(confirmed_users, confirmed_participants_list)]
                 interested = [{'username': u.username, 'first_name': u.first_name, 'last_name': u.last_name, 'badge': u.badge, 'attended': p.attended, 'no_show': p.no_show} for u, p in zip(interested_users, interested_participants_list)]
                 out = [{'username': u.username, 'first_name': u.first_name, 'last_name': u.last_name, 'badge': u.badge, 'attended': p.attended, 'no_show': p.no_show} for u, p in zip(out_users, out_participants_list)]
+                waitlisted = [{'username': p.user.username, 'first_name': p.user.first_name, 'last_name': p.user.last_name, 'badge': p.user.badge, 'attended': p.attended, 'no_show': p.no_show} for p in waitlisted_participants_list]
                 no_show = [{'username': p.user.username, 'first_name': p.user.first_name, 'last_name': p.user.last_name, 'badge': p.user.badge, 'attended': False, 'no_show': True} for p in no_show_participants_list]
                 
                 result['participants'] = {
                     'confirmed': confirmed,
                     'interested': interested,
                     'out': out,
+                    'waitlisted': waitlisted,
                     'no_show': no_show
                 }
                 
-                result['participant_counts'] = {
-                    'confirmed': len(confirmed),
-                    'interested': len(interested),
-                    'out': len(out),
-                    'no_show': len(no_show)
-                }
+                result['participant_counts']['no_show'] = len(no_show)
         
         return result
 
@@ -252,16 +275,21 @@ class RunParticipant(db.Model):
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     run_id = db.Column(db.String(36), db.ForeignKey('runs.id'), nullable=False)
     user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False)
-    status = db.Column(db.String(20), nullable=False)  # 'confirmed', 'interested', 'out'
+    status = db.Column(db.String(20), nullable=False)  # 'confirmed', 'interested', 'out', 'waitlisted'
     attended = db.Column(db.Boolean, default=False, nullable=False)
     no_show = db.Column(db.Boolean, default=False, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    waitlisted_at = db.Column(db.DateTime, nullable=True)  # Queue position while status is 'waitlisted'
     
     # Relationships
     run = db.relationship('Run', back_populates='participants')
     user = db.relationship('User', backref='run_participations')
     
-    __table_args__ = (db.UniqueConstraint('run_id', 'user_id', name='unique_run_user'),)
+    __table_args__ = (
+        db.UniqueConstraint('run_id', 'user_id', name='unique_run_user'),
+        db.Index('ix_run_participants_waitlist', 'run_id', 'status', 'waitlisted_at'),
+        db.Index('ix_run_participants_user', 'user_id'),  # per-user stats subqueries
+    )
     
     def to_dict(self):
         return {
@@ -271,6 +299,7 @@ class RunParticipant(db.Model):
             'status': self.status,
             'attended': self.attended,
             'no_show': self.no_show,
+            'waitlisted_at': self.waitlisted_at.isoformat() if self.waitlisted_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
 
@@ -288,18 +317,45 @@ class PrivateGroup(db.Model):
     members = db.relationship('PrivateGroupMember', back_populates='group', cascade='all, delete-orphan')
     runs = db.relationship('Run', backref='private_group', cascade='all, delete-orphan')
     
-    def to_dict(self, include_members=False):
+    def to_dict(self, include_members=False, member_count=None, upcoming_run_count=None):
+        """
+        Serialize the group
+
+        Args:
+            include_members: Include the member roster (one joined query)
+            member_count: Precomputed member count (listings pass grouped counts; otherwise COUNT query)
+            upcoming_run_count: Precomputed upcoming run count (only included when given)
+        """
+        roster = self.roster() if include_members else None
+        if member_count is None:
+            member_count = len(roster) if roster is not None else PrivateGroupMember.query.filter_by(group_id=self.id).count()
         result = {
             'id': self.id,
             'name': self.name,
             'description': self.description,
             'created_by': self.created_by,
             'created_at': self.created_at.isoformat() if self.created_at else None,
-            'member_count': len(self.members) if self.members else 0
+            'member_count': member_count
         }
+        if upcoming_run_count is not None:
+            result['upcoming_run_count'] = upcoming_run_count
         if include_members:
-            result['members'] = [m.to_dict() for m in self.members]
+            result['members'] = roster
         return result
+    
+    def roster(self, user_ids=None):
+        """
+        Serialized memberships with their users loaded in the same query
+
+        Args:
+            user_ids: Only these members (e.g. the ones just added)
+        """
+        query = PrivateGroupMember.query.options(joinedload(PrivateGroupMember.user)).filter(
+            PrivateGroupMember.group_id == self.id
+        )
+        if user_ids is not None:
+            query = query.filter(PrivateGroupMember.user_id.in_(user_ids))
+        return [m.to_dict() for m in query.order_by(PrivateGroupMember.added_at, PrivateGroupMember.id)]
 
 
 class PrivateGroupMember(db.Model):
@@ -352,3 +408,27 @@ class Announcement(db.Model):
             'is_active': self.is_active
         }
 
+
+class EmailDeadLetter(db.Model):
+    __tablename__ = 'email_dead_letters'
+    
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    to = db.Column(db.String(120), nullable=False)
+    subject = db.Column(db.String(300), nullable=False)
+    html_content = db.Column(db.Text, nullable=False)
+    text_content = db.Column(db.Text, nullable=True)
+    attempts = db.Column(db.Integer, default=0, nullable=False)
+    last_error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    replayed_at = db.Column(db.DateTime, nullable=True)
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'to': self.to,
+            'subject': self.subject,
+            'attempts': self.attempts,
+            'last_error': self.last_error,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'replayed_at': self.replayed_at.isoformat() if self.replayed_at else None
+        }
@@ -1,16 +1,27 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, Response, stream_with_context
 from datetime import datetime, date, time
-from sqlalchemy import func
+from sqlalchemy import update, select, insert, delete, exists
 import logging
 from database import db
-from models import User, Run, RunParticipant, Announcement
+from models import User, Run, RunParticipant, Announcement, EmailDeadLetter
 from middleware import require_admin
-from utils.email import send_account_verified_email, send_account_inactive_email, send_account_active_email, send_run_completed_email, send_run_reminder_email, send_announcement_email
+from utils.metrics import render_metrics
+from utils.export import EXPORT_DATASETS, EXPORT_FORMATS, stream_export
+from utils.analytics import get_analytics
+from utils.search import SEARCH_DEFAULT_LIMIT, SEARCH_ENTITIES, SEARCH_MAX_LIMIT, SUGGEST_DEFAULT_LIMIT, SUGGEST_MAX_LIMIT, search, suggest_users
+from utils.recipients import stream_verified_recipients
+from utils.user_bulk import bulk_update_users
+from utils.stats import apply_run_completion_stats
+from utils.run_import import RunImporter, iter_json_rows, iter_ndjson_rows
+from utils.rsvp import RSVP_STATUSES, WAITLISTED, apply_rsvp, apply_rsvp_changes, promote_waitlist, rebuild_run_counters, rsvp_summary, run_summary
+from utils.email import send_email, send_account_verified_email, send_account_inactive_email, send_account_active_email, send_run_completed_email, send_run_reminder_email, send_announcement_email, send_waitlist_promoted_email
 
 logger = logging.getLogger(__name__)
 
 admin_bp = Blueprint('admin', __name__)
 
+NDJSON_MIMETYPES = ('application/x-ndjson', 'application/ndjson', 'application/jsonl')
+
 @admin_bp.route('/users', methods=['GET'])
 @require_admin
 def get_all_users():
@@ -20,6 +31,39 @@ def get_all_users():
         'users': [user.to_dict() for user in users]
     }), 200
 
+@admin_bp.route('/users/suggest', methods=['GET'])
+@require_admin
+def suggest_users_route():
+    """
+    Autocomplete verified users by username / first name / last name prefix
+
+    Query params:
+        q: Prefix text (each word must match)
+        limit: Max users (default 10, max 50)
+        exclude_run_id: Skip users who already RSVP'd to this run
+        exclude_group_id: Skip users already in this private group
+        badge: Only users with this badge
+        include_inactive: 'true' to include inactive users
+    """
+    try:
+        limit = min(max(int(request.args.get('limit', SUGGEST_DEFAULT_LIMIT)), 1), SUGGEST_MAX_LIMIT)
+    except ValueError:
+        return jsonify({'error': 'limit must be an integer'}), 400
+    
+    try:
+        users = suggest_users(
+            request.args.get('q', ''),
+            limit=limit,
+            exclude_run_id=request.args.get('exclude_run_id'),
+            exclude_group_id=request.args.get('exclude_group_id'),
+            badge=request.args.get('badge'),
+            include_inactive=request.args.get('include_inactive', 'false').lower() == 'true'
+        )
+        return jsonify({'users': users}), 200
+    except Exception as e:
+        logger.error(f"Error suggesting users: {str(e)}")
+        return jsonify({'error': 'Failed to suggest users'}), 500
+
 @admin_bp.route('/users/<user_id>/verify', methods=['PUT'])
 @require_admin
 def verify_user(user_id):
@@ -65,18 +109,32 @@ def set_user_active(user_id):
     try:
         was_active = user.is_active
         user.is_active = is_active
+        promotions = []
 
         if not is_active:
-            # Remove upcoming RSVPs (preserve attendance history on completed/historical runs)
-            upcoming_participations = RunParticipant.query.join(Run).filter(
-                RunParticipant.user_id == user.id,
-                Run.is_completed == False
-            ).all()
-            for participation in upcoming_participations:
-                db.session.delete(participation)
+            # Remove upcoming RSVPs in one DELETE (preserve attendance history on completed/historical runs)
+            affected_run_ids = set(db.session.scalars(
+                delete(RunParticipant).where(
+                    RunParticipant.user_id == user.id,
+                    RunParticipant.run_id.in_(select(Run.id).where(Run.is_completed == False))
+                ).returning(RunParticipant.run_id),
+                execution_options={'synchronize_session': False}
+            ))
+            rebuild_run_counters(affected_run_ids)
+            # Slots this user held go to the next people on each waitlist
+            if affected_run_ids:
+                for run in Run.query.filter(Run.id.in_(affected_run_ids)).all():
+                    promotions.append((run, promote_waitlist(run)))
 
         db.session.commit()
 
+        for run, promoted in promotions:
+            if promoted:
+                try:
+                    send_waitlist_promoted_email(run, promoted)
+                except Exception as e:
+                    logger.error(f"Failed to send waitlist promoted emails: {str(e)}")
+
         if was_active and not is_active:
             try:
                 send_account_inactive_email(user)
@@ -134,8 +192,7 @@ def create_announcement():
         
         # Send announcement email to all verified users (fire-and-forget)
         try:
-            verified_users = User.query.filter_by(is_verified=True, is_active=True).all()
-            send_announcement_email(data['message'], verified_users)
+            send_announcement_email(data['message'], stream_verified_recipients())
         except Exception as e:
             # Log error but don't fail announcement creation
             logger.error(f"Failed to send announcement emails: {str(e)}")
@@ -229,15 +286,8 @@ def bulk_assign_badge():
         return jsonify({'error': f'Invalid badge. Must be one of: {valid_badges}. Note: plus_one requires individual assignment with referrer.'}), 400
     
     try:
-        updated_count = 0
-        for user_id in user_ids:
-            user = User.query.get(user_id)
-            if user:
-                user.badge = badge
-                # Clear referred_by for bulk assignment (except plus_one which needs manual assignment)
-                if badge != 'plus_one':
-                    user.referred_by = None
-                updated_count += 1
+        # One UPDATE for the whole selection; bulk assignment clears referred_by (plus_one needs individual assignment)
+        updated_count = bulk_update_users(user_ids, badge=badge, referred_by=None)
         
         db.session.commit()
         
@@ -247,6 +297,7 @@ def bulk_assign_badge():
         }), 200
     except Exception as e:
         db.session.rollback()
+        logger.error(f"Failed to bulk assign badges: {str(e)}")
         return jsonify({'error': 'Failed to assign badges'}), 500
 
 @admin_bp.route('/runs', methods=['GET'])
@@ -276,42 +327,36 @@ def complete_run(run_id):
     guest_attendees = data.get('guest_attendees', [])  # List of guest names (non-users)
     
     try:
-        # Update confirmed participants
-        confirmed_participants = RunParticipant.query.filter_by(
-            run_id=run_id,
-            status='confirmed'
-        ).all()
+        no_show_ids = set(no_show_user_ids) - set(attended_user_ids)
+        extra_ids = set(extra_attendees)
+        
+        # Confirmed participants default to attended; listed no-shows are flipped (one UPDATE)
+        db.session.execute(
+            update(RunParticipant).where(
+                RunParticipant.run_id == run_id,
+                RunParticipant.status == 'confirmed'
+            ).values(
+                attended=~RunParticipant.user_id.in_(no_show_ids) if no_show_ids else True,
+                no_show=RunParticipant.user_id.in_(no_show_ids) if no_show_ids else False
+            ),
+            execution_options={'synchronize_session': False}
+        )
         
-        for participant in confirmed_participants:
-            if participant.user_id in attended_user_ids:
-                participant.attended = True
-                participant.no_show = False
-            elif participant.user_id in no_show_user_ids:
-                participant.attended = False
-                participant.no_show = True
-            else:
-                # Default: mark as attended if not specified
-                participant.attended = True
-                participant.no_show = False
-        
-        # Add extra attendees who didn't RSVP
-        for user_id in extra_attendees:
-            # Check if user already has a participation record
-            existing = RunParticipant.query.filter_by(
-                run_id=run_id,
-                user_id=user_id
-            ).first()
-            
-            if not existing:
-                # Create new participant record for extra attendee
-                extra_participant = RunParticipant(
-                    run_id=run_id,
-                    user_id=user_id,
-                    status='confirmed',  # Treat as confirmed for stats
-                    attended=True,
-                    no_show=False
+        if extra_ids:
+            # Extra attendees who didn't RSVP get a participant record in one bulk INSERT;
+            # existing records (any status) are left as they are
+            existing_ids = set(db.session.scalars(
+                select(RunParticipant.user_id).where(
+                    RunParticipant.run_id == run_id,
+                    RunParticipant.user_id.in_(extra_ids)
                 )
-                db.session.add(extra_participant)
+            ))
+            new_extra_ids = extra_ids - existing_ids
+            if new_extra_ids:
+                db.session.execute(insert(RunParticipant), [
+                    {'run_id': run_id, 'user_id': user_id, 'status': 'confirmed', 'attended': True, 'no_show': False}
+                    for user_id in new_extra_ids
+                ])
         
         # Store guest attendees (non-users) as JSON
         import json
@@ -340,23 +385,12 @@ def complete_run(run_id):
         run.completed_at = datetime.utcnow()
         run.completed_by = request.current_user.id
         
+        # Counters and user stats follow from the participant rows, all in this transaction
+        db.session.flush()
+        rebuild_run_counters([run_id])
+        apply_run_completion_stats(run_id)
         db.session.commit()
         
-        # Recalculate stats for all affected users
-        # Import utils.py directly (not utils package) by using importlib
-        import importlib.util
-        import os
-        # Get backend directory - works in both local and Vercel
-        backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        utils_file_path = os.path.join(backend_dir, 'utils.py')
-        if os.path.exists(utils_file_path):
-            spec = importlib.util.spec_from_file_location("utils_stats", utils_file_path)
-            utils_stats = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(utils_stats)
-            all_affected_users = set(attended_user_ids + no_show_user_ids + extra_attendees)
-            for user_id in all_affected_users:
-                utils_stats.recalculate_user_stats(user_id)
-        
         # Send completion email to all attendees
         try:
             # Ensure location relationship is loaded
@@ -421,73 +455,197 @@ def remind_run(run_id):
     except Exception as e:
         return jsonify({'error': f'Failed to send reminders: {str(e)}'}), 500
 
+@admin_bp.route('/metrics', methods=['GET'])
+@require_admin
+def get_metrics():
+    """Email pipeline metrics in Prometheus text format (per process)"""
+    return Response(render_metrics(), mimetype='text/plain; version=0.0.4')
+
+@admin_bp.route('/search', methods=['GET'])
+@require_admin
+def search_all():
+    """
+    Full-text search over runs, users and private groups
+
+    Query params:
+        q: Search text (word prefixes)
+        types: Comma-separated subset of runs,users,groups (default all)
+        limit: Max results per type (default 10, max 50)
+    """
+    query = request.args.get('q', '').strip()
+    types = [t for t in request.args.get('types', '').split(',') if t] or list(SEARCH_ENTITIES)
+    invalid = [t for t in types if t not in SEARCH_ENTITIES]
+    if invalid:
+        return jsonify({'error': f"Invalid types: {', '.join(invalid)}. Must be one of: {', '.join(SEARCH_ENTITIES)}"}), 400
+    try:
+        limit = min(max(int(request.args.get('limit', SEARCH_DEFAULT_LIMIT)), 1), SEARCH_MAX_LIMIT)
+    except ValueError:
+        return jsonify({'error': 'limit must be an integer'}), 400
+    
+    try:
+        return jsonify({'query': query, 'results': search(query, types, limit)}), 200
+    except Exception as e:
+        logger.error(f"Error searching for '{query}': {str(e)}")
+        return jsonify({'error': 'Search failed'}), 500
+
+@admin_bp.route('/analytics', methods=['GET'])
+@require_admin
+def get_admin_analytics():
+    """Attendance per month, fill rate per location and no-show rate by badge (cached until data changes)"""
+    refresh = request.args.get('refresh', 'false').lower() == 'true'
+    try:
+        analytics, cached = get_analytics(refresh=refresh)
+        return jsonify({'analytics': analytics, 'cached': cached}), 200
+    except Exception as e:
+        logger.error(f"Error computing analytics: {str(e)}")
+        return jsonify({'error': 'Failed to compute analytics'}), 500
+
+@admin_bp.route('/export/<dataset>', methods=['GET'])
+@require_admin
+def export_data(dataset):
+    """
+    Stream runs, participations or user stats as CSV (default) or NDJSON
+
+    Query params:
+        format: 'csv' or 'ndjson'
+    """
+    export_format = request.args.get('format', 'csv').lower()
+    if dataset not in EXPORT_DATASETS:
+        return jsonify({'error': f"Unknown dataset. Must be one of: {', '.join(EXPORT_DATASETS)}"}), 400
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({'error': f"Unknown format. Must be one of: {', '.join(EXPORT_FORMATS)}"}), 400
+    
+    filename = f"{dataset}-{date.today().isoformat()}.{export_format}"
+    return Response(
+        stream_with_context(stream_export(dataset, export_format)),
+        mimetype=EXPORT_FORMATS[export_format],
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+    )
+
+@admin_bp.route('/email-dead-letters', methods=['GET'])
+@require_admin
+def get_email_dead_letters():
+    """List emails that exhausted their retries (most recent first)"""
+    include_replayed = request.args.get('include_replayed', 'false').lower() == 'true'
+    query = EmailDeadLetter.query
+    if not include_replayed:
+        query = query.filter(EmailDeadLetter.replayed_at.is_(None))
+    dead_letters = query.order_by(EmailDeadLetter.created_at.desc()).all()
+    return jsonify({
+        'dead_letters': [dead_letter.to_dict() for dead_letter in dead_letters]
+    }), 200
+
+@admin_bp.route('/email-dead-letters/<dead_letter_id>/replay', methods=['POST'])
+@require_admin
+def replay_email_dead_letter(dead_letter_id):
+    """Re-enqueue a dead-lettered email with a fresh retry budget"""
+    dead_letter = EmailDeadLetter.query.get(dead_letter_id)
+    if not dead_letter:
+        return jsonify({'error': 'Dead letter not found'}), 404
+    
+    if dead_letter.replayed_at:
+        return jsonify({'error': 'Dead letter was already replayed'}), 400
+    
+    try:
+        if not send_email(
+            to=dead_letter.to,
+            subject=dead_letter.subject,
+            html_content=dead_letter.html_content,
+            text_content=dead_letter.text_content,
+            notification_type='dead_letter_replay'
+        ):
+            return jsonify({'error': 'Failed to enqueue email'}), 500
+        
+        dead_letter.replayed_at = datetime.utcnow()
+        db.session.commit()
+        
+        return jsonify({
+            'message': 'Email re-enqueued successfully',
+            'dead_letter': dead_letter.to_dict()
+        }), 200
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Failed to replay dead letter: {str(e)}")
+        return jsonify({'error': 'Failed to replay email'}), 500
+
 @admin_bp.route('/runs/<run_id>/rsvps', methods=['GET'])
 @require_admin
 def get_run_rsvps(run_id):
-    """Get all RSVPs for a run plus list of verified users without RSVP"""
+    """
+    Get all RSVPs for a run plus list of verified users without RSVP
+
+    Query params:
+        include_available: 'false' to skip available_users (pickers use /users/suggest instead)
+        limit: Page size for available_users (default all)
+        offset: Number of available users to skip (with limit)
+    """
+    include_available = request.args.get('include_available', 'true').lower() == 'true'
+    limit = request.args.get('limit', type=int)
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    
     run = Run.query.get(run_id)
     if not run:
         return jsonify({'error': 'Run not found'}), 404
     
-    # Get all current participants for this run
-    participants = RunParticipant.query.filter_by(run_id=run_id).all()
-    participant_user_ids = {p.user_id for p in participants}
-    
-    # Build participants by status
-    confirmed = []
-    interested = []
-    out = []
-    
-    for p in participants:
-        user = p.user
-        if not user:
-            continue
-        user_data = {
-            'id': user.id,
-            'username': user.username,
-            'first_name': user.first_name,
-            'last_name': user.last_name,
-            'badge': user.badge,
-            'status': p.status
-        }
-        if p.status == 'confirmed':
-            confirmed.append(user_data)
-        elif p.status == 'interested':
-            interested.append(user_data)
-        elif p.status == 'out':
-            out.append(user_data)
-    
-    # Get all verified active users who don't have an RSVP for this run
-    available_users = User.query.filter(
-        User.is_verified == True,
-        User.is_active == True,
-        ~User.id.in_(participant_user_ids) if participant_user_ids else True
-    ).order_by(User.first_name, User.last_name, User.username).all()
-    
-    available = [{
-        'id': u.id,
-        'username': u.username,
-        'first_name': u.first_name,
-        'last_name': u.last_name,
-        'badge': u.badge
-    } for u in available_users]
-    
-    return jsonify({
+    # Roster and user columns in one JOIN (others by last RSVP change like Run.to_dict, waitlist in promotion order)
+    roster = db.session.query(
+        RunParticipant.status,
+        User.id,
+        User.username,
+        User.first_name,
+        User.last_name,
+        User.badge
+    ).join(User, RunParticipant.user_id == User.id).filter(
+        RunParticipant.run_id == run_id
+    ).order_by(RunParticipant.waitlisted_at.nulls_first(), RunParticipant.updated_at, RunParticipant.id).all()
+    
+    participants = {status: [] for status in (*RSVP_STATUSES, WAITLISTED)}
+    for status, user_id, username, first_name, last_name, badge in roster:
+        if status in participants:
+            participants[status].append({
+                'id': user_id,
+                'username': username,
+                'first_name': first_name,
+                'last_name': last_name,
+                'badge': badge,
+                'status': status
+            })
+    
+    response = {
         'run_id': run_id,
-        'participants': {
-            'confirmed': confirmed,
-            'interested': interested,
-            'out': out
-        },
-        'available_users': available,
+        'participants': participants,
         'capacity': run.capacity
-    }), 200
+    }
+    
+    if include_available:
+        # Verified active users with no RSVP for this run (anti-join, no ID list round trip)
+        available_query = db.session.query(
+            User.id,
+            User.username,
+            User.first_name,
+            User.last_name,
+            User.badge
+        ).filter(
+            User.is_verified == True,
+            User.is_active == True,
+            ~exists().where(RunParticipant.run_id == run_id, RunParticipant.user_id == User.id)
+        )
+        page_query = available_query.order_by(User.first_name, User.last_name, User.username)
+        if limit is not None:
+            page_query = page_query.limit(max(limit, 0)).offset(offset)
+        
+        response['available_users'] = [dict(row._mapping) for row in page_query]
+        response['available_total'] = (
+            available_query.count() if limit is not None else len(response['available_users'])
+        )
+    
+    return jsonify(response), 200
 
 
 @admin_bp.route('/runs/<run_id>/rsvp/<user_id>', methods=['PUT'])
 @require_admin
 def admin_set_rsvp(run_id, user_id):
-    """Set a user's RSVP status (admin only)"""
+    """Set a user's RSVP status (admin only); ?include_run=true also returns the full run"""
     run = Run.query.get(run_id)
     if not run:
         return jsonify({'error': 'Run not found'}), 404
@@ -509,196 +667,158 @@ def admin_set_rsvp(run_id, user_id):
     status = data.get('status')  # 'confirmed', 'interested', 'out', or null to remove
     
     # Validate status
-    if status is not None and status not in ['confirmed', 'interested', 'out']:
+    if status is not None and status not in RSVP_STATUSES:
         return jsonify({'error': 'Status must be confirmed, interested, out, or null'}), 400
     
     try:
-        # Find existing participant record
-        participant = RunParticipant.query.filter_by(
-            run_id=run_id,
-            user_id=user_id
-        ).first()
-        
-        if status is None:
-            # Remove RSVP entirely
-            if participant:
-                db.session.delete(participant)
-                db.session.commit()
-            return jsonify({
-                'message': 'RSVP removed successfully',
-                'run': run.to_dict()
-            }), 200
-        
-        # Check capacity if trying to confirm
-        if status == 'confirmed' and run.capacity:
-            current_confirmed_count = RunParticipant.query.filter_by(
-                run_id=run_id,
-                status='confirmed'
-            ).count()
-            
-            # If user is not already confirmed, check if there's space
-            if not participant or participant.status != 'confirmed':
-                if current_confirmed_count >= run.capacity:
-                    return jsonify({'error': 'Run is at capacity'}), 400
-        
-        if participant:
-            participant.status = status
-            participant.updated_at = datetime.utcnow()
-        else:
-            participant = RunParticipant(
-                run_id=run_id,
-                user_id=user_id,
-                status=status
-            )
-            db.session.add(participant)
+        # Capacity check, write and waitlist promotion happen under the run's lock (see utils/rsvp.py)
+        stored_status = apply_rsvp(run, user_id, status)
+        promoted = promote_waitlist(run)
         
         db.session.commit()
         
-        return jsonify({
-            'message': 'RSVP updated successfully',
-            'run': run.to_dict()
-        }), 200
+        if promoted:
+            try:
+                send_waitlist_promoted_email(run, promoted)
+            except Exception as e:
+                logger.error(f"Failed to send waitlist promoted emails: {str(e)}")
+        
+        if status is None:
+            message = 'RSVP removed successfully'
+        elif stored_status == WAITLISTED:
+            message = 'Run is full - user added to the waitlist'
+        else:
+            message = 'RSVP updated successfully'
+        response = {
+            'message': message,
+            'rsvp': rsvp_summary(run, stored_status)
+        }
+        if request.args.get('include_run', 'false').lower() == 'true':
+            response['run'] = run.to_dict()
+        return jsonify(response), 200
     except Exception as e:
         db.session.rollback()
         logger.error(f"Failed to update RSVP: {str(e)}")
         return jsonify({'error': 'Failed to update RSVP'}), 500
 
 
-@admin_bp.route('/runs/import', methods=['POST'])
+@admin_bp.route('/runs/<run_id>/rsvps', methods=['PUT'])
 @require_admin
-def import_runs():
-    """Import historical runs from JSON"""
-    data = request.get_json()
+def admin_set_rsvps(run_id):
+    """Apply many RSVP changes to a run in one transaction (admin only)"""
+    run = Run.query.get(run_id)
+    if not run:
+        return jsonify({'error': 'Run not found'}), 404
+    
+    if run.is_completed:
+        return jsonify({'error': 'Cannot change RSVP for completed run'}), 400
     
-    if not data or not data.get('runs'):
-        return jsonify({'error': 'Runs data is required'}), 400
+    data = request.get_json() or {}
+    changes = data.get('changes')  # [{'user_id': ..., 'status': 'confirmed'|'interested'|'out'|null}, ...]
+    if not isinstance(changes, list) or not changes:
+        return jsonify({'error': 'changes must be a non-empty list'}), 400
     
-    imported_count = 0
+    # Validate every change up front - the batch is all or nothing
     errors = []
+    seen_user_ids = set()
+    for index, change in enumerate(changes):
+        user_id = change.get('user_id') if isinstance(change, dict) else None
+        if not user_id:
+            errors.append(f"Change {index}: user_id is required")
+        elif user_id in seen_user_ids:
+            errors.append(f"Change {index}: duplicate user_id {user_id}")
+        else:
+            seen_user_ids.add(user_id)
+        if isinstance(change, dict) and change.get('status') is not None and change.get('status') not in RSVP_STATUSES:
+            errors.append(f"Change {index}: status must be confirmed, interested, out, or null")
+    
+    users = {u.id: u for u in User.query.filter(User.id.in_(seen_user_ids)).all()} if seen_user_ids else {}
+    for user_id in seen_user_ids:
+        user = users.get(user_id)
+        if not user:
+            errors.append(f"User {user_id} not found")
+        elif not user.is_verified:
+            errors.append(f"User {user.username} must be verified to RSVP")
+        elif not user.is_active:
+            errors.append(f"User {user.username} is inactive and cannot RSVP")
+    
+    if errors:
+        return jsonify({'error': 'Invalid RSVP changes', 'errors': errors}), 400
     
     try:
-        for run_data in data['runs']:
-            try:
-                # Parse date and times
-                run_date = datetime.strptime(run_data['date'], '%Y-%m-%d').date()
-                start_time = datetime.strptime(run_data['start_time'], '%H:%M').time()
-                end_time = datetime.strptime(run_data['end_time'], '%H:%M').time()
-                
-                # Get location_id - either provided directly or match by name/address
-                location_id = run_data.get('location_id')
-                if not location_id:
-                    # Try to match by location name or address
-                    from models import Location
-                    location_name = run_data.get('location', '')
-                    location_address = run_data.get('address', '')
-                    
-                    # Try to find matching location
-                    location = None
-                    if location_name:
-                        location = Location.query.filter_by(name=location_name).first()
-                    if not location and location_address:
-                        location = Location.query.filter_by(address=location_address).first()
-                    
-                    if location:
-                        location_id = location.id
-                    else:
-                        # Default to first location if no match found
-                        first_location = Location.query.first()
-                        if first_location:
-                            location_id = first_location.id
-                        else:
-                            errors.append(f"Run '{run_data['title']}': No locations available")
-                            continue
-                
-                # Create run - historical runs are automatically completed
-                new_run = Run(
-                    title=run_data['title'],
-                    date=run_date,
-                    start_time=start_time,
-                    end_time=end_time,
-                    location_id=location_id,
-                    description=run_data.get('description'),
-                    capacity=run_data.get('capacity'),
-                    cost=run_data.get('cost'),
-                    created_by=request.current_user.id,
-                    is_historical=True,
-                    is_completed=True,
-                    completed_at=datetime.combine(run_date, datetime.min.time()),
-                    completed_by=request.current_user.id
-                )
-                
-                db.session.add(new_run)
-                db.session.flush()  # Get the run ID
-                
-                # Add participants if provided
-                if 'participants' in run_data:
-                    participants_data = run_data['participants']
-                    
-                    # Process confirmed participants - mark as attended for historical runs
-                    for username in participants_data.get('confirmed', []):
-                        user = User.query.filter(func.lower(User.username) == func.lower(username)).first()
-                        if user:
-                            participant = RunParticipant(
-                                run_id=new_run.id,
-                                user_id=user.id,
-                                status='confirmed',
-                                attended=True,
-                                no_show=False
-                            )
-                            db.session.add(participant)
-                    
-                    # Process interested participants - not attended for historical runs
-                    for username in participants_data.get('interested', []):
-                        user = User.query.filter(func.lower(User.username) == func.lower(username)).first()
-                        if user:
-                            participant = RunParticipant(
-                                run_id=new_run.id,
-                                user_id=user.id,
-                                status='interested',
-                                attended=False,
-                                no_show=False
-                            )
-                            db.session.add(participant)
-                    
-                    # Process out participants - not attended for historical runs
-                    for username in participants_data.get('out', []):
-                        user = User.query.filter(func.lower(User.username) == func.lower(username)).first()
-                        if user:
-                            participant = RunParticipant(
-                                run_id=new_run.id,
-                                user_id=user.id,
-                                status='out',
-                                attended=False,
-                                no_show=False
-                            )
-                            db.session.add(participant)
-                
-                imported_count += 1
-            except Exception as e:
-                errors.append(f"Error importing run '{run_data.get('title', 'Unknown')}': {str(e)}")
-                continue
+        # One lock, one capacity check and one commit for the whole batch (see utils/rsvp.py)
+        stored, promoted = apply_rsvp_changes(run, [(c['user_id'], c.get('status')) for c in changes])
         
         db.session.commit()
         
-        # Recalculate stats for all users who participated in imported runs
-        # Import utils.py directly (not utils package) by using importlib
-        import importlib.util
-        import os
-        # Get backend directory - works in both local and Vercel
-        backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        utils_file_path = os.path.join(backend_dir, 'utils.py')
-        if os.path.exists(utils_file_path):
-            spec = importlib.util.spec_from_file_location("utils_stats", utils_file_path)
-            utils_stats = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(utils_stats)
-            utils_stats.recalculate_all_user_stats()
+        if promoted:
+            try:
+                send_waitlist_promoted_email(run, promoted)
+            except Exception as e:
+                logger.error(f"Failed to send waitlist promoted emails: {str(e)}")
         
         return jsonify({
-            'message': f'Successfully imported {imported_count} runs',
-            'imported_count': imported_count,
-            'errors': errors
+            'message': f'Updated {len(stored)} RSVPs',
+            'results': [{'user_id': c['user_id'], 'status': stored[c['user_id']]} for c in changes],
+            'run': run_summary(run)
         }), 200
     except Exception as e:
         db.session.rollback()
-        return jsonify({'error': f'Failed to import runs: {str(e)}'}), 500
+        logger.error(f"Failed to update RSVPs: {str(e)}")
+        return jsonify({'error': 'Failed to update RSVPs'}), 500
+
+
+@admin_bp.route('/runs/import', methods=['POST'])
+@require_admin
+def import_runs():
+    """
+    Import historical runs
 
+    Accepts either a JSON body ({"runs": [...]}) or NDJSON (Content-Type
+    application/x-ndjson, one run object per line) streamed in chunks.
+    Invalid rows are skipped and reported per row. With ?dry_run=true (or
+    "dry_run": true in a JSON body) rows are only validated and nothing is written.
+    Not atomic: if a chunk fails to write, earlier chunks stay imported and the
+    500 response carries imported_count and the failing row range.
+    """
+    dry_run = request.args.get('dry_run', 'false').lower() == 'true'
+    if request.mimetype in NDJSON_MIMETYPES:
+        rows = iter_ndjson_rows(request.stream)
+    else:
+        data = request.get_json(silent=True)
+        if not data or not data.get('runs'):
+            return jsonify({'error': 'Runs data is required'}), 400
+        dry_run = dry_run or data.get('dry_run') is True
+        rows = iter_json_rows(data['runs'])
+    
+    try:
+        importer = RunImporter(created_by=request.current_user.id, dry_run=dry_run)
+        for row_number, run_data, error in rows:
+            if importer.failure:
+                break
+            importer.add(row_number, run_data, error)
+        result = importer.finish()
+        
+        if importer.failure:
+            failure = importer.failure
+            return jsonify({
+                'error': (
+                    f'Import stopped at rows {failure["first_row"]}-{failure["last_row"]}: {failure["error"]}. '
+                    f'{result["imported_count"]} runs before them were already imported; '
+                    f're-upload starting at row {failure["first_row"]} to avoid duplicates'
+                ),
+                **result
+            }), 500
+        
+        if dry_run:
+            message = f'Dry run: {result["imported_count"]} runs would be imported'
+        else:
+            message = f'Successfully imported {result["imported_count"]} runs'
+        return jsonify({
+            'message': message,
+            **result
+        }), 200
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Failed to import runs: {str(e)}")
+        return jsonify({'error': f'Failed to import runs: {str(e)}'}), 500
@@ -5,9 +5,10 @@ from datetime import datetime, timedelta
 import secrets
 import logging
 from database import db
-from models import User, PrivateGroupMember
+from models import User
 from middleware import generate_token, require_auth
 from utils.email import send_welcome_email, send_admin_new_user_notification, send_password_reset_email
+from utils.run_access import get_viewer_group_ids
 
 logger = logging.getLogger(__name__)
 
@@ -111,9 +112,7 @@ def login():
 def get_current_user():
     """Get current authenticated user"""
     user_dict = request.current_user.to_dict()
-    user_dict['private_group_count'] = PrivateGroupMember.query.filter_by(
-        user_id=request.current_user.id
-    ).count()
+    user_dict['private_group_count'] = len(get_viewer_group_ids(request.current_user))
     return jsonify({
         'user': user_dict
     }), 200
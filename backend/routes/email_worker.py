@@ -4,7 +4,7 @@ Email worker endpoint for QStash (production) - processes individual email jobs
 from flask import Blueprint, request, jsonify
 import os
 import logging
-from utils.email import _send_email_direct
+from utils.email import _send_email_direct, EMAIL_SENT, EMAIL_RETRY_SCHEDULED, EMAIL_DEAD_LETTERED, EMAIL_SKIPPED
 
 logger = logging.getLogger(__name__)
 
@@ -88,22 +88,32 @@ def email_worker():
         subject = data.get('subject')
         html_content = data.get('html_content')
         text_content = data.get('text_content')
+        attempt = data.get('attempt', 0)
         
         if not to or not subject or not html_content:
             return jsonify({'error': 'Missing required fields: to, subject, html_content'}), 400
         
         # Send email directly (rate limiting handled by QStash scheduling)
-        success = _send_email_direct(
+        # Rate-limited sends are re-published to QStash with backoff rather than retried here
+        outcome = _send_email_direct(
             to=to,
             subject=subject,
             html_content=html_content,
             text_content=text_content,
-            retry_on_429=True
+            handle_failures=True,
+            attempt=attempt
         )
         
-        if success:
-            return jsonify({'ok': True, 'message': 'Email sent successfully'}), 200
+        if outcome in (EMAIL_SENT, EMAIL_RETRY_SCHEDULED):
+            return jsonify({'ok': True, 'message': 'Email sent or retry scheduled'}), 200
+        elif outcome == EMAIL_SKIPPED:
+            # Sending is disabled (logged) - redelivery would not help
+            return jsonify({'ok': False, 'error': 'Email sending not configured'}), 200
+        elif outcome == EMAIL_DEAD_LETTERED:
+            # Recorded for admin replay - acknowledge so QStash does not redeliver it
+            return jsonify({'ok': False, 'error': 'Failed to send email (moved to dead letters)'}), 200
         else:
+            # Neither rescheduled nor recorded - fail so QStash redelivers the job
             return jsonify({'ok': False, 'error': 'Failed to send email'}), 500
             
     except Exception as e:
@@ -1,27 +1,63 @@
 from flask import Blueprint, request, jsonify
 from datetime import datetime, date
+from sqlalchemy import func, select, insert, delete
+from sqlalchemy.dialects import postgresql, sqlite
 import logging
 from database import db
 from models import PrivateGroup, PrivateGroupMember, Run, RunParticipant, User
 from middleware import require_auth, require_admin
+from utils.run_access import get_viewer_group_ids, user_can_view_group
 
 logger = logging.getLogger(__name__)
 
 private_groups_bp = Blueprint('private_groups', __name__)
 
 
-def _is_group_member(user_id, group_id):
-    """Check if a user is a member of a private group"""
-    return PrivateGroupMember.query.filter_by(
-        group_id=group_id, user_id=user_id
-    ).first() is not None
+def _groups_with_counts(*criteria):
+    """
+    Serialize groups with member and upcoming-run counts from one query
+
+    Counts come from grouped subqueries joined to the group rows, so listings
+    never load membership or run collections.
+    """
+    member_counts = select(
+        PrivateGroupMember.group_id, func.count(PrivateGroupMember.id).label('count')
+    ).group_by(PrivateGroupMember.group_id).subquery()
+    upcoming_counts = select(
+        Run.private_group_id, func.count(Run.id).label('count')
+    ).where(
+        Run.private_group_id.isnot(None),
+        Run.is_completed == False,
+        Run.date >= date.today()
+    ).group_by(Run.private_group_id).subquery()
+    
+    rows = db.session.query(
+        PrivateGroup,
+        func.coalesce(member_counts.c.count, 0),
+        func.coalesce(upcoming_counts.c.count, 0)
+    ).outerjoin(
+        member_counts, member_counts.c.group_id == PrivateGroup.id
+    ).outerjoin(
+        upcoming_counts, upcoming_counts.c.private_group_id == PrivateGroup.id
+    ).filter(*criteria).order_by(PrivateGroup.name).all()
+    
+    return [
+        group.to_dict(member_count=member_count, upcoming_run_count=upcoming_run_count)
+        for group, member_count, upcoming_run_count in rows
+    ]
+
+
+def _insert_skipping_duplicates(model):
+    """INSERT ... ON CONFLICT DO NOTHING on Postgres/SQLite (plain INSERT elsewhere)"""
+    dialect = {'postgresql': postgresql, 'sqlite': sqlite}.get(db.engine.dialect.name)
+    if dialect is None:
+        return insert(model)
+    return dialect.insert(model).on_conflict_do_nothing()
 
 
 def _require_membership_or_admin(user, group_id):
     """Return error response if user is not a member or admin, None if OK"""
-    if user.is_admin:
-        return None
-    if not _is_group_member(user.id, group_id):
+    if not user_can_view_group(user, group_id):
         return jsonify({'error': 'Not found'}), 404
     return None
 
@@ -32,14 +68,12 @@ def get_my_groups():
     """List groups the current user is a member of"""
     user = request.current_user
     if user.is_admin:
-        groups = PrivateGroup.query.order_by(PrivateGroup.name).all()
+        groups = _groups_with_counts()
     else:
-        memberships = PrivateGroupMember.query.filter_by(user_id=user.id).all()
-        group_ids = [m.group_id for m in memberships]
-        groups = PrivateGroup.query.filter(PrivateGroup.id.in_(group_ids)).order_by(PrivateGroup.name).all()
+        groups = _groups_with_counts(PrivateGroup.id.in_(get_viewer_group_ids(user)))
     
     return jsonify({
-        'groups': [g.to_dict() for g in groups]
+        'groups': groups
     }), 200
 
 
@@ -232,8 +266,13 @@ def delete_group(group_id):
     
     try:
         group_name = group.name
-        run_count = len(group.runs)
-        db.session.delete(group)
+        # Set-based cascade (children first) instead of loading every run and participant
+        group_run_ids = select(Run.id).where(Run.private_group_id == group_id)
+        bulk = {'synchronize_session': False}
+        db.session.execute(delete(RunParticipant).where(RunParticipant.run_id.in_(group_run_ids)), execution_options=bulk)
+        run_count = db.session.execute(delete(Run).where(Run.private_group_id == group_id), execution_options=bulk).rowcount
+        db.session.execute(delete(PrivateGroupMember).where(PrivateGroupMember.group_id == group_id), execution_options=bulk)
+        db.session.execute(delete(PrivateGroup).where(PrivateGroup.id == group_id), execution_options=bulk)
         db.session.commit()
         
         return jsonify({
@@ -264,27 +303,31 @@ def add_member(group_id):
         return jsonify({'error': 'user_id or user_ids is required'}), 400
     
     try:
-        added = 0
-        for uid in user_ids:
-            user = User.query.get(uid)
-            if not user:
-                continue
-            existing = PrivateGroupMember.query.filter_by(group_id=group_id, user_id=uid).first()
-            if existing:
-                continue
-            member = PrivateGroupMember(
-                group_id=group_id,
-                user_id=uid,
-                added_by=request.current_user.id
+        # Resolve real users and current members with one IN query each, then insert the rest in one statement
+        requested_ids = list(dict.fromkeys(user_ids))
+        valid_ids = set(db.session.scalars(select(User.id).where(User.id.in_(requested_ids))))
+        member_ids = set(db.session.scalars(
+            select(PrivateGroupMember.user_id).where(
+                PrivateGroupMember.group_id == group_id,
+                PrivateGroupMember.user_id.in_(requested_ids)
             )
-            db.session.add(member)
-            added += 1
+        ))
+        new_ids = [uid for uid in requested_ids if uid in valid_ids and uid not in member_ids]
+        added_ids = []
+        if new_ids:
+            # Rows another admin inserted since the lookup are skipped rather than failing the request
+            added_ids = list(db.session.scalars(
+                _insert_skipping_duplicates(PrivateGroupMember).returning(PrivateGroupMember.user_id),
+                [{'group_id': group_id, 'user_id': uid, 'added_by': request.current_user.id} for uid in new_ids]
+            ))
         
         db.session.commit()
         
+        # Only the new memberships; the client merges them into the roster it already has
         return jsonify({
-            'message': f'{added} member(s) added',
-            'group': group.to_dict(include_members=True)
+            'message': f'{len(added_ids)} member(s) added',
+            'added': group.roster(user_ids=added_ids) if added_ids else [],
+            'member_count': PrivateGroupMember.query.filter_by(group_id=group_id).count()
         }), 200
     except Exception as e:
         db.session.rollback()
@@ -310,7 +353,8 @@ def remove_member(group_id, user_id):
         
         return jsonify({
             'message': 'Member removed',
-            'group': group.to_dict(include_members=True)
+            'removed_user_id': user_id,
+            'member_count': PrivateGroupMember.query.filter_by(group_id=group_id).count()
         }), 200
     except Exception as e:
         db.session.rollback()
@@ -322,7 +366,6 @@ def remove_member(group_id, user_id):
 @require_admin
 def get_all_groups():
     """Get all private groups (admin only, for dropdowns)"""
-    groups = PrivateGroup.query.order_by(PrivateGroup.name).all()
     return jsonify({
-        'groups': [g.to_dict() for g in groups]
+        'groups': _groups_with_counts()
     }), 200
@@ -4,8 +4,10 @@ import logging
 from database import db
 from models import Run, RunParticipant, Location, User, PrivateGroup, PrivateGroupMember
 from middleware import require_auth, require_admin, verify_token
-from utils.email import send_run_created_email, send_run_modified_email, send_run_cancelled_email
-from utils.run_access import get_optional_user_from_request, user_can_view_runs
+from utils.email import send_run_created_email, send_run_modified_email, send_run_cancelled_email, send_waitlist_promoted_email
+from utils.run_access import get_optional_user_from_request, user_can_view_runs, user_can_view_group
+from utils.recipients import stream_verified_recipients
+from utils.rsvp import RSVP_STATUSES, WAITLISTED, apply_rsvp, promote_waitlist, rsvp_summary
 
 logger = logging.getLogger(__name__)
 
@@ -67,15 +69,8 @@ def get_run(run_id):
         return jsonify({'error': 'Run not found'}), 404
     
     # Guard private runs: only group members or admins can view
-    if run.private_group_id:
-        if not current_user:
-            return jsonify({'error': 'Run not found'}), 404
-        if not current_user.is_admin:
-            is_member = PrivateGroupMember.query.filter_by(
-                group_id=run.private_group_id, user_id=current_user.id
-            ).first()
-            if not is_member:
-                return jsonify({'error': 'Run not found'}), 404
+    if run.private_group_id and not user_can_view_group(current_user, run.private_group_id):
+        return jsonify({'error': 'Run not found'}), 404
     
     return jsonify({
         'run': run.to_dict()
@@ -136,10 +131,12 @@ def create_run():
         # Send email: group members for private runs, all verified users for public
         try:
             if new_run.private_group_id:
-                members = PrivateGroupMember.query.filter_by(group_id=new_run.private_group_id).all()
-                recipients = [m.user for m in members if m.user and m.user.is_verified and m.user.is_active]
+                member_ids = db.session.query(PrivateGroupMember.user_id).filter(
+                    PrivateGroupMember.group_id == new_run.private_group_id
+                )
+                recipients = stream_verified_recipients(User.id.in_(member_ids))
             else:
-                recipients = User.query.filter_by(is_verified=True, is_active=True).all()
+                recipients = stream_verified_recipients()
             send_run_created_email(new_run, recipients)
         except Exception as e:
             logger.error(f"Failed to send run created emails: {str(e)}")
@@ -234,17 +231,26 @@ def update_run(run_id):
             else:
                 run.cost = None
         
+        # A raised (or removed) capacity lets people in off the waitlist
+        promoted = promote_waitlist(run) if 'capacity' in changes else []
+        
         db.session.commit()
         
+        if promoted:
+            try:
+                send_waitlist_promoted_email(run, promoted)
+            except Exception as e:
+                logger.error(f"Failed to send waitlist promoted emails: {str(e)}")
+        
         # Send modification email if any changes detected (fire-and-forget)
         if changes:
             try:
                 # Ensure location relationship is loaded
                 db.session.refresh(run)
-                # Get confirmed and interested participants
+                # Get confirmed, interested and waitlisted participants
                 participants = RunParticipant.query.filter(
                     RunParticipant.run_id == run_id,
-                    RunParticipant.status.in_(['confirmed', 'interested'])
+                    RunParticipant.status.in_(['confirmed', 'interested', WAITLISTED])
                 ).all()
                 recipients = [p.user for p in participants if p.user]
                 send_run_modified_email(run, recipients, changes)
@@ -252,14 +258,9 @@ def update_run(run_id):
                 # If a private run is opened to the public, notify verified users
                 # who were not already participants on the run.
                 if old_private_group_id and not run.private_group_id:
-                    participant_ids = {p.user_id for p in participants}
-                    public_recipients = User.query.filter_by(is_verified=True, is_active=True).all()
-                    new_public_recipients = [
-                        user for user in public_recipients
-                        if user.id not in participant_ids
-                    ]
-                    if new_public_recipients:
-                        send_run_created_email(run, new_public_recipients)
+                    participant_ids = [p.user_id for p in participants]
+                    new_public_recipients = stream_verified_recipients(~User.id.in_(participant_ids))
+                    send_run_created_email(run, new_public_recipients)
             except Exception as e:
                 # Log error but don't fail update
                 logger.error(f"Failed to send run modified emails: {str(e)}")
@@ -286,10 +287,10 @@ def delete_run(run_id):
         return jsonify({'error': 'Cannot delete completed run'}), 400
     
     try:
-        # Get confirmed and interested participants before deleting
+        # Get confirmed, interested and waitlisted participants before deleting
         participants = RunParticipant.query.filter(
             RunParticipant.run_id == run_id,
-            RunParticipant.status.in_(['confirmed', 'interested'])
+            RunParticipant.status.in_(['confirmed', 'interested', WAITLISTED])
         ).all()
         recipients = [p.user for p in participants if p.user]
         
@@ -333,7 +334,12 @@ def delete_run(run_id):
 @runs_bp.route('/<run_id>/rsvp', methods=['POST'])
 @require_auth
 def update_rsvp(run_id):
-    """Update user's RSVP status for a run"""
+    """
+    Update user's RSVP status for a run
+
+    Responds with just the new status, counts and cost; pass ?include_run=true
+    to also get the fully serialized run (participant roster included).
+    """
     run = Run.query.get(run_id)
     if not run:
         return jsonify({'error': 'Run not found'}), 404
@@ -350,62 +356,36 @@ def update_rsvp(run_id):
         return jsonify({'error': 'Account is inactive - contact an admin'}), 403
     
     # For private runs, check group membership
-    if run.private_group_id and not request.current_user.is_admin:
-        is_member = PrivateGroupMember.query.filter_by(
-            group_id=run.private_group_id, user_id=request.current_user.id
-        ).first()
-        if not is_member:
-            return jsonify({'error': 'Run not found'}), 404
+    if run.private_group_id and not user_can_view_group(request.current_user, run.private_group_id):
+        return jsonify({'error': 'Run not found'}), 404
     
     data = request.get_json()
     status = data.get('status')
     
-    if status not in ['confirmed', 'interested', 'out']:
+    if status not in RSVP_STATUSES:
         return jsonify({'error': 'Status must be confirmed, interested, or out'}), 400
     
-    # Check capacity if trying to confirm
-    if status == 'confirmed' and run.capacity:
-        # Count current confirmed participants
-        current_confirmed_count = RunParticipant.query.filter_by(
-            run_id=run_id,
-            status='confirmed'
-        ).count()
-        
-        # Check if user is already confirmed (they should be able to stay confirmed)
-        existing_participant = RunParticipant.query.filter_by(
-            run_id=run_id,
-            user_id=request.current_user.id
-        ).first()
-        
-        # If user is not already confirmed, check if there's space
-        if not existing_participant or existing_participant.status != 'confirmed':
-            if current_confirmed_count >= run.capacity:
-                return jsonify({'error': 'Run is at capacity'}), 400
-    
     try:
-        # Find or create participant record
-        participant = RunParticipant.query.filter_by(
-            run_id=run_id,
-            user_id=request.current_user.id
-        ).first()
-        
-        if participant:
-            participant.status = status
-            participant.updated_at = datetime.utcnow()
-        else:
-            participant = RunParticipant(
-                run_id=run_id,
-                user_id=request.current_user.id,
-                status=status
-            )
-            db.session.add(participant)
+        # Capacity check, write and waitlist promotion happen under the run's lock (see utils/rsvp.py)
+        stored_status = apply_rsvp(run, request.current_user.id, status)
+        promoted = promote_waitlist(run)
         
         db.session.commit()
         
-        return jsonify({
-            'message': 'RSVP updated successfully',
-            'run': run.to_dict()
-        }), 200
+        if promoted:
+            try:
+                send_waitlist_promoted_email(run, promoted)
+            except Exception as e:
+                logger.error(f"Failed to send waitlist promoted emails: {str(e)}")
+        
+        response = {
+            'message': 'Run is full - added to the waitlist' if stored_status == WAITLISTED else 'RSVP updated successfully',
+            'rsvp': rsvp_summary(run, stored_status)
+        }
+        if request.args.get('include_run', 'false').lower() == 'true':
+            response['run'] = run.to_dict()
+            response['run']['user_status'] = stored_status
+        return jsonify(response), 200
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': 'Failed to update RSVP'}), 500
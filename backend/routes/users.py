@@ -46,16 +46,16 @@ def update_user_profile():
 @users_bp.route('/me/runs', methods=['GET'])
 @require_auth
 def get_user_runs():
-    """Get user's runs (signed up + history) - only shows confirmed or interested, not out"""
+    """Get user's runs (signed up + history) - only shows confirmed, interested or waitlisted, not out"""
     user = request.current_user
 
     if not user_can_view_runs(user):
         return jsonify({'upcoming': [], 'history': []}), 200
 
-    # Get only runs where user is confirmed or interested (exclude 'out')
+    # Get only runs where user is confirmed, interested or waitlisted (exclude 'out')
     participations = RunParticipant.query.filter(
         RunParticipant.user_id == user.id,
-        RunParticipant.status.in_(['confirmed', 'interested'])
+        RunParticipant.status.in_(['confirmed', 'interested', 'waitlisted'])
     ).all()
     run_ids = [p.run_id for p in participations]
     
@@ -0,0 +1,195 @@
+"""
+Admin analytics computed with GROUP BY queries over runs and run_participants.
+
+Results are cached per data generation: a per-process counter bumped whenever
+a transaction that wrote runs, participants, users or locations commits, so
+repeated dashboard loads cost nothing until the data changes. Like the email
+metrics, the cache is per process; on Vercel a warm instance cannot see writes
+served by another instance, so entries also expire after ANALYTICS_CACHE_TTL.
+"""
+import threading
+import time
+from datetime import datetime, date
+from sqlalchemy import event, func, case, and_, extract
+from sqlalchemy.orm import Session
+from database import db
+from models import User, Run, RunParticipant, Location
+
+# Seconds a cached result may be served without seeing a local write
+ANALYTICS_CACHE_TTL = 300
+
+# Tables whose writes invalidate cached analytics
+ANALYTICS_TABLES = frozenset({'runs', 'run_participants', 'users', 'locations'})
+
+_generation = 0
+_generation_lock = threading.Lock()
+_cache = {'generation': None, 'computed_at': 0.0, 'analytics': None}
+_cache_lock = threading.Lock()
+
+
+def bump_data_generation():
+    """Invalidate cached analytics"""
+    global _generation
+    with _generation_lock:
+        _generation += 1
+
+
+# Session.info key marking a transaction that wrote analytics tables
+_PENDING_BUMP = 'analytics_pending_bump'
+
+
+@event.listens_for(Session, 'after_flush')
+def _mark_on_flush(session, flush_context):
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if getattr(obj, '__tablename__', None) in ANALYTICS_TABLES:
+            session.info[_PENDING_BUMP] = True
+            return
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _mark_on_bulk_statement(orm_execute_state):
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or mapper.local_table.name in ANALYTICS_TABLES:
+        orm_execute_state.session.info[_PENDING_BUMP] = True
+
+
+@event.listens_for(Session, 'after_commit')
+def _bump_on_commit(session):
+    # Bumping at flush time would let a concurrent request cache results read before the commit
+    if session.info.pop(_PENDING_BUMP, False):
+        bump_data_generation()
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_on_rollback(session, previous_transaction):
+    # A rolled-back savepoint may still be followed by a commit of the outer transaction
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_BUMP, None)
+
+
+def _rate(numerator, denominator):
+    return round(numerator / denominator, 4) if denominator else None
+
+
+def _attendance_by_month():
+    """Completed runs per month with total and unique attendance"""
+    year = extract('year', Run.date)
+    month = extract('month', Run.date)
+    rows = db.session.query(
+        year,
+        month,
+        func.count(func.distinct(Run.id)),
+        func.count(RunParticipant.id),
+        func.count(func.distinct(RunParticipant.user_id)),
+    ).outerjoin(
+        RunParticipant,
+        and_(RunParticipant.run_id == Run.id, RunParticipant.attended == True)
+    ).filter(Run.is_completed == True).group_by(year, month).order_by(year, month).all()
+    return [
+        {
+            'month': f'{int(row_year):04d}-{int(row_month):02d}',
+            'runs': runs,
+            'attendance': attendance,
+            'unique_players': unique_players,
+            'average_attendance': round(attendance / runs, 2) if runs else None,
+        }
+        for row_year, row_month, runs, attendance, unique_players in rows
+    ]
+
+
+def _fill_rate_by_location():
+    """
+    Confirmed spots over capacity per location, for upcoming runs only
+
+    Completed runs are excluded: completion confirms extra attendees beyond
+    capacity, so their counts are attendance rather than fill. Runs without a
+    capacity are skipped.
+    """
+    rows = db.session.query(
+        Location.id,
+        Location.name,
+        func.count(Run.id),
+        func.sum(Run.confirmed_count),
+        func.sum(Run.capacity),
+        func.sum(Run.waitlisted_count),
+    ).join(Run, Run.location_id == Location.id).filter(
+        Run.is_completed == False,
+        Run.date >= date.today(),
+        Run.capacity.isnot(None),
+        Run.capacity > 0
+    ).group_by(Location.id, Location.name).order_by(Location.name).all()
+    return [
+        {
+            'location_id': location_id,
+            'location': name,
+            'runs': runs,
+            'confirmed': int(confirmed or 0),
+            'capacity': int(capacity or 0),
+            'waitlisted': int(waitlisted or 0),
+            'fill_rate': _rate(int(confirmed or 0), int(capacity or 0)),
+        }
+        for location_id, name, runs, confirmed, capacity, waitlisted in rows
+    ]
+
+
+def _no_show_rate_by_badge():
+    """No-shows over confirmed spots on completed runs, per badge (None = no badge)"""
+    rows = db.session.query(
+        User.badge,
+        func.count(RunParticipant.id),
+        func.sum(case((RunParticipant.attended == True, 1), else_=0)),
+        func.sum(case((RunParticipant.no_show == True, 1), else_=0)),
+    ).join(RunParticipant, RunParticipant.user_id == User.id).join(
+        Run, RunParticipant.run_id == Run.id
+    ).filter(
+        Run.is_completed == True,
+        RunParticipant.status == 'confirmed'
+    ).group_by(User.badge).order_by(User.badge).all()
+    return [
+        {
+            'badge': badge,
+            'confirmed': confirmed,
+            'attended': int(attended or 0),
+            'no_shows': int(no_shows or 0),
+            'no_show_rate': _rate(int(no_shows or 0), confirmed),
+        }
+        for badge, confirmed, attended, no_shows in rows
+    ]
+
+
+def compute_analytics():
+    """Run the analytics queries (uncached)"""
+    return {
+        'attendance_by_month': _attendance_by_month(),
+        'fill_rate_by_location': _fill_rate_by_location(),
+        'no_show_rate_by_badge': _no_show_rate_by_badge(),
+        'computed_at': datetime.utcnow().isoformat(),
+    }
+
+
+def get_analytics(refresh=False):
+    """
+    Cached analytics for the current data generation
+
+    Args:
+        refresh: Recompute even if the cached result is still valid
+
+    Returns:
+        Tuple of (analytics dict, whether it was served from cache)
+    """
+    generation = _generation
+    with _cache_lock:
+        fresh = (
+            _cache['analytics'] is not None
+            and _cache['generation'] == generation
+            and time.monotonic() - _cache['computed_at'] < ANALYTICS_CACHE_TTL
+        )
+        if fresh and not refresh:
+            return _cache['analytics'], True
+
+    analytics = compute_analytics()
+    with _cache_lock:
+        _cache.update(generation=generation, computed_at=time.monotonic(), analytics=analytics)
+    return analytics, False
@@ -6,8 +6,15 @@ import logging
 import resend
 import threading
 import time
+import math
+import random
+import atexit
+from collections import deque
+from contextlib import nullcontext
 from datetime import datetime
-from queue import Queue
+from utils.metrics import Counter, Gauge, Histogram
+from utils import email_templates
+from utils.email_queue import PersistentEmailQueue, DEFAULT_QUEUE_PATH
 
 # Initialize Resend client
 resend_api_key = os.getenv('RESEND_API_KEY')
@@ -28,9 +35,45 @@ FRONTEND_URL = os.getenv('FRONTEND_URL', 'https://zachsruns.vercel.app')
 logger = logging.getLogger(__name__)
 
 # Email queue for local development (threading)
-_email_queue = Queue()
+# Jobs persist in a SQLite file so reloads and crashes don't drop pending emails;
+# the file is opened lazily so production (QStash, read-only filesystem) never touches it
+EMAIL_QUEUE_PATH = os.getenv('EMAIL_QUEUE_PATH', DEFAULT_QUEUE_PATH)
+EMAIL_QUEUE_MAX_PENDING = int(os.getenv('EMAIL_QUEUE_MAX_PENDING', '10000'))
+EMAIL_QUEUE_BUFFER_SIZE = 20  # Jobs leased into memory at a time
+EMAIL_QUEUE_DRAIN_SECONDS = 10  # Max time spent sending leased jobs on shutdown
+EMAIL_QUEUE_LEASE_SECONDS = 300  # Leased jobs not acked by then (worker crashed) are handed out again
+_email_queue = None
 _email_worker_thread = None
 _email_worker_lock = threading.Lock()
+_email_worker_stop = threading.Event()
+
+# Retry configuration for rate-limited (429) and transient (5xx) send failures
+# Jobs are re-enqueued with jittered exponential backoff instead of sleeping,
+# and moved to the email_dead_letters table once retries are exhausted
+EMAIL_MAX_RETRIES = int(os.getenv('EMAIL_MAX_RETRIES', '5'))
+EMAIL_RETRY_BASE_SECONDS = 2
+EMAIL_RETRY_MAX_SECONDS = 300
+
+# Outcomes of _send_email_direct
+EMAIL_SENT = 'sent'
+EMAIL_RETRY_SCHEDULED = 'retry_scheduled'
+EMAIL_DEAD_LETTERED = 'dead_lettered'
+EMAIL_SKIPPED = 'skipped'  # Sending disabled (no RESEND_API_KEY) - logged, not a failure
+EMAIL_NOT_SENT = 'not_sent'  # Failed and nothing recorded it - the caller must keep the job
+
+# Recipients rendered and enqueued per chunk during fan-out (run created, announcements)
+EMAIL_FANOUT_CHUNK_SIZE = 500
+
+# Pipeline metrics (exposed in Prometheus format via /api/admin/metrics)
+EMAILS_ENQUEUED = Counter('email_enqueued_total', 'Emails enqueued for delivery, by notification type')
+EMAILS_SENT = Counter('email_sent_total', 'Emails accepted by the provider')
+EMAIL_SEND_FAILURES = Counter('email_send_failures_total', 'Provider calls that raised an error')
+EMAIL_RATE_LIMITED = Counter('email_rate_limited_total', 'Provider calls rejected with 429 rate limit')
+EMAIL_RETRIES = Counter('email_retries_total', 'Email jobs re-enqueued with backoff')
+EMAIL_DEAD_LETTERS = Counter('email_dead_letters_total', 'Email jobs moved to dead letters')
+EMAIL_RENDER_SECONDS = Histogram('email_template_render_seconds', 'Email template render time, by template')
+EMAIL_SEND_SECONDS = Histogram('email_provider_send_seconds', 'Provider (Resend) API call latency')
+EMAIL_QUEUE_DEPTH = Gauge('email_local_queue_depth', 'Emails waiting in the local worker queue', lambda: _email_queue.qsize() if _email_queue else 0)
 
 # QStash configuration for production
 QSTASH_TOKEN = os.getenv('QSTASH_TOKEN')
@@ -97,110 +140,353 @@ def _filter_active_recipients(recipients):
     return [user for user in recipients if getattr(user, 'is_active', True)]
 
 
-def _send_email_direct(to: str, subject: str, html_content: str, text_content: str = None, retry_on_429: bool = True):
+def _iter_recipient_chunks(recipients, chunk_size=EMAIL_FANOUT_CHUNK_SIZE):
+    """
+    Split recipients into lists of at most chunk_size
+    
+    Accepts a list or a streaming iterator (see utils.recipients), so fan-out
+    emails never hold the full recipient set in memory.
+    """
+    chunk = []
+    for recipient in recipients:
+        chunk.append(recipient)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _is_rate_limit_error(error):
+    """Check whether a send failure is a 429 rate limit"""
+    if str(getattr(error, 'code', '')) == '429':
+        return True
+    error_str = str(error).lower()
+    return '429' in error_str or 'rate limit' in error_str or 'too many requests' in error_str
+
+
+def _is_retryable_error(error):
+    """Check whether a send failure is a 429 rate limit or a transient 5xx error"""
+    return _is_rate_limit_error(error) or str(getattr(error, 'code', '')).startswith('5')
+
+
+def _get_retry_after(error):
+    """Return the Retry-After header (in seconds) from a Resend error, or None"""
+    headers = getattr(error, 'headers', None) or {}
+    for key, value in headers.items():
+        if key.lower() == 'retry-after':
+            try:
+                return max(0, int(math.ceil(float(value))))
+            except (TypeError, ValueError):
+                # HTTP-date form is not used by Resend - fall back to backoff
+                return None
+    return None
+
+
+def _compute_retry_delay(attempt, retry_after=None):
+    """
+    Compute the delay before the next attempt using jittered exponential backoff
+    
+    Args:
+        attempt: Number of attempts already made (0 for the first retry)
+        retry_after: Seconds requested by the provider's Retry-After header (optional)
+    
+    Returns:
+        Delay in whole seconds (never shorter than retry_after)
+    """
+    backoff = min(EMAIL_RETRY_MAX_SECONDS, EMAIL_RETRY_BASE_SECONDS * (2 ** attempt))
+    delay = random.uniform(backoff / 2, backoff)
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return max(1, int(math.ceil(delay)))
+
+
+def _schedule_email_retry(email_data, attempt, retry_after=None, job_id=None):
+    """
+    Re-enqueue a failed email job with backoff instead of blocking the caller
+    
+    Args:
+        email_data: Job payload (to, subject, html_content, text_content)
+        attempt: Number of attempts already made
+        retry_after: Seconds requested by the provider's Retry-After header (optional)
+        job_id: Leased local queue job to reschedule in place (local worker only)
+    
+    Returns:
+        True if the retry was scheduled, False otherwise
+    """
+    delay_seconds = _compute_retry_delay(attempt, retry_after)
+    EMAIL_RETRIES.inc()
+    logger.warning(
+        f"Scheduling retry {attempt + 1}/{EMAIL_MAX_RETRIES} for {email_data['to']} in {delay_seconds}s"
+    )
+    if job_id is not None:
+        # Moving the leased row skips the queue-full wait, which only this worker thread could relieve
+        try:
+            return _get_email_queue().reschedule(job_id, {**email_data, 'attempt': attempt + 1}, delay_seconds)
+        except Exception as e:
+            logger.error(f"Failed to reschedule email job {job_id}: {str(e)}")
+            return False
+    if _should_use_qstash():
+        return _enqueue_email_production(
+            email_data['to'],
+            email_data['subject'],
+            email_data['html_content'],
+            email_data.get('text_content'),
+            delay_seconds=delay_seconds,
+            attempt=attempt + 1
+        )
+    return _enqueue_email_local(
+        email_data['to'],
+        email_data['subject'],
+        email_data['html_content'],
+        email_data.get('text_content'),
+        delay_seconds=delay_seconds,
+        attempt=attempt + 1
+    )
+
+
+def _record_dead_letter(email_data, attempts, error):
+    """Store an email job that could not be delivered so an admin can replay it"""
+    from flask import has_app_context
+    from database import db
+    from models import EmailDeadLetter
+    
+    if not has_app_context():
+        logger.error(f"Dropping undeliverable email to {email_data['to']} (no app context for dead letter): {error}")
+        return False
+    
+    try:
+        dead_letter = EmailDeadLetter(
+            to=email_data['to'],
+            subject=email_data['subject'],
+            html_content=email_data['html_content'],
+            text_content=email_data.get('text_content'),
+            attempts=attempts,
+            last_error=error
+        )
+        db.session.add(dead_letter)
+        db.session.commit()
+        EMAIL_DEAD_LETTERS.inc()
+        logger.error(f"Email to {email_data['to']} moved to dead letters after {attempts} attempt(s): {error}")
+        return True
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Failed to record dead letter for {email_data['to']}: {str(e)}")
+        return False
+
+
+def _send_email_direct(to: str, subject: str, html_content: str, text_content: str = None, handle_failures: bool = True, attempt: int = 0, job_id=None):
     """
-    Send an email directly using Resend (with retry logic for 429 errors)
+    Send an email directly using Resend
+    
+    Rate-limited (429) and transient (5xx) failures are never retried inline:
+    the job is re-enqueued with jittered exponential backoff (honoring
+    Retry-After). Jobs that exhaust EMAIL_MAX_RETRIES, fail permanently, or
+    whose retry could not be scheduled are moved to the dead-letter table.
     
     Args:
         to: Recipient email address
         subject: Email subject
         html_content: HTML email content
         text_content: Plain text email content (optional)
-        retry_on_429: Whether to retry on 429 rate limit errors
+        handle_failures: Whether to schedule retries and dead-letter failures
+        attempt: Number of delivery attempts already made for this job
+        job_id: Leased local queue job being sent (retries reschedule it in place)
     
     Returns:
-        True if sent successfully, False otherwise
+        EMAIL_SENT, EMAIL_RETRY_SCHEDULED, EMAIL_DEAD_LETTERED, EMAIL_SKIPPED (no API key),
+        or EMAIL_NOT_SENT when the failure was neither rescheduled nor recorded
     """
     if not resend_api_key:
         logger.warning(f"Email not sent to {to}: RESEND_API_KEY not configured")
-        return False
+        return EMAIL_SKIPPED
+    
+    params = {
+        "from": f"{EMAIL_FROM_NAME} <{EMAIL_FROM_ADDRESS}>",
+        "to": [to],
+        "subject": subject,
+        "html": html_content,
+    }
+    
+    if text_content:
+        params["text"] = text_content
     
     try:
-        params = {
-            "from": f"{EMAIL_FROM_NAME} <{EMAIL_FROM_ADDRESS}>",
-            "to": [to],
-            "subject": subject,
-            "html": html_content,
-        }
-        
-        if text_content:
-            params["text"] = text_content
-        
-        response = resend.Emails.send(params)
+        with EMAIL_SEND_SECONDS.time():
+            response = resend.Emails.send(params)
+        EMAILS_SENT.inc()
         logger.info(f"Email sent successfully to {to}: {response.get('id', 'unknown')}")
-        return True
+        return EMAIL_SENT
     except Exception as e:
         error_str = str(e)
-        # Check for 429 rate limit error
-        if retry_on_429 and ('429' in error_str or 'rate limit' in error_str.lower() or 'too many requests' in error_str.lower()):
-            logger.warning(f"Rate limit (429) for {to}, retrying after 1 second...")
-            time.sleep(1)
-            # Retry once
-            try:
-                response = resend.Emails.send(params)
-                logger.info(f"Email sent successfully to {to} on retry: {response.get('id', 'unknown')}")
-                return True
-            except Exception as retry_error:
-                logger.error(f"Failed to send email to {to} on retry: {str(retry_error)}")
-                return False
-        else:
+        EMAIL_SEND_FAILURES.inc()
+        if _is_rate_limit_error(e):
+            EMAIL_RATE_LIMITED.inc()
+        if not handle_failures:
             logger.error(f"Failed to send email to {to}: {error_str}")
-            return False
+            return EMAIL_NOT_SENT
+        
+        email_data = {
+            'to': to,
+            'subject': subject,
+            'html_content': html_content,
+            'text_content': text_content
+        }
+        
+        if _is_retryable_error(e) and attempt < EMAIL_MAX_RETRIES:
+            logger.warning(f"Retryable error for {to}: {error_str}")
+            if _schedule_email_retry(email_data, attempt, _get_retry_after(e), job_id=job_id):
+                return EMAIL_RETRY_SCHEDULED
+            error_str = f"{error_str} (retry could not be scheduled)"
+        
+        if _record_dead_letter(email_data, attempt + 1, error_str):
+            return EMAIL_DEAD_LETTERED
+        return EMAIL_NOT_SENT
 
 
-def _email_worker_thread_func():
-    """Background worker thread that processes email queue (local development only)"""
-    from queue import Empty
+def _get_email_queue():
+    """Open the persistent local email queue on first use"""
+    global _email_queue
     
-    while True:
-        try:
-            email_data = _email_queue.get(timeout=1)
-            if email_data is None:  # Shutdown signal
-                break
-            
-            _send_email_direct(
+    with _email_worker_lock:
+        if _email_queue is None:
+            _email_queue = PersistentEmailQueue(EMAIL_QUEUE_PATH, max_pending=EMAIL_QUEUE_MAX_PENDING)
+        return _email_queue
+
+
+def _process_email_job(app, email_queue, job_id, email_data):
+    """
+    Send one leased job, then acknowledge it once it was sent or dead-lettered
+    
+    Retries reschedule the leased row in place. A failure nothing recorded
+    (e.g. the dead letter insert failed) keeps the job and tries it again later,
+    until EMAIL_MAX_RETRIES attempts have been made and it is dropped (logged).
+    """
+    outcome = EMAIL_NOT_SENT
+    try:
+        # App context is needed to record dead letters
+        with app.app_context() if app else nullcontext():
+            outcome = _send_email_direct(
                 to=email_data['to'],
                 subject=email_data['subject'],
                 html_content=email_data['html_content'],
-                text_content=email_data.get('text_content')
+                text_content=email_data.get('text_content'),
+                attempt=email_data.get('attempt', 0),
+                job_id=job_id
             )
+    except Exception as e:
+        # Log unexpected errors but keep worker alive
+        logger.error(f"Email worker error: {str(e)}")
+    
+    if outcome == EMAIL_RETRY_SCHEDULED:
+        return
+    if outcome == EMAIL_NOT_SENT:
+        attempt = email_data.get('attempt', 0)
+        if attempt >= EMAIL_MAX_RETRIES:
+            logger.error(f"Dropping email to {email_data['to']} after {attempt + 1} attempt(s): could not send or dead-letter it")
+            email_queue.ack(job_id)
+            return
+        try:
+            email_queue.reschedule(job_id, {**email_data, 'attempt': attempt + 1}, _compute_retry_delay(attempt))
+        except Exception as e:
+            # The row stays leased and is handed out again once its lease expires
+            logger.error(f"Failed to keep email job {job_id}: {str(e)}")
+        return
+    email_queue.ack(job_id)
+
+
+def _email_worker_thread_func(app=None):
+    """Background worker thread that processes email queue (local development only)"""
+    email_queue = _get_email_queue()
+    buffer = deque()
+    
+    while not _email_worker_stop.is_set():
+        try:
+            if not buffer:
+                buffer.extend(email_queue.lease(EMAIL_QUEUE_BUFFER_SIZE, EMAIL_QUEUE_LEASE_SECONDS))
+                if not buffer:
+                    # Nothing due yet, poll again shortly
+                    _email_worker_stop.wait(1)
+                    continue
             
-            # Rate limit: 1 email per second
-            time.sleep(1)
+            job_id, email_data = buffer.popleft()
+            _process_email_job(app, email_queue, job_id, email_data)
             
-            _email_queue.task_done()
-        except Empty:
-            # Queue timeout, continue waiting for emails
-            continue
+            # Rate limit: 1 email per second
+            _email_worker_stop.wait(1)
         except Exception as e:
-            # Log unexpected errors but keep worker alive
+            # Log unexpected errors (e.g. queue file locked) but keep worker alive
             logger.error(f"Email worker error: {str(e)}")
-            continue
+            _email_worker_stop.wait(1)
+    
+    # Graceful drain: finish leased jobs within the drain window, hand the rest back
+    deadline = time.monotonic() + EMAIL_QUEUE_DRAIN_SECONDS
+    while buffer and time.monotonic() < deadline:
+        job_id, email_data = buffer.popleft()
+        _process_email_job(app, email_queue, job_id, email_data)
+        time.sleep(1)
+    email_queue.release([job_id for job_id, _ in buffer])
+    logger.info(f"Email worker stopped ({email_queue.qsize()} job(s) left on disk)")
+
 
+def _shutdown_email_worker():
+    """Stop the worker on interpreter exit, draining leased jobs first"""
+    if _email_worker_thread is not None and _email_worker_thread.is_alive():
+        _email_worker_stop.set()
+        _email_worker_thread.join(EMAIL_QUEUE_DRAIN_SECONDS + 2)
 
-def _start_email_worker_thread():
+
+atexit.register(_shutdown_email_worker)
+
+
+def _start_email_worker_thread(app=None):
     """Start the email worker thread lazily (local development only)"""
+    from flask import current_app, has_app_context
     global _email_worker_thread
     
     with _email_worker_lock:
         if _email_worker_thread is None or not _email_worker_thread.is_alive():
-            _email_worker_thread = threading.Thread(target=_email_worker_thread_func, daemon=True)
+            if app is None and has_app_context():
+                app = current_app._get_current_object()
+            _email_worker_stop.clear()
+            _email_worker_thread = threading.Thread(target=_email_worker_thread_func, args=(app,), daemon=True)
             _email_worker_thread.start()
             logger.info("Email worker thread started")
 
 
-def _enqueue_email_local(to: str, subject: str, html_content: str, text_content: str = None):
-    """Enqueue email for local development (threading)"""
-    _start_email_worker_thread()
-    _email_queue.put({
+def resume_local_email_queue(app):
+    """
+    Start the local worker at boot if a previous process left emails on disk
+    
+    No-op when emails go through QStash.
+    """
+    if _should_use_qstash():
+        return
+    if _get_email_queue().qsize() > 0:
+        _start_email_worker_thread(app)
+
+
+def _enqueue_email_local(to: str, subject: str, html_content: str, text_content: str = None, delay_seconds: int = 0, attempt: int = 0):
+    """
+    Enqueue email for local development (persistent queue + worker thread)
+    
+    Returns:
+        True if persisted, False if the queue stayed full (backpressure)
+    """
+    email_data = {
         'to': to,
         'subject': subject,
         'html_content': html_content,
-        'text_content': text_content
-    })
+        'text_content': text_content,
+        'attempt': attempt
+    }
+    # Delayed retries become due later on disk, so the worker never sleeps on them
+    queued = _get_email_queue().put(email_data, delay_seconds=delay_seconds)
+    _start_email_worker_thread()
+    return queued
 
 
-def _enqueue_email_production(to: str, subject: str, html_content: str, text_content: str = None, delay_seconds: int = 0):
+def _enqueue_email_production(to: str, subject: str, html_content: str, text_content: str = None, delay_seconds: int = 0, attempt: int = 0):
     """Enqueue email for production (QStash)"""
     if not QSTASH_TOKEN:
         logger.error("QSTASH_TOKEN not configured - cannot enqueue email")
@@ -215,7 +501,8 @@ def _enqueue_email_production(to: str, subject: str, html_content: str, text_con
             'to': to,
             'subject': subject,
             'html_content': html_content,
-            'text_content': text_content
+            'text_content': text_content,
+            'attempt': attempt
         }
         
         worker_url = f"{APP_URL}/api/email-worker"
@@ -260,7 +547,7 @@ def _should_use_qstash():
     return is_production or local_use_qstash
 
 
-def send_email(to: str, subject: str, html_content: str, text_content: str = None, delay_seconds: int = 0):
+def send_email(to: str, subject: str, html_content: str, text_content: str = None, delay_seconds: int = 0, notification_type: str = 'other'):
     """
     Send an email using Resend (queued for rate limiting)
     
@@ -270,20 +557,23 @@ def send_email(to: str, subject: str, html_content: str, text_content: str = Non
         html_content: HTML email content
         text_content: Plain text email content (optional)
         delay_seconds: Delay in seconds before sending (for QStash scheduling)
+        notification_type: Notification type label for metrics (e.g., 'run_created')
     
     Returns:
         True if queued successfully, False otherwise
     """
     if _should_use_qstash():
-        return _enqueue_email_production(to, subject, html_content, text_content, delay_seconds)
+        queued = _enqueue_email_production(to, subject, html_content, text_content, delay_seconds)
     else:
-        _enqueue_email_local(to, subject, html_content, text_content)
-        return True
+        queued = _enqueue_email_local(to, subject, html_content, text_content)
+    if queued:
+        EMAILS_ENQUEUED.inc(notification_type=notification_type)
+    return queued
 
 
 def render_email_template(template_name: str, **kwargs):
     """
-    Render an email template using Flask's render_template
+    Render an email template from the precompiled bundle (no Flask app context needed)
     
     Args:
         template_name: Name of the template file (e.g., 'welcome.html')
@@ -292,17 +582,9 @@ def render_email_template(template_name: str, **kwargs):
     Returns:
         Rendered HTML string
     """
-    from flask import render_template, has_app_context
-    template_path = f'emails/{template_name}'
     try:
-        # Use current app context if available, otherwise create a new app context
-        if has_app_context():
-            return render_template(template_path, **kwargs)
-        else:
-            # Fallback: create app context
-            from app import app
-            with app.app_context():
-                return render_template(template_path, **kwargs)
+        with EMAIL_RENDER_SECONDS.time(template=template_name):
+            return email_templates.render(template_name, **kwargs)
     except Exception as e:
         logger.error(f"Failed to render template {template_name}: {str(e)}")
         raise
@@ -322,7 +604,8 @@ def send_welcome_email(user):
         to=user.email,
         subject="Welcome to Zach's Organized Runs!",
         html_content=html_content,
-        text_content=text_content
+        text_content=text_content,
+        notification_type='welcome'
     )
 
 
@@ -343,7 +626,8 @@ def send_account_verified_email(user):
         to=user.email,
         subject="Your Account Has Been Verified",
         html_content=html_content,
-        text_content=text_content
+        text_content=text_content,
+        notification_type='account_verified'
     )
 
 
@@ -363,7 +647,8 @@ def send_account_inactive_email(user):
         to=user.email,
         subject="Your Account Has Been Marked Inactive",
         html_content=html_content,
-        text_content=text_content
+        text_content=text_content,
+        notification_type='account_inactive'
     )
 
 
@@ -380,7 +665,8 @@ def send_account_active_email(user):
         to=user.email,
         subject="Your Account Has Been Marked Active",
         html_content=html_content,
-        text_content=text_content
+        text_content=text_content,
+        notification_type='account_active'
     )
 
 
@@ -399,7 +685,8 @@ def send_password_reset_email(user, reset_token):
         to=user.email,
         subject="Reset Your Password - Zach's Organized Runs",
         html_content=html_content,
-        text_content=text_content
+        text_content=text_content,
+        notification_type='password_reset'
     )
 
 
@@ -428,7 +715,8 @@ def send_admin_new_user_notification(user, admin_users):
             subject=f"New User Signup: {user.username}",
             html_content=html_content,
             text_content=text_content,
-            delay_seconds=index  # 1 email per second
+            delay_seconds=index,  # 1 email per second
+            notification_type='admin_new_user'
         ):
             success_count += 1
     
@@ -436,54 +724,94 @@ def send_admin_new_user_notification(user, admin_users):
 
 
 def send_run_created_email(run, recipients):
-    """Send email to verified users when a new run is created"""
-    # Filter recipients for local testing
-    recipients = _filter_recipients_for_local(recipients)
-    
-    if not recipients:
-        logger.info("No recipients for run created email after filtering")
-        return 0
+    """
+    Send email to verified users when a new run is created
     
+    recipients may be a list or a streaming iterator of recipient rows; it is
+    consumed in chunks so memory stays flat for large recipient sets.
+    """
     success_count = 0
+    index = 0
     location_name, location_address = _get_location_info(run)
+    text_content = f"New Run Created: {run.title}\n\nDate: {run.date.strftime('%B %d, %Y')}\nTime: {run.start_time.strftime('%I:%M %p')} - {run.end_time.strftime('%I:%M %p')}\nLocation: {location_name}\n\nVisit {FRONTEND_URL} to RSVP."
     
-    verified_recipients = [user for user in recipients if user.is_verified and user.is_active]
+    for chunk in _iter_recipient_chunks(recipients):
+        # Filter recipients for local testing
+        chunk = _filter_recipients_for_local(chunk)
+        verified_recipients = [user for user in chunk if user.is_verified and user.is_active]
+        
+        for user in verified_recipients:
+            html_content = render_email_template(
+                'run_created.html',
+                run=run,
+                user=user,
+                location_name=location_name,
+                location_address=location_address,
+                frontend_url=FRONTEND_URL
+            )
+            
+            if send_email(
+                to=user.email,
+                subject=f"New Run: {run.title}",
+                html_content=html_content,
+                text_content=text_content,
+                delay_seconds=index,  # 1 email per second
+                notification_type='run_created'
+            ):
+                success_count += 1
+            index += 1
     
-    if not verified_recipients:
+    if index == 0:
         logger.info("No verified recipients for run created email")
+    
+    return success_count
+
+
+def send_run_reminder_email(run, recipients, reminder_message):
+    """Send reminder email to confirmed and interested users"""
+    # Filter recipients for local testing
+    recipients = _filter_recipients_for_local(recipients)
+    recipients = _filter_active_recipients(recipients)
+    
+    if not recipients:
+        logger.info("No recipients for run reminder email after filtering")
         return 0
     
-    for index, user in enumerate(verified_recipients):
+    success_count = 0
+    location_name, _ = _get_location_info(run)
+    
+    for index, user in enumerate(recipients):
         html_content = render_email_template(
-            'run_created.html',
+            'run_reminder.html',
             run=run,
             user=user,
+            reminder_message=reminder_message,
             location_name=location_name,
-            location_address=location_address,
             frontend_url=FRONTEND_URL
         )
-        text_content = f"New Run Created: {run.title}\n\nDate: {run.date.strftime('%B %d, %Y')}\nTime: {run.start_time.strftime('%I:%M %p')} - {run.end_time.strftime('%I:%M %p')}\nLocation: {location_name}\n\nVisit {FRONTEND_URL} to RSVP."
+        text_content = f"{reminder_message}\n\nRun: {run.title}\nTime: {run.start_time.strftime('%I:%M %p')} - {run.end_time.strftime('%I:%M %p')}\nLocation: {location_name}\n\nVisit {FRONTEND_URL} for details."
         
         if send_email(
             to=user.email,
-            subject=f"New Run: {run.title}",
+            subject=f"Reminder: {run.title}",
             html_content=html_content,
             text_content=text_content,
-            delay_seconds=index  # 1 email per second
+            delay_seconds=index,  # 1 email per second
+            notification_type='run_reminder'
         ):
             success_count += 1
     
     return success_count
 
 
-def send_run_reminder_email(run, recipients, reminder_message):
-    """Send reminder email to confirmed and interested users"""
+def send_waitlist_promoted_email(run, recipients):
+    """Send email to users promoted from a run's waitlist to confirmed"""
     # Filter recipients for local testing
     recipients = _filter_recipients_for_local(recipients)
     recipients = _filter_active_recipients(recipients)
     
     if not recipients:
-        logger.info("No recipients for run reminder email after filtering")
+        logger.info("No recipients for waitlist promoted email after filtering")
         return 0
     
     success_count = 0
@@ -491,21 +819,21 @@ def send_run_reminder_email(run, recipients, reminder_message):
     
     for index, user in enumerate(recipients):
         html_content = render_email_template(
-            'run_reminder.html',
+            'waitlist_promoted.html',
             run=run,
             user=user,
-            reminder_message=reminder_message,
             location_name=location_name,
             frontend_url=FRONTEND_URL
         )
-        text_content = f"{reminder_message}\n\nRun: {run.title}\nTime: {run.start_time.strftime('%I:%M %p')} - {run.end_time.strftime('%I:%M %p')}\nLocation: {location_name}\n\nVisit {FRONTEND_URL} for details."
+        text_content = f"You're in! A spot opened up and you've been moved off the waitlist.\n\nRun: {run.title}\nDate: {run.date.strftime('%B %d, %Y')}\nTime: {run.start_time.strftime('%I:%M %p')} - {run.end_time.strftime('%I:%M %p')}\nLocation: {location_name}\n\nVisit {FRONTEND_URL} for details."
         
         if send_email(
             to=user.email,
-            subject=f"Reminder: {run.title}",
+            subject=f"You're In: {run.title}",
             html_content=html_content,
             text_content=text_content,
-            delay_seconds=index  # 1 email per second
+            delay_seconds=index,  # 1 email per second
+            notification_type='waitlist_promoted'
         ):
             success_count += 1
     
@@ -542,7 +870,8 @@ def send_run_completed_email(run, attendees):
             subject=f"Run Completed: {run.title}",
             html_content=html_content,
             text_content=text_content,
-            delay_seconds=index  # 1 email per second
+            delay_seconds=index,  # 1 email per second
+            notification_type='run_completed'
         ):
             success_count += 1
     
@@ -577,7 +906,8 @@ def send_run_cancelled_email(run, recipients):
             subject=f"Run Cancelled: {run.title}",
             html_content=html_content,
             text_content=text_content,
-            delay_seconds=index  # 1 email per second
+            delay_seconds=index,  # 1 email per second
+            notification_type='run_cancelled'
         ):
             success_count += 1
     
@@ -659,7 +989,8 @@ def send_run_modified_email(run, recipients, changes):
             subject=f"Run Modified: {run.title}",
             html_content=html_content,
             text_content=text_content,
-            delay_seconds=index  # 1 email per second
+            delay_seconds=index,  # 1 email per second
+            notification_type='run_modified'
         ):
             success_count += 1
     
@@ -667,39 +998,41 @@ def send_run_modified_email(run, recipients, changes):
 
 
 def send_announcement_email(announcement_message, recipients):
-    """Send announcement email to verified users"""
-    # Filter recipients for local testing
-    recipients = _filter_recipients_for_local(recipients)
-    
-    if not recipients:
-        logger.info("No recipients for announcement email after filtering")
-        return 0
+    """
+    Send announcement email to verified users
     
+    recipients may be a list or a streaming iterator of recipient rows; it is
+    consumed in chunks so memory stays flat for large recipient sets.
+    """
     success_count = 0
+    index = 0
+    text_content = f"New Announcement\n\n{announcement_message}\n\nVisit {FRONTEND_URL} to view runs."
     
-    verified_recipients = [user for user in recipients if user.is_verified and user.is_active]
+    for chunk in _iter_recipient_chunks(recipients):
+        # Filter recipients for local testing
+        chunk = _filter_recipients_for_local(chunk)
+        verified_recipients = [user for user in chunk if user.is_verified and user.is_active]
+        
+        for user in verified_recipients:
+            html_content = render_email_template(
+                'announcement.html',
+                user=user,
+                announcement_message=announcement_message,
+                frontend_url=FRONTEND_URL
+            )
+            
+            if send_email(
+                to=user.email,
+                subject="New Announcement",
+                html_content=html_content,
+                text_content=text_content,
+                delay_seconds=index,  # 1 email per second
+                notification_type='announcement'
+            ):
+                success_count += 1
+            index += 1
     
-    if not verified_recipients:
+    if index == 0:
         logger.info("No verified recipients for announcement email")
-        return 0
-    
-    for index, user in enumerate(verified_recipients):
-        html_content = render_email_template(
-            'announcement.html',
-            user=user,
-            announcement_message=announcement_message,
-            frontend_url=FRONTEND_URL
-        )
-        text_content = f"New Announcement\n\n{announcement_message}\n\nVisit {FRONTEND_URL} to view runs."
-        
-        if send_email(
-            to=user.email,
-            subject="New Announcement",
-            html_content=html_content,
-            text_content=text_content,
-            delay_seconds=index  # 1 email per second
-        ):
-            success_count += 1
     
     return success_count
-
@@ -0,0 +1,176 @@
+"""
+Disk-backed email queue for local and self-hosted delivery (no QStash).
+
+Jobs are written to a small SQLite file before the API returns, so a reload
+or crash never drops pending emails. The worker leases a bounded batch of
+due jobs into memory, acknowledges (deletes) each one only after the send
+attempt, and leases left over at shutdown are released back to pending.
+Retries reschedule the leased row in place, so they never wait on the
+backpressure limit whose only consumer is the worker doing the retry.
+Leases expire after lease_seconds, so jobs held by a process that crashed
+are handed out again without stealing leases from other live workers
+sharing the file (at-least-once delivery).
+"""
+import os
+import json
+import sqlite3
+import threading
+import time
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'instance', 'email_queue.db'
+)
+
+# Seconds a leased job stays invisible to other workers before it is handed out again
+DEFAULT_LEASE_SECONDS = 300
+
+# put() trusts its in-memory pending estimate until it reaches this fraction of max_pending,
+# then recounts on disk (the estimate misses jobs added or acked by other processes)
+RECOUNT_FRACTION = 0.9
+
+
+class PersistentEmailQueue:
+    """SQLite-backed FIFO of email jobs with delayed delivery and leases"""
+
+    def __init__(self, path=DEFAULT_QUEUE_PATH, max_pending=10000):
+        self.path = path
+        self.max_pending = max_pending
+        self._space_available = threading.Condition()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS email_jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    payload TEXT NOT NULL,
+                    not_before REAL NOT NULL,
+                    leased_until REAL NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL
+                )
+            ''')
+            # Queue files created before lease expiry had a leased flag instead
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(email_jobs)')}
+            if 'leased_until' not in columns:
+                conn.execute('ALTER TABLE email_jobs ADD COLUMN leased_until REAL NOT NULL DEFAULT 0')
+            conn.execute('CREATE INDEX IF NOT EXISTS ix_email_jobs_ready ON email_jobs (not_before, id)')
+        self._pending = self.qsize()
+
+    @contextmanager
+    def _connect(self):
+        # A short-lived autocommit connection per operation keeps this safe across threads
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def qsize(self):
+        """Number of jobs not yet acknowledged (pending, delayed or leased)"""
+        with self._connect() as conn:
+            return conn.execute('SELECT COUNT(*) FROM email_jobs').fetchone()[0]
+
+    def put(self, email_data, delay_seconds=0, timeout=5.0):
+        """
+        Persist a job, blocking while the queue is full (backpressure)
+
+        Args:
+            email_data: JSON-serializable job payload
+            delay_seconds: Seconds before the job becomes due
+            timeout: Max seconds to wait for space before giving up
+
+        Returns:
+            True if persisted, False if the queue stayed full for the whole timeout
+        """
+        deadline = time.monotonic() + timeout
+        with self._space_available:
+            # COUNT(*) only near the limit, so fan-out enqueues stay O(1)
+            if self._pending >= self.max_pending * RECOUNT_FRACTION:
+                self._pending = self.qsize()
+            while self._pending >= self.max_pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.error(f"Email queue full ({self.max_pending} jobs) - rejecting email to {email_data.get('to')}")
+                    return False
+                self._space_available.wait(min(remaining, 0.5))
+                self._pending = self.qsize()
+            self._pending += 1
+
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    'INSERT INTO email_jobs (payload, not_before, created_at) VALUES (?, ?, ?)',
+                    (json.dumps(email_data), now + max(0, delay_seconds), now)
+                )
+        except Exception:
+            with self._space_available:
+                self._pending -= 1
+            raise
+        return True
+
+    def lease(self, limit, lease_seconds=DEFAULT_LEASE_SECONDS):
+        """
+        Lease up to limit due jobs (oldest first), including jobs whose lease expired
+
+        Args:
+            limit: Max jobs to lease
+            lease_seconds: Seconds before unacknowledged jobs are handed out again
+
+        Returns:
+            [(job_id, email_data), ...]
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                rows = conn.execute(
+                    'SELECT id, payload FROM email_jobs WHERE not_before <= ? AND leased_until <= ? ORDER BY not_before, id LIMIT ?',
+                    (now, now, limit)
+                ).fetchall()
+                if rows:
+                    conn.executemany(
+                        'UPDATE email_jobs SET leased_until = ? WHERE id = ?',
+                        [(now + lease_seconds, row[0]) for row in rows]
+                    )
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+        return [(job_id, json.loads(payload)) for job_id, payload in rows]
+
+    def ack(self, job_id):
+        """Remove a job once its send attempt has finished"""
+        with self._connect() as conn:
+            conn.execute('DELETE FROM email_jobs WHERE id = ?', (job_id,))
+        with self._space_available:
+            self._pending = max(0, self._pending - 1)
+            self._space_available.notify_all()
+
+    def reschedule(self, job_id, email_data, delay_seconds):
+        """
+        Hand a leased job back with a new payload, due after delay_seconds
+
+        Bypasses max_pending: the job already holds its slot in the queue.
+
+        Returns:
+            True if the job was still in the queue and was rescheduled
+        """
+        with self._connect() as conn:
+            updated = conn.execute(
+                'UPDATE email_jobs SET payload = ?, not_before = ?, leased_until = 0 WHERE id = ?',
+                (json.dumps(email_data), time.time() + max(0, delay_seconds), job_id)
+            ).rowcount
+        return updated == 1
+
+    def release(self, job_ids):
+        """Return leased jobs to pending so they are retried later"""
+        if not job_ids:
+            return
+        with self._connect() as conn:
+            conn.executemany('UPDATE email_jobs SET leased_until = 0 WHERE id = ?', [(job_id,) for job_id in job_ids])
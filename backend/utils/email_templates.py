@@ -0,0 +1,107 @@
+"""
+Standalone email template bundle.
+
+All templates/emails/*.html are compiled once at import into a plain Jinja
+environment (no Flask app or app context needed). The simple class rules in
+base.html's <style> block (e.g. `.button`) are inlined into matching
+elements' style attributes while templates load, so rendering does no CSS
+work and clients that strip <style> still get the branded styling.
+"""
+import os
+import re
+import logging
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+logger = logging.getLogger(__name__)
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'templates')
+BASE_TEMPLATE = 'emails/base.html'
+
+_STYLE_BLOCK_RE = re.compile(r'<style[^>]*>(.*?)</style>', re.S | re.I)
+_MEDIA_BLOCK_RE = re.compile(r'@media[^{]*\{(?:[^{}]*\{[^{}]*\})*[^{}]*\}', re.S)
+_CLASS_RULE_RE = re.compile(r'^\s*\.([\w-]+)\s*\{([^}]*)\}', re.M)
+_CLASS_TAG_RE = re.compile(r'<(\w+)([^>]*?)\sclass="([^"]*)"([^>]*)>')
+_STYLE_ATTR_RE = re.compile(r'\sstyle="([^"]*)"')
+
+
+def _parse_class_rules(source):
+    """Return {class_name: 'decl; decl'} for single-class rules outside @media blocks"""
+    rules = {}
+    for css in _STYLE_BLOCK_RE.findall(source):
+        css = _MEDIA_BLOCK_RE.sub('', css)
+        for class_name, body in _CLASS_RULE_RE.findall(css):
+            declarations = [d.strip() for d in body.split(';') if d.strip()]
+            rules[class_name] = '; '.join(declarations)
+    return rules
+
+
+def _inline_css(source, rules):
+    """Prepend matching class rules to each element's style attribute (inline styles still win)"""
+    if not rules:
+        return source
+
+    def replace(match):
+        tag, before, class_attr, after = match.groups()
+        inlined = '; '.join(rules[c] for c in class_attr.split() if c in rules)
+        if not inlined:
+            return match.group(0)
+        attrs = f'{before} class="{class_attr}"{after}'
+        existing = _STYLE_ATTR_RE.search(attrs)
+        if existing:
+            merged = f'{inlined}; {existing.group(1)}'
+            attrs = attrs[:existing.start()] + f' style="{merged}"' + attrs[existing.end():]
+        else:
+            attrs = f'{attrs} style="{inlined}"'
+        return f'<{tag}{attrs}>'
+
+    return _CLASS_TAG_RE.sub(replace, source)
+
+
+class _InlinedCssLoader(FileSystemLoader):
+    """FileSystemLoader that inlines base.html's class rules into every email template"""
+
+    def __init__(self, searchpath):
+        super().__init__(searchpath)
+        base_path = os.path.join(searchpath, BASE_TEMPLATE)
+        with open(base_path, encoding='utf-8') as f:
+            self.class_rules = _parse_class_rules(f.read())
+
+    def get_source(self, environment, template):
+        source, filename, uptodate = super().get_source(environment, template)
+        if template.startswith('emails/'):
+            source = _inline_css(source, self.class_rules)
+        return source, filename, uptodate
+
+
+_environment = Environment(
+    loader=_InlinedCssLoader(TEMPLATES_DIR),
+    autoescape=select_autoescape(['html']),
+    auto_reload=False,
+    cache_size=-1
+)
+
+
+def _precompile_templates():
+    """Compile every email template once so renders never touch the filesystem"""
+    names = _environment.list_templates(filter_func=lambda n: n.startswith('emails/') and n.endswith('.html'))
+    for name in names:
+        _environment.get_template(name)
+    logger.debug(f"Precompiled {len(names)} email templates")
+    return names
+
+
+EMAIL_TEMPLATES = _precompile_templates()
+
+
+def render(template_name, **kwargs):
+    """
+    Render a precompiled email template without a Flask app context
+
+    Args:
+        template_name: Name of the template file (e.g., 'welcome.html')
+        **kwargs: Variables to pass to the template
+
+    Returns:
+        Rendered HTML string
+    """
+    return _environment.get_template(f'emails/{template_name}').render(**kwargs)
@@ -0,0 +1,129 @@
+"""
+Streaming CSV / NDJSON export of runs, participations and user stats.
+
+Each dataset selects plain columns (no ORM objects or relationships) and
+streams them with yield_per, which uses a server-side cursor on Postgres, so
+memory stays constant and the first rows are sent before the query finishes.
+"""
+import csv
+import io
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from database import db
+from models import User, Run, RunParticipant, Location
+
+# Rows fetched per round trip while streaming
+EXPORT_CHUNK_SIZE = 1000
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+def _runs_query():
+    return db.session.query(
+        Run.id.label('run_id'),
+        Run.title,
+        Run.date,
+        Run.start_time,
+        Run.end_time,
+        Location.name.label('location'),
+        Run.capacity,
+        Run.cost,
+        Run.is_variable_cost,
+        Run.total_cost,
+        Run.is_historical,
+        Run.is_completed,
+        Run.completed_at,
+        Run.private_group_id,
+        Run.confirmed_count,
+        Run.interested_count,
+        Run.out_count,
+        Run.waitlisted_count,
+        Run.attended_count,
+    ).join(Location, Run.location_id == Location.id).order_by(Run.date, Run.start_time, Run.id)
+
+
+def _participations_query():
+    return db.session.query(
+        RunParticipant.run_id,
+        Run.title.label('run_title'),
+        Run.date.label('run_date'),
+        RunParticipant.user_id,
+        User.username,
+        RunParticipant.status,
+        RunParticipant.attended,
+        RunParticipant.no_show,
+        RunParticipant.waitlisted_at,
+        RunParticipant.updated_at,
+    ).join(Run, RunParticipant.run_id == Run.id).join(
+        User, RunParticipant.user_id == User.id
+    ).order_by(Run.date, RunParticipant.run_id, RunParticipant.id)
+
+
+def _users_query():
+    return db.session.query(
+        User.id.label('user_id'),
+        User.username,
+        User.first_name,
+        User.last_name,
+        User.badge,
+        User.is_verified,
+        User.is_active,
+        User.runs_attended_count,
+        User.no_shows_count,
+        User.created_at,
+    ).order_by(User.username)
+
+
+# Dataset name -> query builder
+EXPORT_DATASETS = {
+    'runs': _runs_query,
+    'participations': _participations_query,
+    'users': _users_query,
+}
+
+
+def _export_value(value):
+    """Convert a column value to a JSON/CSV friendly scalar"""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def stream_export(dataset, export_format, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Stream a dataset as CSV (header row first) or NDJSON (one object per line)
+
+    Args:
+        dataset: Key of EXPORT_DATASETS
+        export_format: Key of EXPORT_FORMATS
+        chunk_size: Rows fetched per round trip (yield_per)
+
+    Yields:
+        Encoded text chunks, one per row (plus the CSV header)
+    """
+    query = EXPORT_DATASETS[dataset]().execution_options(yield_per=chunk_size)
+    columns = [column['name'] for column in query.column_descriptions]
+
+    if export_format == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        def csv_line(values):
+            writer.writerow(values)
+            line = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            return line
+
+        yield csv_line(columns)
+        for row in query:
+            yield csv_line([_export_value(value) for value in row])
+    else:
+        for row in query:
+            yield json.dumps({column: _export_value(value) for column, value in zip(columns, row)}) + '\n'
@@ -0,0 +1,142 @@
+"""
+Lightweight in-process metrics (counters, gauges, histograms) rendered in
+Prometheus text exposition format. Values are per process: on Vercel each
+warm function instance reports its own numbers.
+"""
+import threading
+import time
+from contextlib import contextmanager
+
+# Default latency buckets in seconds (render and provider calls)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_registry = []
+_registry_lock = threading.Lock()
+
+
+def _format_labels(labels):
+    """Format a label dict as {key="value",...} (empty string if no labels)"""
+    if not labels:
+        return ''
+    parts = []
+    for key, value in sorted(labels.items()):
+        escaped = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        parts.append(f'{key}="{escaped}"')
+    return '{' + ','.join(parts) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    metric_type = 'untyped'
+
+    def __init__(self, name, description):
+        self.name = name
+        self.description = description
+        self._lock = threading.Lock()
+        with _registry_lock:
+            _registry.append(self)
+
+    def _header(self):
+        return [f'# HELP {self.name} {self.description}', f'# TYPE {self.name} {self.metric_type}']
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter, optionally split by labels"""
+    metric_type = 'counter'
+
+    def __init__(self, name, description):
+        super().__init__(name, description)
+        self._values = {}
+
+    def inc(self, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self):
+        lines = self._header()
+        with self._lock:
+            values = dict(self._values)
+        if not values:
+            values = {(): 0}
+        for key, value in sorted(values.items()):
+            lines.append(f'{self.name}{_format_labels(dict(key))} {_format_value(value)}')
+        return lines
+
+
+class Gauge(_Metric):
+    """Point-in-time value, read from a callback when metrics are rendered"""
+    metric_type = 'gauge'
+
+    def __init__(self, name, description, callback):
+        super().__init__(name, description)
+        self._callback = callback
+
+    def render(self):
+        lines = self._header()
+        try:
+            value = self._callback()
+        except Exception:
+            value = 0
+        lines.append(f'{self.name} {_format_value(value)}')
+        return lines
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram, optionally split by labels"""
+    metric_type = 'histogram'
+
+    def __init__(self, name, description, buckets=DEFAULT_BUCKETS):
+        super().__init__(name, description)
+        self._buckets = tuple(sorted(buckets)) + (float('inf'),)
+        self._series = {}
+
+    def observe(self, value, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = {'counts': [0] * len(self._buckets), 'sum': 0.0, 'count': 0}
+                self._series[key] = series
+            for index, bound in enumerate(self._buckets):
+                if value <= bound:
+                    series['counts'][index] += 1
+            series['sum'] += value
+            series['count'] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Context manager that observes the elapsed wall-clock time in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def render(self):
+        lines = self._header()
+        with self._lock:
+            series_items = [(key, dict(series, counts=list(series['counts']))) for key, series in self._series.items()]
+        for key, series in sorted(series_items):
+            labels = dict(key)
+            for bound, count in zip(self._buckets, series['counts']):
+                bucket_labels = dict(labels, le=_format_value(bound))
+                lines.append(f'{self.name}_bucket{_format_labels(bucket_labels)} {count}')
+            lines.append(f'{self.name}_sum{_format_labels(labels)} {_format_value(series["sum"])}')
+            lines.append(f'{self.name}_count{_format_labels(labels)} {series["count"]}')
+        return lines
+
+
+def render_metrics():
+    """Render every registered metric in Prometheus text exposition format"""
+    with _registry_lock:
+        metrics = list(_registry)
+    lines = []
+    for metric in metrics:
+        lines.extend(metric.render())
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,41 @@
+"""
+Recipient resolution for email fan-out.
+
+Selects only the columns the email pipeline reads and streams them with
+yield_per, so large recipient sets never materialize full User objects.
+"""
+from database import db
+from models import User
+
+# Columns read by email filters and templates (user.email, user.first_name or user.username, ...)
+RECIPIENT_COLUMNS = (
+    User.id,
+    User.username,
+    User.email,
+    User.first_name,
+    User.is_verified,
+    User.is_active,
+)
+
+# Rows fetched per round trip while streaming recipients
+RECIPIENT_CHUNK_SIZE = 500
+
+
+def stream_verified_recipients(*criteria, chunk_size=RECIPIENT_CHUNK_SIZE):
+    """
+    Stream verified, active users as lightweight rows (not ORM objects)
+
+    Args:
+        *criteria: Extra SQLAlchemy filter expressions on User
+        chunk_size: Rows fetched per round trip (yield_per)
+
+    Yields:
+        Row objects with id, username, email, first_name, is_verified, is_active
+    """
+    query = db.session.query(*RECIPIENT_COLUMNS).filter(
+        User.is_verified == True,
+        User.is_active == True,
+        *criteria
+    ).execution_options(yield_per=chunk_size)
+    for row in query:
+        yield row
@@ -0,0 +1,323 @@
+"""
+Atomic RSVP writes and the denormalized participant counters on runs.
+
+Every RSVP change for a run first takes a write lock on that run's row (a
+no-op UPDATE: a row lock on Postgres, the database write lock on SQLite),
+so the capacity check and the insert/update that follows cannot interleave
+with another request for the same run. The lock is released by the
+caller's commit or rollback.
+
+A confirmation that finds the run full (or finds people already queued)
+joins the run's waitlist instead of failing. Whenever a confirmed slot
+frees up, promote_waitlist moves the head of the queue (oldest
+waitlisted_at) to confirmed in the same transaction.
+
+Run.confirmed_count / interested_count / out_count / attended_count are
+adjusted in the same transaction as the participant write; code that
+changes participants in bulk calls rebuild_run_counters instead.
+"""
+from datetime import datetime, timedelta
+from sqlalchemy import update, select, func
+from database import db
+from models import Run, RunParticipant, User
+
+# Statuses a user (or admin) can ask for; 'waitlisted' is only ever assigned
+RSVP_STATUSES = ('confirmed', 'interested', 'out')
+WAITLISTED = 'waitlisted'
+
+# Run counter column for each RSVP status
+STATUS_COUNTERS = {
+    'confirmed': 'confirmed_count',
+    'interested': 'interested_count',
+    'out': 'out_count',
+    WAITLISTED: 'waitlisted_count',
+}
+
+COUNTER_COLUMNS = ('confirmed_count', 'interested_count', 'out_count', 'waitlisted_count', 'attended_count')
+
+
+def lock_run(run_id):
+    """Serialize writers for a run until the current transaction ends"""
+    db.session.execute(
+        update(Run).where(Run.id == run_id).values(id=Run.id),
+        execution_options={'synchronize_session': False}
+    )
+
+
+def adjust_run_counters(run, deltas, capacity_guard=False):
+    """
+    Atomically add deltas to a run's counter columns
+
+    Args:
+        run: Run whose counters change
+        deltas: {counter_column: delta}, e.g. {'confirmed_count': 1, 'out_count': -1}
+        capacity_guard: Only apply if confirmed_count is still below capacity and
+            nobody is waitlisted ahead
+
+    Returns:
+        True if the counters were updated, False if the capacity guard failed
+    """
+    values = {column: getattr(Run, column) + delta for column, delta in deltas.items() if delta}
+    if not values:
+        return True
+    stmt = update(Run).where(Run.id == run.id).values(**values)
+    if capacity_guard and run.capacity:
+        stmt = stmt.where(Run.confirmed_count < run.capacity, Run.waitlisted_count == 0)
+    result = db.session.execute(stmt, execution_options={'synchronize_session': False})
+    # Reload counters from the database on next access
+    db.session.expire(run, list(COUNTER_COLUMNS))
+    return result.rowcount == 1
+
+
+def rebuild_run_counters(run_ids=None):
+    """
+    Recompute counter columns from run_participants in one UPDATE
+
+    Args:
+        run_ids: Runs to repair (all runs when None)
+
+    Returns:
+        Number of runs updated (caller commits)
+    """
+    def participant_count(*criteria):
+        return select(func.count(RunParticipant.id)).where(
+            RunParticipant.run_id == Run.id, *criteria
+        ).scalar_subquery()
+
+    stmt = update(Run).values(
+        confirmed_count=participant_count(RunParticipant.status == 'confirmed'),
+        interested_count=participant_count(RunParticipant.status == 'interested'),
+        out_count=participant_count(RunParticipant.status == 'out'),
+        waitlisted_count=participant_count(RunParticipant.status == WAITLISTED),
+        attended_count=participant_count(RunParticipant.attended == True)
+    )
+    if run_ids is not None:
+        if not run_ids:
+            return 0
+        stmt = stmt.where(Run.id.in_(run_ids))
+    result = db.session.execute(stmt, execution_options={'synchronize_session': False})
+    db.session.expire_all()
+    return result.rowcount
+
+
+def _status_deltas(old_status, new_status):
+    """Counter deltas for moving one participant from old_status to new_status"""
+    deltas = {}
+    if old_status != new_status:
+        if old_status in STATUS_COUNTERS:
+            deltas[STATUS_COUNTERS[old_status]] = -1
+        if new_status in STATUS_COUNTERS:
+            deltas[STATUS_COUNTERS[new_status]] = 1
+    return deltas
+
+
+def apply_rsvp(run, user_id, status):
+    """
+    Set (or remove, when status is None) a user's RSVP, holding run.capacity exactly
+
+    A confirmation that would exceed capacity is stored as 'waitlisted'
+    instead; a user already on the waitlist keeps their place when they
+    confirm again.
+
+    Args:
+        run: Run being RSVP'd to
+        user_id: ID of the user whose RSVP changes
+        status: 'confirmed', 'interested', 'out', or None to remove the RSVP
+
+    Returns:
+        The status actually stored ('waitlisted' when the run was full), or None
+        if the RSVP was removed. The caller commits.
+    """
+    lock_run(run.id)
+
+    participant = RunParticipant.query.filter_by(run_id=run.id, user_id=user_id).first()
+    old_status = participant.status if participant else None
+
+    if status == 'confirmed' and old_status == WAITLISTED:
+        # Already queued - confirming again must not lose their place
+        return WAITLISTED
+
+    # Only a new confirmation can take a slot - staying confirmed never fails
+    taking_slot = status == 'confirmed' and old_status != 'confirmed'
+    if not adjust_run_counters(run, _status_deltas(old_status, status), capacity_guard=taking_slot):
+        status = WAITLISTED
+        adjust_run_counters(run, _status_deltas(old_status, status))
+
+    if status is None:
+        if participant:
+            db.session.delete(participant)
+        return None
+
+    waitlisted_at = datetime.utcnow() if status == WAITLISTED else None
+    if participant:
+        participant.status = status
+        participant.waitlisted_at = waitlisted_at
+        participant.updated_at = datetime.utcnow()
+    else:
+        db.session.add(RunParticipant(run_id=run.id, user_id=user_id, status=status, waitlisted_at=waitlisted_at))
+    return status
+
+
+def promote_waitlist(run):
+    """
+    Fill any free confirmed slots from the head of the run's waitlist
+
+    Must run in the same transaction as the change that freed the slot(s)
+    (the run's lock is taken here if the caller does not already hold it).
+
+    Args:
+        run: Run whose waitlist should be promoted
+
+    Returns:
+        List of User objects promoted to confirmed (notify them after commit)
+    """
+    lock_run(run.id)
+    db.session.flush()
+    db.session.refresh(run, list(COUNTER_COLUMNS) + ['capacity'])
+
+    if run.is_completed or not run.waitlisted_count:
+        return []
+    if run.capacity:
+        free_slots = run.capacity - run.confirmed_count
+        if free_slots <= 0:
+            return []
+    else:
+        # Capacity removed - everyone queued gets in
+        free_slots = run.waitlisted_count
+
+    head = RunParticipant.query.filter_by(run_id=run.id, status=WAITLISTED).order_by(
+        RunParticipant.waitlisted_at, RunParticipant.id
+    ).limit(free_slots).all()
+    if not head:
+        return []
+
+    now = datetime.utcnow()
+    for participant in head:
+        participant.status = 'confirmed'
+        participant.waitlisted_at = None
+        participant.updated_at = now
+    adjust_run_counters(run, {'confirmed_count': len(head), 'waitlisted_count': -len(head)})
+
+    user_ids = [p.user_id for p in head]
+    return User.query.filter(User.id.in_(user_ids)).all()
+
+
+def apply_rsvp_changes(run, changes):
+    """
+    Apply many RSVP changes to one run under a single lock and capacity check
+
+    Changes that free or keep slots are applied first, then the existing
+    waitlist is promoted into any freed slots, then new confirmations take
+    whatever capacity is left in request order (the rest are waitlisted).
+
+    Args:
+        run: Run being edited
+        changes: List of (user_id, status) pairs, status None to remove the RSVP;
+            each user_id at most once
+
+    Returns:
+        (stored, promoted): {user_id: stored status or None} and the list of
+        previously waitlisted User objects promoted to confirmed. The caller commits.
+    """
+    lock_run(run.id)
+    db.session.refresh(run, list(COUNTER_COLUMNS) + ['capacity'])
+
+    user_ids = [user_id for user_id, _ in changes]
+    existing = {
+        p.user_id: p for p in RunParticipant.query.filter(
+            RunParticipant.run_id == run.id,
+            RunParticipant.user_id.in_(user_ids)
+        ).all()
+    } if user_ids else {}
+
+    now = datetime.utcnow()
+    stored = {}
+    deltas = {}
+    new_confirms = []
+
+    for user_id, status in changes:
+        participant = existing.get(user_id)
+        old_status = participant.status if participant else None
+
+        if status == 'confirmed' and old_status == WAITLISTED:
+            stored[user_id] = WAITLISTED  # keep their place in the queue
+            continue
+        if status == 'confirmed' and old_status != 'confirmed':
+            new_confirms.append(user_id)
+            continue
+
+        for column, delta in _status_deltas(old_status, status).items():
+            deltas[column] = deltas.get(column, 0) + delta
+        stored[user_id] = status
+        if status is None:
+            if participant:
+                db.session.delete(participant)
+        elif participant:
+            if participant.status != status:
+                participant.status = status
+                participant.waitlisted_at = None
+                participant.updated_at = now
+        else:
+            db.session.add(RunParticipant(run_id=run.id, user_id=user_id, status=status))
+
+    adjust_run_counters(run, deltas)
+    promoted = promote_waitlist(run)
+    for user in promoted:
+        if user.id in stored:
+            stored[user.id] = 'confirmed'
+
+    # One capacity check for every new confirmation
+    if run.capacity:
+        free_slots = max(0, run.capacity - run.confirmed_count)
+    else:
+        free_slots = len(new_confirms)
+
+    deltas = {}
+    for position, user_id in enumerate(new_confirms):
+        participant = existing.get(user_id)
+        status = 'confirmed' if position < free_slots else WAITLISTED
+        # Microsecond offsets keep the waitlist in request order
+        waitlisted_at = now + timedelta(microseconds=position) if status == WAITLISTED else None
+        for column, delta in _status_deltas(participant.status if participant else None, status).items():
+            deltas[column] = deltas.get(column, 0) + delta
+        stored[user_id] = status
+        if participant:
+            participant.status = status
+            participant.waitlisted_at = waitlisted_at
+            participant.updated_at = now
+        else:
+            db.session.add(RunParticipant(run_id=run.id, user_id=user_id, status=status, waitlisted_at=waitlisted_at))
+    adjust_run_counters(run, deltas)
+
+    return stored, promoted
+
+
+def run_summary(run):
+    """
+    Counts and cost for a run, read from the run row (never the participant roster)
+
+    Returns:
+        Dict with run_id, capacity, participant_counts and cost
+    """
+    return {
+        'run_id': run.id,
+        'capacity': int(run.capacity) if run.capacity else None,
+        'participant_counts': run.participant_counts(),
+        'cost': run.cost_per_person()
+    }
+
+
+def rsvp_summary(run, status):
+    """
+    Small RSVP response body: the new status plus the run's counts and cost
+
+    Args:
+        run: Run that was RSVP'd to
+        status: Status now stored for the user (None if removed)
+
+    Returns:
+        run_summary(run) plus status
+    """
+    summary = run_summary(run)
+    summary['status'] = status
+    return summary
@@ -1,3 +1,8 @@
+from flask import request
+from database import db
+from models import PrivateGroupMember
+
+
 def get_optional_user_from_request(request, verify_token_fn):
     """Return the authenticated User if a valid Bearer token is present, else None."""
     auth_header = request.headers.get('Authorization')
@@ -15,3 +20,32 @@ def user_can_view_runs(user):
     if user is None:
         return False
     return user.is_verified or user.is_admin
+
+
+def get_viewer_group_ids(user):
+    """
+    IDs of the private groups the user belongs to, loaded once per request
+
+    Every private-run / private-group access check in a request shares this
+    set (cached on the request, like request.current_user), so each check is
+    a set lookup instead of a query.
+    """
+    if user is None:
+        return frozenset()
+    cache = getattr(request, 'viewer_group_ids', None)
+    if cache is None:
+        cache = request.viewer_group_ids = {}
+    if user.id not in cache:
+        cache[user.id] = frozenset(
+            group_id for (group_id,) in db.session.query(PrivateGroupMember.group_id).filter(
+                PrivateGroupMember.user_id == user.id
+            )
+        )
+    return cache[user.id]
+
+
+def user_can_view_group(user, group_id):
+    """True when the user is an admin or a member of the private group."""
+    if user is None:
+        return False
+    return user.is_admin or group_id in get_viewer_group_ids(user)
@@ -0,0 +1,240 @@
+"""
+Bulk import of historical (completed) runs.
+
+Usernames and locations are resolved from maps prefetched once per import,
+runs and participants are written with bulk INSERTs, and every
+IMPORT_CHUNK_SIZE runs the chunk's counters and user stats are refreshed and
+committed. Rows come either from a JSON body ({"runs": [...]}) or streamed
+NDJSON (one run object per line), so large histories never have to be held
+in memory. Bad rows are skipped and reported; they never abort the import.
+
+An import is not atomic: chunks committed before a failed chunk stay stored.
+If a chunk's write fails it is rolled back, the import stops, and the
+summary reports how many runs were stored plus the failing row range, so
+the client can resume from that row instead of re-uploading everything.
+
+In dry_run mode rows go through exactly the same validation against the
+prefetched lookups but nothing is written, and every error is reported.
+"""
+import json
+import uuid
+import logging
+from datetime import datetime
+from sqlalchemy import insert
+from database import db
+from models import User, Run, RunParticipant, Location
+from utils.rsvp import rebuild_run_counters
+from utils.stats import recalculate_user_stats
+
+logger = logging.getLogger(__name__)
+
+# Runs per bulk INSERT / commit
+IMPORT_CHUNK_SIZE = 500
+
+# Cap on error messages returned to the client (error_count is always exact; dry runs report all)
+IMPORT_MAX_REPORTED_ERRORS = 100
+
+# Participant statuses in import payloads; confirmed historical participants attended
+IMPORT_STATUSES = ('confirmed', 'interested', 'out')
+
+
+def iter_json_rows(runs):
+    """Yield (row_number, run_data, error) for a parsed {"runs": [...]} body"""
+    for row_number, run_data in enumerate(runs, start=1):
+        yield row_number, run_data, None
+
+
+def iter_ndjson_rows(stream):
+    """
+    Yield (row_number, run_data, error) for each non-blank line of an NDJSON stream
+
+    Args:
+        stream: Binary file-like object (e.g. request.stream), read line by line
+    """
+    for row_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield row_number, json.loads(line), None
+        except ValueError as e:
+            yield row_number, None, f"Invalid JSON: {str(e)}"
+
+
+class RunImporter:
+    """Accumulates import rows and writes them in chunked bulk INSERTs"""
+
+    def __init__(self, created_by, chunk_size=IMPORT_CHUNK_SIZE, dry_run=False):
+        self.created_by = created_by
+        self.chunk_size = chunk_size
+        self.dry_run = dry_run
+        self.imported_count = 0
+        self.error_count = 0
+        self.errors = []
+        # Set when a chunk write fails: {'first_row', 'last_row', 'error'}; nothing after it is written
+        self.failure = None
+        self._committed_count = 0
+        self._runs = []
+        self._participants = []
+        self._chunk_rows = None
+
+        # One query each instead of one per participant / run
+        self.user_ids_by_username = {
+            username.lower(): user_id for user_id, username in db.session.query(User.id, User.username)
+        }
+        locations = Location.query.all()
+        self.location_ids = {location.id for location in locations}
+        self.location_ids_by_name = {location.name: location.id for location in locations}
+        self.location_ids_by_address = {location.address: location.id for location in locations}
+        self.default_location_id = locations[0].id if locations else None
+
+    def _error(self, row_number, run_data, message):
+        self.error_count += 1
+        if self.dry_run or len(self.errors) < IMPORT_MAX_REPORTED_ERRORS:
+            title = run_data.get('title', 'Unknown') if isinstance(run_data, dict) else 'Unknown'
+            self.errors.append(f"Row {row_number} ('{title}'): {message}")
+
+    def _resolve_location(self, run_data):
+        """location_id if given, else match by name then address, else the first location"""
+        location_id = run_data.get('location_id')
+        if location_id:
+            return location_id if location_id in self.location_ids else None
+        return (
+            self.location_ids_by_name.get(run_data.get('location') or '')
+            or self.location_ids_by_address.get(run_data.get('address') or '')
+            or self.default_location_id
+        )
+
+    def add(self, row_number, run_data, error=None):
+        """Validate one row and queue it; writes a chunk once chunk_size runs are queued"""
+        if self.failure:
+            return
+        if error:
+            self._error(row_number, run_data, error)
+            return
+        if not isinstance(run_data, dict):
+            self._error(row_number, run_data, 'Run must be a JSON object')
+            return
+
+        try:
+            run_date = datetime.strptime(run_data['date'], '%Y-%m-%d').date()
+            start_time = datetime.strptime(run_data['start_time'], '%H:%M').time()
+            end_time = datetime.strptime(run_data['end_time'], '%H:%M').time()
+            title = run_data['title']
+        except KeyError as e:
+            self._error(row_number, run_data, f"Missing field {str(e)}")
+            return
+        except (TypeError, ValueError) as e:
+            self._error(row_number, run_data, f"Invalid date or time format: {str(e)}")
+            return
+
+        for field in ('capacity', 'cost'):
+            value = run_data.get(field)
+            if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+                self._error(row_number, run_data, f"{field} must be a number")
+                return
+
+        location_id = self._resolve_location(run_data)
+        if not location_id:
+            self._error(row_number, run_data, 'No matching location available')
+            return
+
+        run_id = str(uuid.uuid4())
+        self._chunk_rows = (self._chunk_rows[0] if self._chunk_rows else row_number, row_number)
+        self._runs.append({
+            'id': run_id,
+            'title': title,
+            'date': run_date,
+            'start_time': start_time,
+            'end_time': end_time,
+            'location_id': location_id,
+            'description': run_data.get('description'),
+            'capacity': run_data.get('capacity'),
+            'cost': run_data.get('cost'),
+            'created_by': self.created_by,
+            'is_historical': True,
+            'is_completed': True,
+            'completed_at': datetime.combine(run_date, datetime.min.time()),
+            'completed_by': self.created_by
+        })
+
+        # First status listed wins if a username appears twice (one RSVP per user per run)
+        seen_user_ids = set()
+        unknown = []
+        participants_data = run_data.get('participants') or {}
+        for status in IMPORT_STATUSES:
+            for username in participants_data.get(status, []):
+                user_id = self.user_ids_by_username.get(str(username).lower())
+                if not user_id:
+                    unknown.append(str(username))
+                    continue
+                if user_id in seen_user_ids:
+                    continue
+                seen_user_ids.add(user_id)
+                self._participants.append({
+                    'run_id': run_id,
+                    'user_id': user_id,
+                    'status': status,
+                    'attended': status == 'confirmed',
+                    'no_show': False
+                })
+        if unknown:
+            # The run is still imported; only the unmatched names are skipped
+            self._error(row_number, run_data, f"Unknown usernames skipped: {', '.join(unknown)}")
+
+        self.imported_count += 1
+        if len(self._runs) >= self.chunk_size:
+            self._write_chunk()
+
+    def _write_chunk(self):
+        """Bulk insert queued runs and participants, refresh their counters and stats, commit"""
+        if not self._runs:
+            return
+        if self.dry_run:
+            # Validated only - drop the chunk so memory stays bounded
+            self._runs = []
+            self._participants = []
+            self._chunk_rows = None
+            return
+        run_ids = [run['id'] for run in self._runs]
+        user_ids = {participant['user_id'] for participant in self._participants}
+
+        try:
+            db.session.execute(insert(Run), self._runs)
+            if self._participants:
+                db.session.execute(insert(RunParticipant), self._participants)
+            rebuild_run_counters(run_ids)
+            recalculate_user_stats(user_ids)
+            db.session.commit()
+            self._committed_count = self.imported_count
+            logger.info(f"Imported chunk of {len(run_ids)} runs ({self.imported_count} total)")
+        except Exception as e:
+            db.session.rollback()
+            first_row, last_row = self._chunk_rows
+            self.failure = {'first_row': first_row, 'last_row': last_row, 'error': str(e)}
+            # Only earlier chunks are stored
+            self.imported_count = self._committed_count
+            logger.error(f"Import stopped: chunk for rows {first_row}-{last_row} failed: {str(e)}")
+
+        self._runs = []
+        self._participants = []
+        self._chunk_rows = None
+
+    def finish(self):
+        """
+        Write any remaining rows and return the import summary
+
+        imported_count is what would be imported in a dry run, and what was
+        actually stored if a chunk failed ('failure' is then included).
+        """
+        if not self.failure:
+            self._write_chunk()
+        summary = {
+            'imported_count': self.imported_count,
+            'error_count': self.error_count,
+            'errors': self.errors,
+            'dry_run': self.dry_run
+        }
+        if self.failure:
+            summary['failure'] = self.failure
+        return summary
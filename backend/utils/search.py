@@ -0,0 +1,208 @@
+"""
+Full-text search over runs, users and private groups.
+
+SQLite (local) uses FTS5 external-content tables kept current by triggers on
+the source tables; Postgres (production) uses GIN expression indexes over
+to_tsvector, which Postgres maintains on every write. Both are queried with
+per-word prefix matching, so "tue jan" finds "Tuesday January 6th Run".
+If neither is available (SQLite built without FTS5) search falls back to LIKE.
+
+User autocomplete (suggest_users) is separate: it matches name prefixes against
+the lower(username/first_name/last_name) indexes declared on User.
+"""
+import re
+import logging
+from sqlalchemy import select, func, literal_column, or_, and_, exists, table
+from database import db
+from models import User, Run, RunParticipant, PrivateGroup, PrivateGroupMember
+
+logger = logging.getLogger(__name__)
+
+# Default / maximum results per entity type
+SEARCH_DEFAULT_LIMIT = 10
+SEARCH_MAX_LIMIT = 50
+
+# Default / maximum users returned by suggest_users
+SUGGEST_DEFAULT_LIMIT = 10
+SUGGEST_MAX_LIMIT = 50
+
+# Entity type -> (source table, indexed columns, columns returned)
+SEARCH_ENTITIES = {
+    'runs': (Run, ('title', 'description'), (Run.id, Run.title, Run.date, Run.start_time, Run.is_completed)),
+    'users': (User, ('username', 'first_name', 'last_name'), (User.id, User.username, User.first_name, User.last_name, User.badge, User.is_verified, User.is_active)),
+    'groups': (PrivateGroup, ('name',), (PrivateGroup.id, PrivateGroup.name)),
+}
+
+# Set by setup_search_index(): 'fts5', 'tsvector' or 'like'
+_search_backend = 'like'
+
+
+def _fts_table(model):
+    return f'{model.__tablename__}_fts'
+
+
+def _tsvector_sql(model, columns):
+    """Indexed expression; queries must use exactly the same text to hit the GIN index"""
+    document = " || ' ' || ".join(f"coalesce({model.__tablename__}.{column}, '')" for column in columns)
+    return f"to_tsvector('simple', {document})"
+
+
+def _setup_sqlite(model, columns):
+    name = _fts_table(model)
+    source = model.__tablename__
+    column_list = ', '.join(columns)
+    new_values = ', '.join(f'new.{column}' for column in columns)
+    old_values = ', '.join(f'old.{column}' for column in columns)
+    statements = [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {name} USING fts5({column_list}, content='{source}', "
+        f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_ai AFTER INSERT ON {source} BEGIN "
+        f"INSERT INTO {name}(rowid, {column_list}) VALUES (new.rowid, {new_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_ad AFTER DELETE ON {source} BEGIN "
+        f"INSERT INTO {name}({name}, rowid, {column_list}) VALUES ('delete', old.rowid, {old_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_au AFTER UPDATE OF {column_list} ON {source} BEGIN "
+        f"INSERT INTO {name}({name}, rowid, {column_list}) VALUES ('delete', old.rowid, {old_values}); "
+        f"INSERT INTO {name}(rowid, {column_list}) VALUES (new.rowid, {new_values}); END",
+    ]
+    for statement in statements:
+        db.session.execute(db.text(statement))
+
+    # The triggers keep the index current, so only rebuild when it is out of step with the source:
+    # newly created (rows written before it existed) or rowids renumbered by a VACUUM after deletes.
+    # The _docsize shadow table holds one row per indexed document.
+    indexed = db.session.execute(db.text(f"SELECT COUNT(*), MAX(id) FROM {name}_docsize")).one()
+    current = db.session.execute(db.text(f"SELECT COUNT(*), MAX(rowid) FROM {source}")).one()
+    if tuple(indexed) != tuple(current):
+        logger.info(f"Rebuilding search index {name}")
+        db.session.execute(db.text(f"INSERT INTO {name}({name}) VALUES ('rebuild')"))
+
+
+def _setup_postgres(model, columns):
+    db.session.execute(db.text(
+        f"CREATE INDEX IF NOT EXISTS ix_{model.__tablename__}_search "
+        f"ON {model.__tablename__} USING GIN ({_tsvector_sql(model, columns)})"
+    ))
+
+
+def setup_search_index():
+    """Create the search index for the current database (idempotent; called from init_db)"""
+    global _search_backend
+    dialect = db.engine.dialect.name
+    try:
+        for model, columns, _ in SEARCH_ENTITIES.values():
+            if dialect == 'sqlite':
+                _setup_sqlite(model, columns)
+            elif dialect == 'postgresql':
+                _setup_postgres(model, columns)
+        db.session.commit()
+        _search_backend = {'sqlite': 'fts5', 'postgresql': 'tsvector'}.get(dialect, 'like')
+    except Exception as e:
+        db.session.rollback()
+        _search_backend = 'like'
+        logger.error(f"Full-text search index unavailable, falling back to LIKE: {str(e)}")
+
+
+def _search_terms(query):
+    return re.findall(r'\w+', query.lower())
+
+
+def _search_entity(entity, terms, limit):
+    model, columns, result_columns = SEARCH_ENTITIES[entity]
+    stmt = select(*result_columns)
+
+    if _search_backend == 'fts5':
+        fts = table(_fts_table(model))
+        fts_name = literal_column(_fts_table(model))
+        match = ' '.join(f'"{term}"*' for term in terms)
+        stmt = stmt.join(fts, literal_column(f'{_fts_table(model)}.rowid') == literal_column(f'{model.__tablename__}.rowid')).where(
+            fts_name.op('MATCH')(match)
+        ).order_by(func.bm25(fts_name))
+    elif _search_backend == 'tsvector':
+        vector = literal_column(_tsvector_sql(model, columns))
+        tsquery = func.to_tsquery('simple', ' & '.join(f'{term}:*' for term in terms))
+        stmt = stmt.where(vector.op('@@')(tsquery)).order_by(func.ts_rank(vector, tsquery).desc())
+    else:
+        for term in terms:
+            stmt = stmt.where(or_(*(getattr(model, column).ilike(f'%{term}%') for column in columns)))
+
+    return [dict(row._mapping) for row in db.session.execute(stmt.limit(limit))]
+
+
+def _serialize(value):
+    return value.isoformat() if hasattr(value, 'isoformat') else value
+
+
+def search(query, entities=None, limit=SEARCH_DEFAULT_LIMIT):
+    """
+    Search runs, users and/or groups by word prefixes
+
+    Args:
+        query: Free text; every word must match (as a prefix) somewhere in the entity
+        entities: Subset of SEARCH_ENTITIES keys (all when None)
+        limit: Max results per entity type
+
+    Returns:
+        Dict of entity type -> list of lightweight result dicts, best match first
+    """
+    terms = _search_terms(query)
+    results = {}
+    for entity in entities or SEARCH_ENTITIES:
+        if not terms:
+            results[entity] = []
+            continue
+        results[entity] = [
+            {key: _serialize(value) for key, value in row.items()}
+            for row in _search_entity(entity, terms, limit)
+        ]
+    return results
+
+
+def _prefix_match(expression, prefix):
+    """Index-friendly 'expression starts with prefix' for the current dialect"""
+    if db.engine.dialect.name == 'sqlite':
+        # SQLite only uses expression indexes for range comparisons, never for LIKE
+        return and_(expression >= prefix, expression < prefix + '\U0010ffff')
+    escaped = prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return expression.like(f'{escaped}%', escape='\\')
+
+
+def suggest_users(query, limit=SUGGEST_DEFAULT_LIMIT, exclude_run_id=None, exclude_group_id=None,
+                  badge=None, include_inactive=False):
+    """
+    Top users whose username, first name or last name starts with each word of the query
+
+    Args:
+        query: Free text; every word must prefix-match one of the name columns
+        limit: Max users returned
+        exclude_run_id: Skip users who already have an RSVP for this run
+        exclude_group_id: Skip users who are already members of this group
+        badge: Only users with this badge (e.g. 'regular' for the referrer picker)
+        include_inactive: Include inactive (but still verified) users
+
+    Returns:
+        List of {id, username, first_name, last_name, badge} dicts
+    """
+    terms = query.lower().split()
+    if not terms:
+        return []
+
+    name_columns = (func.lower(User.username), func.lower(User.first_name), func.lower(User.last_name))
+    criteria = [User.is_verified == True]
+    if not include_inactive:
+        criteria.append(User.is_active == True)
+    for term in terms:
+        criteria.append(or_(*(_prefix_match(column, term) for column in name_columns)))
+    if badge:
+        criteria.append(User.badge == badge)
+    if exclude_run_id:
+        criteria.append(~exists().where(RunParticipant.run_id == exclude_run_id, RunParticipant.user_id == User.id))
+    if exclude_group_id:
+        criteria.append(~exists().where(PrivateGroupMember.group_id == exclude_group_id, PrivateGroupMember.user_id == User.id))
+
+    rows = db.session.execute(
+        select(User.id, User.username, User.first_name, User.last_name, User.badge)
+        .where(*criteria)
+        .order_by(User.first_name, User.last_name, User.username)
+        .limit(limit)
+    )
+    return [dict(row._mapping) for row in rows]
@@ -0,0 +1,58 @@
+"""
+Set-based user stats (runs_attended_count / no_shows_count).
+
+Stats are always recounted from run_participants, never incremented, so a
+counter that drifted is repaired the next time it is touched. Completing a
+run recounts the users flagged on it and a full rebuild recounts everyone,
+each with a single UPDATE of correlated COUNT subqueries; nothing here loops
+over users or commits - the caller owns the transaction.
+"""
+from sqlalchemy import update, select, func, or_, Select
+from database import db
+from models import User, RunParticipant
+
+
+def apply_run_completion_stats(run_id):
+    """
+    Recompute stats for everyone marked attended or no-show on a just-completed run
+
+    Args:
+        run_id: ID of the run being completed (participant flags already written)
+
+    Returns:
+        Number of users updated
+    """
+    flagged_user_ids = select(RunParticipant.user_id).where(
+        RunParticipant.run_id == run_id,
+        or_(RunParticipant.attended == True, RunParticipant.no_show == True)
+    )
+    return recalculate_user_stats(flagged_user_ids)
+
+
+def recalculate_user_stats(user_ids=None):
+    """
+    Recompute runs_attended_count and no_shows_count from run_participants in one UPDATE
+
+    Args:
+        user_ids: IDs of the users to recompute, or a SELECT of user IDs (all users when None)
+
+    Returns:
+        Number of users updated
+    """
+    def participation_count(flag):
+        return select(func.count(RunParticipant.id)).where(
+            RunParticipant.user_id == User.id,
+            flag == True
+        ).scalar_subquery()
+
+    stmt = update(User).values(
+        runs_attended_count=participation_count(RunParticipant.attended),
+        no_shows_count=participation_count(RunParticipant.no_show)
+    )
+    if user_ids is not None:
+        if not isinstance(user_ids, Select) and not user_ids:
+            return 0
+        stmt = stmt.where(User.id.in_(user_ids))
+    result = db.session.execute(stmt, execution_options={'synchronize_session': False})
+    db.session.expire_all()
+    return result.rowcount
@@ -0,0 +1,37 @@
+"""
+Set-based admin bulk actions on users.
+
+Each action is one UPDATE ... WHERE id IN (...) rather than loading and
+mutating User objects one at a time, so bulk badge (and any future bulk
+verify/activate) endpoints cost one statement regardless of selection size.
+"""
+from sqlalchemy import update
+from database import db
+from models import User
+
+# Columns bulk actions may set; anything else (is_admin, password_hash, ...) needs the per-user endpoints
+BULK_USER_FIELDS = frozenset({'badge', 'referred_by', 'is_verified', 'is_active'})
+
+
+def bulk_update_users(user_ids, **values):
+    """
+    Set the same column values on many users in a single UPDATE
+
+    Args:
+        user_ids: IDs of the users to update (unknown IDs are ignored)
+        **values: Column values to set, limited to BULK_USER_FIELDS
+
+    Returns:
+        Number of users updated (caller commits)
+    """
+    invalid = set(values) - BULK_USER_FIELDS
+    if invalid:
+        raise ValueError(f"Fields not allowed in bulk user updates: {sorted(invalid)}")
+    user_ids = set(user_ids)
+    if not user_ids or not values:
+        return 0
+    result = db.session.execute(
+        update(User).where(User.id.in_(user_ids)).values(**values),
+        execution_options={'synchronize_session': False}
+    )
+    return result.rowcount
@@ -0,0 +1,187 @@
+'use client';
+
+import { useEffect, useState } from 'react';
+import { useAuth } from '@/context/AuthContext';
+import { useRouter } from 'next/navigation';
+import { adminApi } from '@/lib/api';
+import { AdminAnalytics } from '@/types';
+import Link from 'next/link';
+
+const BADGE_LABELS: Record<string, string> = {
+  vip: 'VIP',
+  regular: 'Regular',
+  rookie: 'Rookie',
+  plus_one: '+1',
+};
+
+function formatRate(rate: number | null) {
+  return rate === null ? '—' : `${Math.round(rate * 100)}%`;
+}
+
+export default function AnalyticsPage() {
+  const { user, loading: authLoading } = useAuth();
+  const router = useRouter();
+  const [analytics, setAnalytics] = useState<AdminAnalytics | null>(null);
+  const [loading, setLoading] = useState(true);
+  const [error, setError] = useState('');
+
+  useEffect(() => {
+    if (!authLoading && (!user || !user.is_admin)) {
+      router.push('/');
+      return;
+    }
+
+    if (user && user.is_admin) {
+      fetchAnalytics();
+    }
+  }, [user, authLoading, router]);
+
+  const fetchAnalytics = async (refresh = false) => {
+    try {
+      setLoading(true);
+      setError('');
+      const data = await adminApi.getAnalytics(refresh);
+      setAnalytics(data.analytics);
+    } catch (err: any) {
+      setError(err.message || 'Failed to load analytics');
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  if (authLoading || (loading && !analytics)) {
+    return (
+      <div className="container mx-auto px-4 py-12">
+        <div className="text-center">
+          <p className="text-gray-600">Loading...</p>
+        </div>
+      </div>
+    );
+  }
+
+  return (
+    <div className="container mx-auto px-4 py-6 md:py-12">
+      <div className="max-w-4xl mx-auto">
+        <div className="mb-4">
+          <Link
+            href="/admin/dashboard"
+            className="text-basketball-orange hover:underline"
+          >
+            ← Back to Dashboard
+          </Link>
+        </div>
+
+        <div className="flex items-center justify-between mb-4 md:mb-8">
+          <h1 className="text-2xl md:text-3xl font-bold text-basketball-black">
+            Analytics
+          </h1>
+          <button
+            onClick={() => fetchAnalytics(true)}
+            disabled={loading}
+            className="px-3 py-1 text-sm border border-basketball-orange text-basketball-orange rounded-md hover:bg-orange-50 transition-colors disabled:opacity-50 disabled:cursor-not-allowed"
+          >
+            {loading ? 'Refreshing...' : 'Refresh'}
+          </button>
+        </div>
+
+        {error && (
+          <div className="bg-red-100 border border-red-400 text-red-700 px-4 py-3 rounded mb-4">
+            {error}
+          </div>
+        )}
+
+        {analytics && (
+          <div className="space-y-6">
+            <div className="bg-white rounded-lg shadow-md p-4 md:p-6 overflow-x-auto">
+              <h2 className="text-lg md:text-xl font-bold text-basketball-black mb-4">
+                Attendance per Month
+              </h2>
+              <table className="w-full text-sm text-left">
+                <thead className="text-gray-600 border-b">
+                  <tr>
+                    <th className="py-2">Month</th>
+                    <th className="py-2">Runs</th>
+                    <th className="py-2">Attendance</th>
+                    <th className="py-2">Avg / Run</th>
+                    <th className="py-2">Unique Players</th>
+                  </tr>
+                </thead>
+                <tbody>
+                  {analytics.attendance_by_month.map((row) => (
+                    <tr key={row.month} className="border-b last:border-0">
+                      <td className="py-2">{row.month}</td>
+                      <td className="py-2">{row.runs}</td>
+                      <td className="py-2">{row.attendance}</td>
+                      <td className="py-2">{row.average_attendance ?? '—'}</td>
+                      <td className="py-2">{row.unique_players}</td>
+                    </tr>
+                  ))}
+                </tbody>
+              </table>
+            </div>
+
+            <div className="bg-white rounded-lg shadow-md p-4 md:p-6 overflow-x-auto">
+              <h2 className="text-lg md:text-xl font-bold text-basketball-black mb-4">
+                Fill Rate per Location (Upcoming Runs)
+              </h2>
+              <table className="w-full text-sm text-left">
+                <thead className="text-gray-600 border-b">
+                  <tr>
+                    <th className="py-2">Location</th>
+                    <th className="py-2">Runs</th>
+                    <th className="py-2">Confirmed / Capacity</th>
+                    <th className="py-2">Waitlisted</th>
+                    <th className="py-2">Fill Rate</th>
+                  </tr>
+                </thead>
+                <tbody>
+                  {analytics.fill_rate_by_location.map((row) => (
+                    <tr key={row.location_id} className="border-b last:border-0">
+                      <td className="py-2">{row.location}</td>
+                      <td className="py-2">{row.runs}</td>
+                      <td className="py-2">{row.confirmed} / {row.capacity}</td>
+                      <td className="py-2">{row.waitlisted}</td>
+                      <td className="py-2">{formatRate(row.fill_rate)}</td>
+                    </tr>
+                  ))}
+                </tbody>
+              </table>
+            </div>
+
+            <div className="bg-white rounded-lg shadow-md p-4 md:p-6 overflow-x-auto">
+              <h2 className="text-lg md:text-xl font-bold text-basketball-black mb-4">
+                No-Show Rate by Badge
+              </h2>
+              <table className="w-full text-sm text-left">
+                <thead className="text-gray-600 border-b">
+                  <tr>
+                    <th className="py-2">Badge</th>
+                    <th className="py-2">Confirmed</th>
+                    <th className="py-2">Attended</th>
+                    <th className="py-2">No-Shows</th>
+                    <th className="py-2">No-Show Rate</th>
+                  </tr>
+                </thead>
+                <tbody>
+                  {analytics.no_show_rate_by_badge.map((row) => (
+                    <tr key={row.badge ?? 'none'} className="border-b last:border-0">
+                      <td className="py-2">{row.badge ? BADGE_LABELS[row.badge] || row.badge : 'No badge'}</td>
+                      <td className="py-2">{row.confirmed}</td>
+                      <td className="py-2">{row.attended}</td>
+                      <td className="py-2">{row.no_shows}</td>
+                      <td className="py-2">{formatRate(row.no_show_rate)}</td>
+                    </tr>
+                  ))}
+                </tbody>
+              </table>
+            </div>
+
+            <p className="text-xs text-gray-500">
+              Computed at {new Date(analytics.computed_at + 'Z').toLocaleString()}
+            </p>
+          </div>
+        )}
+      </div>
+    </div>
+  );
+}
@@ -1,13 +1,23 @@
 'use client';
 
-import { useEffect } from 'react';
+import { useEffect, useState } from 'react';
 import { useAuth } from '@/context/AuthContext';
 import { useRouter } from 'next/navigation';
+import { adminApi } from '@/lib/api';
+import AdminSearch from '@/components/AdminSearch';
 import Link from 'next/link';
 
+const EXPORT_DATASETS = [
+  { key: 'runs', label: 'Runs' },
+  { key: 'participations', label: 'Attendance' },
+  { key: 'users', label: 'User Stats' },
+] as const;
+
 export default function AdminDashboard() {
   const { user, loading } = useAuth();
   const router = useRouter();
+  const [exporting, setExporting] = useState<string | null>(null);
+  const [exportError, setExportError] = useState('');
 
   useEffect(() => {
     if (!loading && (!user || !user.is_admin)) {
@@ -25,6 +35,24 @@ export default function AdminDashboard() {
     );
   }
 
+  const handleExport = async (dataset: (typeof EXPORT_DATASETS)[number]['key']) => {
+    setExporting(dataset);
+    setExportError('');
+    try {
+      const blob = await adminApi.exportData(dataset, 'csv');
+      const url = URL.createObjectURL(blob);
+      const link = document.createElement('a');
+      link.href = url;
+      link.download = `${dataset}-${new Date().toISOString().slice(0, 10)}.csv`;
+      link.click();
+      URL.revokeObjectURL(url);
+    } catch (err: any) {
+      setExportError(err.message || 'Export failed');
+    } finally {
+      setExporting(null);
+    }
+  };
+
   return (
     <div className="container mx-auto px-4 py-6 md:py-12">
       <div className="max-w-4xl mx-auto">
@@ -32,6 +60,8 @@ export default function AdminDashboard() {
           Admin Dashboard
         </h1>
 
+        <AdminSearch />
+
         <div className="grid grid-cols-1 md:grid-cols-2 gap-4 md:gap-6">
           <Link
             href="/admin/create-run"
@@ -105,6 +135,30 @@ export default function AdminDashboard() {
             </p>
           </Link>
 
+          <Link
+            href="/admin/analytics"
+            className="bg-white rounded-lg shadow-md p-4 md:p-6 hover:shadow-lg transition-shadow"
+          >
+            <h2 className="text-lg md:text-xl font-bold text-basketball-black mb-2">
+              Analytics
+            </h2>
+            <p className="text-gray-600 text-sm md:text-base">
+              Attendance, fill rates and no-show rates
+            </p>
+          </Link>
+
+          <Link
+            href="/admin/email-dead-letters"
+            className="bg-white rounded-lg shadow-md p-4 md:p-6 hover:shadow-lg transition-shadow"
+          >
+            <h2 className="text-lg md:text-xl font-bold text-basketball-black mb-2">
+              Email Dead Letters
+            </h2>
+            <p className="text-gray-600 text-sm md:text-base">
+              Inspect and replay emails that failed to send
+            </p>
+          </Link>
+
           <Link
             href="/admin/verify-users"
             className="bg-white rounded-lg shadow-md p-4 md:p-6 hover:shadow-lg transition-shadow"
@@ -116,6 +170,30 @@ export default function AdminDashboard() {
               Manage user verification and active status
             </p>
           </Link>
+
+          <div className="bg-white rounded-lg shadow-md p-4 md:p-6">
+            <h2 className="text-lg md:text-xl font-bold text-basketball-black mb-2">
+              Export Data
+            </h2>
+            <p className="text-gray-600 text-sm md:text-base mb-3">
+              Download runs, attendance or user stats as CSV
+            </p>
+            <div className="flex flex-wrap gap-2">
+              {EXPORT_DATASETS.map(({ key, label }) => (
+                <button
+                  key={key}
+                  onClick={() => handleExport(key)}
+                  disabled={exporting !== null}
+                  className="px-3 py-1 text-sm border border-basketball-orange text-basketball-orange rounded-md hover:bg-orange-50 transition-colors disabled:opacity-50 disabled:cursor-not-allowed"
+                >
+                  {exporting === key ? 'Exporting...' : label}
+                </button>
+              ))}
+            </div>
+            {exportError && (
+              <p className="text-red-600 text-sm mt-2">{exportError}</p>
+            )}
+          </div>
         </div>
       </div>
     </div>
@@ -0,0 +1,146 @@
+'use client';
+
+import { useEffect, useState } from 'react';
+import { useAuth } from '@/context/AuthContext';
+import { useRouter } from 'next/navigation';
+import { adminApi } from '@/lib/api';
+import { EmailDeadLetter } from '@/types';
+import Link from 'next/link';
+
+function formatTimestamp(timestamp: string) {
+  return new Date(timestamp + 'Z').toLocaleString();
+}
+
+export default function EmailDeadLettersPage() {
+  const { user, loading: authLoading } = useAuth();
+  const router = useRouter();
+  const [deadLetters, setDeadLetters] = useState<EmailDeadLetter[]>([]);
+  const [includeReplayed, setIncludeReplayed] = useState(false);
+  const [loading, setLoading] = useState(true);
+  const [error, setError] = useState('');
+  const [replayingId, setReplayingId] = useState<string | null>(null);
+
+  useEffect(() => {
+    if (!authLoading && (!user || !user.is_admin)) {
+      router.push('/');
+      return;
+    }
+
+    if (user && user.is_admin) {
+      fetchDeadLetters();
+    }
+  }, [user, authLoading, router, includeReplayed]);
+
+  const fetchDeadLetters = async () => {
+    try {
+      setLoading(true);
+      setError('');
+      const data = await adminApi.getEmailDeadLetters(includeReplayed);
+      setDeadLetters(data.dead_letters);
+    } catch (err: any) {
+      setError(err.message || 'Failed to load dead letters');
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  const handleReplay = async (deadLetterId: string) => {
+    setReplayingId(deadLetterId);
+    try {
+      const data = await adminApi.replayEmailDeadLetter(deadLetterId);
+      setDeadLetters((prev) =>
+        includeReplayed
+          ? prev.map((d) => (d.id === deadLetterId ? data.dead_letter : d))
+          : prev.filter((d) => d.id !== deadLetterId)
+      );
+    } catch (err: any) {
+      alert(err.message || 'Failed to replay email');
+    } finally {
+      setReplayingId(null);
+    }
+  };
+
+  if (authLoading) {
+    return (
+      <div className="container mx-auto px-4 py-12">
+        <div className="text-center">
+          <p className="text-gray-600">Loading...</p>
+        </div>
+      </div>
+    );
+  }
+
+  return (
+    <div className="container mx-auto px-4 py-6 md:py-12">
+      <div className="max-w-4xl mx-auto">
+        <div className="mb-4">
+          <Link
+            href="/admin/dashboard"
+            className="text-basketball-orange hover:underline"
+          >
+            ← Back to Dashboard
+          </Link>
+        </div>
+
+        <div className="flex items-center justify-between mb-4 md:mb-8">
+          <h1 className="text-2xl md:text-3xl font-bold text-basketball-black">
+            Email Dead Letters
+          </h1>
+          <label className="flex items-center gap-2 text-sm text-gray-700">
+            <input
+              type="checkbox"
+              checked={includeReplayed}
+              onChange={(e) => setIncludeReplayed(e.target.checked)}
+            />
+            Show replayed
+          </label>
+        </div>
+
+        {error && (
+          <div className="bg-red-100 border border-red-400 text-red-700 px-4 py-3 rounded mb-4">
+            {error}
+          </div>
+        )}
+
+        {loading ? (
+          <p className="text-gray-600 text-center">Loading...</p>
+        ) : deadLetters.length === 0 ? (
+          <div className="bg-white rounded-lg shadow-md p-4 md:p-6">
+            <p className="text-gray-600">No undelivered emails</p>
+          </div>
+        ) : (
+          <div className="space-y-3">
+            {deadLetters.map((deadLetter) => (
+              <div key={deadLetter.id} className="bg-white rounded-lg shadow-md p-4 md:p-6">
+                <div className="flex flex-col md:flex-row md:items-start md:justify-between gap-3">
+                  <div className="min-w-0">
+                    <h2 className="font-semibold text-basketball-black break-words">
+                      {deadLetter.subject}
+                    </h2>
+                    <p className="text-sm text-gray-600 break-all">To: {deadLetter.to}</p>
+                    <p className="text-xs text-gray-500 mt-1">
+                      Failed {formatTimestamp(deadLetter.created_at)} after {deadLetter.attempts} attempt(s)
+                      {deadLetter.replayed_at ? ` · replayed ${formatTimestamp(deadLetter.replayed_at)}` : ''}
+                    </p>
+                    {deadLetter.last_error && (
+                      <p className="text-xs text-red-600 mt-2 break-words">{deadLetter.last_error}</p>
+                    )}
+                  </div>
+                  {!deadLetter.replayed_at && (
+                    <button
+                      onClick={() => handleReplay(deadLetter.id)}
+                      disabled={replayingId !== null}
+                      className="shrink-0 px-3 py-1 text-sm border border-basketball-orange text-basketball-orange rounded-md hover:bg-orange-50 transition-colors disabled:opacity-50 disabled:cursor-not-allowed"
+                    >
+                      {replayingId === deadLetter.id ? 'Replaying...' : 'Replay'}
+                    </button>
+                  )}
+                </div>
+              </div>
+            ))}
+          </div>
+        )}
+      </div>
+    </div>
+  );
+}
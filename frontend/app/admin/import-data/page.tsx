@@ -13,6 +13,7 @@ export default function ImportDataPage() {
   const [error, setError] = useState('');
   const [success, setSuccess] = useState('');
   const [submitting, setSubmitting] = useState(false);
+  const [validating, setValidating] = useState(false);
 
   if (authLoading) {
     return (
@@ -46,6 +47,42 @@ export default function ImportDataPage() {
     reader.readAsText(file);
   };
 
+  const sendImport = async (dryRun: boolean) => {
+    // A single JSON document is sent as-is; anything else is treated as NDJSON (one run per line)
+    let data: any = null;
+    try {
+      data = JSON.parse(jsonData);
+    } catch {
+      data = null;
+    }
+    return data && data.runs
+      ? adminApi.importRuns(data, dryRun)
+      : adminApi.importRunsNdjson(jsonData, dryRun);
+  };
+
+  const handleValidate = async () => {
+    setError('');
+    setSuccess('');
+    setValidating(true);
+
+    try {
+      const result = await sendImport(true);
+      if (result.error_count > 0) {
+        setError(
+          `${result.imported_count} runs would be imported. Errors (${result.error_count}): ${result.errors.join(', ')}`
+        );
+      } else {
+        setSuccess(`Validation passed: ${result.imported_count} runs ready to import.`);
+      }
+    } catch (err: any) {
+      setError(
+        err.message || 'Failed to validate data. Please check the JSON format.'
+      );
+    } finally {
+      setValidating(false);
+    }
+  };
+
   const handleSubmit = async (e: React.FormEvent) => {
     e.preventDefault();
     setError('');
@@ -53,12 +90,11 @@ export default function ImportDataPage() {
     setSubmitting(true);
 
     try {
-      const data = JSON.parse(jsonData);
-      const result = await adminApi.importRuns(data);
+      const result = await sendImport(false);
       setSuccess(
         `Successfully imported ${result.imported_count} runs. ${
-          result.errors.length > 0
-            ? `Errors: ${result.errors.join(', ')}`
+          result.error_count > 0
+            ? `Errors (${result.error_count}): ${result.errors.join(', ')}`
             : ''
         }`
       );
@@ -90,7 +126,7 @@ export default function ImportDataPage() {
           </h1>
 
           <p className="text-gray-600 mb-6">
-            Upload a JSON file with historical runs data. Format:
+            Upload a JSON file with historical runs data, or an NDJSON file (one run object per line) for large imports. Format:
           </p>
 
           <pre className="bg-gray-100 p-4 rounded mb-6 text-sm overflow-x-auto">
@@ -138,7 +174,7 @@ export default function ImportDataPage() {
               <input
                 id="file"
                 type="file"
-                accept=".json"
+                accept=".json,.ndjson,.jsonl"
                 onChange={handleFileUpload}
                 className="w-full px-4 py-2 border border-gray-300 rounded-md focus:ring-2 focus:ring-basketball-orange focus:border-transparent"
               />
@@ -161,13 +197,23 @@ export default function ImportDataPage() {
               />
             </div>
 
-            <button
-              type="submit"
-              disabled={submitting || !jsonData}
-              className="w-full bg-basketball-orange text-white py-2 px-4 rounded-md hover:bg-orange-600 transition-colors disabled:opacity-50 disabled:cursor-not-allowed"
-            >
-              {submitting ? 'Importing...' : 'Import Data'}
-            </button>
+            <div className="flex gap-4">
+              <button
+                type="button"
+                onClick={handleValidate}
+                disabled={validating || submitting || !jsonData}
+                className="w-full border border-basketball-orange text-basketball-orange py-2 px-4 rounded-md hover:bg-orange-50 transition-colors disabled:opacity-50 disabled:cursor-not-allowed"
+              >
+                {validating ? 'Validating...' : 'Validate Only'}
+              </button>
+              <button
+                type="submit"
+                disabled={submitting || validating || !jsonData}
+                className="w-full bg-basketball-orange text-white py-2 px-4 rounded-md hover:bg-orange-600 transition-colors disabled:opacity-50 disabled:cursor-not-allowed"
+              >
+                {submitting ? 'Importing...' : 'Import Data'}
+              </button>
+            </div>
           </form>
         </div>
       </div>
@@ -4,9 +4,10 @@ import { useEffect, useState } from 'react';
 import { useAuth } from '@/context/AuthContext';
 import { useRouter } from 'next/navigation';
 import { adminApi, runsApi } from '@/lib/api';
-import { Run } from '@/types';
+import { Run, UserSuggestion } from '@/types';
 import Link from 'next/link';
 import BadgeIcon from '@/components/BadgeIcon';
+import UserSuggestInput, { getSuggestionName } from '@/components/UserSuggestInput';
 
 export default function ManageRunsPage() {
   const { user, loading: authLoading } = useAuth();
@@ -146,8 +147,8 @@ interface RsvpData {
     confirmed: RsvpUser[];
     interested: RsvpUser[];
     out: RsvpUser[];
+    waitlisted: RsvpUser[];
   };
-  available_users: RsvpUser[];
   capacity: number | null;
 }
 
@@ -159,6 +160,8 @@ function RunRow({ run, onDelete, onRefresh }: { run: Run; onDelete: (id: string)
   const [rsvpData, setRsvpData] = useState<RsvpData | null>(null);
   const [loadingRsvps, setLoadingRsvps] = useState(false);
   const [updatingUserId, setUpdatingUserId] = useState<string | null>(null);
+  const [usersToAdd, setUsersToAdd] = useState<UserSuggestion[]>([]);
+  const [addStatus, setAddStatus] = useState<'confirmed' | 'interested' | 'out'>('confirmed');
 
   const formatDate = (dateString: string) => {
     // Parse date string (YYYY-MM-DD) directly to avoid timezone issues
@@ -222,7 +225,8 @@ function RunRow({ run, onDelete, onRefresh }: { run: Run; onDelete: (id: string)
   const fetchRsvps = async () => {
     setLoadingRsvps(true);
     try {
-      const data = await adminApi.getRunRsvps(run.id);
+      // Add Users searches via suggestUsers instead of downloading every user
+      const data = await adminApi.getRunRsvps(run.id, false);
       setRsvpData(data);
     } catch (error) {
       console.error('Failed to fetch RSVPs:', error);
@@ -242,11 +246,11 @@ function RunRow({ run, onDelete, onRefresh }: { run: Run; onDelete: (id: string)
     userId: string, 
     newStatus: 'confirmed' | 'interested' | 'out' | null,
     userName: string,
-    previousStatus: 'confirmed' | 'interested' | 'out' | null
+    previousStatus: 'confirmed' | 'interested' | 'out' | 'waitlisted' | null
   ) => {
     setUpdatingUserId(userId);
     try {
-      await adminApi.setUserRsvp(run.id, userId, newStatus);
+      const response = await adminApi.setUserRsvp(run.id, userId, newStatus);
       await fetchRsvps();
       onRefresh(); // Refresh the run data to update participant counts
       
@@ -259,7 +263,7 @@ function RunRow({ run, onDelete, onRefresh }: { run: Run; onDelete: (id: string)
       if (newStatus === null) {
         alert(`Successfully removed ${userName}'s RSVP (was ${formatStatus(previousStatus)})`);
       } else {
-        alert(`Successfully changed ${userName}'s RSVP from ${formatStatus(previousStatus)} to ${formatStatus(newStatus)}`);
+        alert(`${response.message}: ${userName} (was ${formatStatus(previousStatus)})`);
       }
     } catch (error: any) {
       console.error('Failed to update RSVP:', error);
@@ -269,8 +273,25 @@ function RunRow({ run, onDelete, onRefresh }: { run: Run; onDelete: (id: string)
     }
   };
 
-  const handleAddUser = async (userId: string, status: 'confirmed' | 'interested' | 'out', userName: string) => {
-    await handleStatusChange(userId, status, userName, null);
+  const handleAddUsers = async (userIds: string[], status: 'confirmed' | 'interested' | 'out') => {
+    setUpdatingUserId(userIds[0]);
+    try {
+      // One request for the whole selection
+      const response = await adminApi.setUserRsvps(
+        run.id,
+        userIds.map((userId) => ({ user_id: userId, status }))
+      );
+      setUsersToAdd([]);
+      await fetchRsvps();
+      onRefresh();
+      const waitlisted = response.results.filter((result) => result.status === 'waitlisted').length;
+      alert(waitlisted > 0 ? `${response.message} (${waitlisted} added to the waitlist)` : response.message);
+    } catch (error: any) {
+      console.error('Failed to add users:', error);
+      alert(error.message || 'Failed to add users');
+    } finally {
+      setUpdatingUserId(null);
+    }
   };
 
   const getDisplayName = (user: RsvpUser) => {
@@ -378,7 +399,7 @@ function RunRow({ run, onDelete, onRefresh }: { run: Run; onDelete: (id: string)
               {/* Capacity Warning */}
               {isAtCapacity && (
                 <div className="bg-yellow-50 border border-yellow-200 rounded p-2 text-sm text-yellow-800">
-                  Run is at capacity ({rsvpData.capacity})
+                  Run is at capacity ({rsvpData.capacity}) - new confirmations join the waitlist
                 </div>
               )}
 
@@ -451,56 +472,77 @@ function RunRow({ run, onDelete, onRefresh }: { run: Run; onDelete: (id: string)
                 )}
               </div>
 
-              {/* Add User Section */}
-              {rsvpData.available_users.length > 0 && (
-                <div className="pt-3 border-t border-gray-200">
-                  <h4 className="text-sm font-semibold text-basketball-black mb-2">
-                    Add User
+              {/* Waitlist Section (promoted in this order as spots open) */}
+              {rsvpData.participants.waitlisted.length > 0 && (
+                <div>
+                  <h4 className="text-sm font-semibold text-purple-700 mb-2">
+                    Waitlist ({rsvpData.participants.waitlisted.length})
                   </h4>
-                  <div className="flex flex-col md:flex-row gap-2">
+                  <div className="space-y-1">
+                    {rsvpData.participants.waitlisted.map((user) => (
+                      <UserRsvpRow
+                        key={user.id}
+                        user={user}
+                        currentStatus="waitlisted"
+                        onStatusChange={handleStatusChange}
+                        isUpdating={updatingUserId === user.id}
+                        isAtCapacity={isAtCapacity}
+                      />
+                    ))}
+                  </div>
+                </div>
+              )}
+
+              {/* Add User Section */}
+              <div className="pt-3 border-t border-gray-200">
+                <h4 className="text-sm font-semibold text-basketball-black mb-2">
+                  Add Users
+                </h4>
+                {usersToAdd.length > 0 && (
+                  <div className="flex flex-wrap gap-2 mb-2">
+                    {usersToAdd.map((u) => (
+                      <span
+                        key={u.id}
+                        className="inline-flex items-center gap-1 px-2 py-1 bg-orange-50 border border-orange-200 rounded text-xs text-gray-900"
+                      >
+                        {getSuggestionName(u)}
+                        <button
+                          onClick={() => setUsersToAdd(usersToAdd.filter((selected) => selected.id !== u.id))}
+                          className="text-gray-500 hover:text-red-600"
+                          aria-label={`Remove ${getSuggestionName(u)}`}
+                        >
+                          ×
+                        </button>
+                      </span>
+                    ))}
+                  </div>
+                )}
+                <div className="flex flex-col md:flex-row gap-2">
+                  <UserSuggestInput
+                    excludeRunId={run.id}
+                    excludeUserIds={usersToAdd.map((u) => u.id)}
+                    onSelect={(u) => setUsersToAdd([...usersToAdd, u])}
+                  />
+                  <div className="flex gap-2">
                     <select
-                      id={`add-user-${run.id}`}
-                      className="flex-1 px-3 py-2 border border-gray-300 rounded text-sm text-gray-900 focus:ring-2 focus:ring-basketball-orange focus:border-transparent"
-                      defaultValue=""
+                      value={addStatus}
+                      onChange={(e) => setAddStatus(e.target.value as 'confirmed' | 'interested' | 'out')}
+                      className="flex-1 md:flex-none px-3 py-2 border border-gray-300 rounded text-sm text-gray-900 focus:ring-2 focus:ring-basketball-orange focus:border-transparent"
                     >
-                      <option value="" disabled>Select a user...</option>
-                      {rsvpData.available_users.map((user) => (
-                        <option key={user.id} value={user.id}>
-                          {getDisplayName(user)} (@{user.username})
-                        </option>
-                      ))}
+                      <option value="confirmed">{isAtCapacity ? 'Confirmed (waitlist)' : 'Confirmed'}</option>
+                      <option value="interested">Interested</option>
+                      <option value="out">Out</option>
                     </select>
-                    <div className="flex gap-2">
-                      <select
-                        id={`add-status-${run.id}`}
-                        className="flex-1 md:flex-none px-3 py-2 border border-gray-300 rounded text-sm text-gray-900 focus:ring-2 focus:ring-basketball-orange focus:border-transparent"
-                        defaultValue="confirmed"
-                      >
-                        <option value="confirmed" disabled={isAtCapacity}>Confirmed</option>
-                        <option value="interested">Interested</option>
-                        <option value="out">Out</option>
-                      </select>
-                      <button
-                        onClick={() => {
-                          const userSelect = document.getElementById(`add-user-${run.id}`) as HTMLSelectElement;
-                          const statusSelect = document.getElementById(`add-status-${run.id}`) as HTMLSelectElement;
-                          const userId = userSelect.value;
-                          const status = statusSelect.value as 'confirmed' | 'interested' | 'out';
-                          if (userId) {
-                            const selectedOption = userSelect.options[userSelect.selectedIndex];
-                            const userName = selectedOption.text.split(' (@')[0]; // Extract name from "Name (@username)"
-                            handleAddUser(userId, status, userName);
-                            userSelect.value = '';
-                          }
-                        }}
-                        className="px-4 py-2 bg-basketball-orange text-white rounded text-sm hover:bg-orange-600 whitespace-nowrap"
-                      >
-                        Add
-                      </button>
-                    </div>
+                    <button
+                      onClick={() => handleAddUsers(usersToAdd.map((u) => u.id), addStatus)}
+                      disabled={usersToAdd.length === 0}
+                      className="px-4 py-2 bg-basketball-orange text-white rounded text-sm hover:bg-orange-600 whitespace-nowrap disabled:opacity-50"
+                    >
+                      Add{usersToAdd.length > 1 ? ` (${usersToAdd.length})` : ''}
+                    </button>
                   </div>
                 </div>
-              )}
+              </div>
             </div>
           ) : (
             <p className="text-gray-600 text-sm">Failed to load RSVPs</p>
@@ -570,8 +612,8 @@ function UserRsvpRow({
   isAtCapacity,
 }: {
   user: RsvpUser;
-  currentStatus: 'confirmed' | 'interested' | 'out';
-  onStatusChange: (userId: string, status: 'confirmed' | 'interested' | 'out' | null, userName: string, previousStatus: 'confirmed' | 'interested' | 'out' | null) => void;
+  currentStatus: 'confirmed' | 'interested' | 'out' | 'waitlisted';
+  onStatusChange: (userId: string, status: 'confirmed' | 'interested' | 'out' | null, userName: string, previousStatus: 'confirmed' | 'interested' | 'out' | 'waitlisted' | null) => void;
   isUpdating: boolean;
   isAtCapacity: boolean;
 }) {
@@ -600,9 +642,12 @@ function UserRsvpRow({
           disabled={isUpdating}
           className="px-2 py-1.5 border border-gray-300 rounded text-xs text-gray-900 focus:ring-2 focus:ring-basketball-orange focus:border-transparent disabled:opacity-50"
         >
-          <option value="confirmed" disabled={isAtCapacity && currentStatus !== 'confirmed'}>
-            Confirmed
+          <option value="confirmed" disabled={currentStatus === 'waitlisted'}>
+            {isAtCapacity && currentStatus !== 'confirmed' && currentStatus !== 'waitlisted' ? 'Confirmed (waitlist)' : 'Confirmed'}
           </option>
+          {currentStatus === 'waitlisted' && (
+            <option value="waitlisted" disabled>Waitlisted</option>
+          )}
           <option value="interested">Interested</option>
           <option value="out">Out</option>
         </select>
@@ -3,9 +3,10 @@
 import { useEffect, useState } from 'react';
 import { useAuth } from '@/context/AuthContext';
 import { useRouter, useParams } from 'next/navigation';
-import { privateGroupsApi, adminApi } from '@/lib/api';
-import { PrivateGroup, User } from '@/types';
+import { privateGroupsApi } from '@/lib/api';
+import { PrivateGroup, UserSuggestion } from '@/types';
 import BadgeIcon from '@/components/BadgeIcon';
+import UserSuggestInput, { getSuggestionName } from '@/components/UserSuggestInput';
 import Link from 'next/link';
 
 export default function AdminManageGroupPage() {
@@ -15,13 +16,12 @@ export default function AdminManageGroupPage() {
   const groupId = params?.id as string;
 
   const [group, setGroup] = useState<PrivateGroup | null>(null);
-  const [allUsers, setAllUsers] = useState<User[]>([]);
   const [loading, setLoading] = useState(true);
   const [editingName, setEditingName] = useState(false);
   const [editName, setEditName] = useState('');
   const [editDescription, setEditDescription] = useState('');
   const [saving, setSaving] = useState(false);
-  const [addingUserId, setAddingUserId] = useState('');
+  const [addingUser, setAddingUser] = useState<UserSuggestion | null>(null);
   const [adding, setAdding] = useState(false);
   const [removingUserId, setRemovingUserId] = useState<string | null>(null);
   const [searchTerm, setSearchTerm] = useState('');
@@ -39,12 +39,8 @@ export default function AdminManageGroupPage() {
   const fetchData = async () => {
     try {
       setLoading(true);
-      const [groupData, usersData] = await Promise.all([
-        privateGroupsApi.getGroup(groupId),
-        adminApi.getUsers(),
-      ]);
+      const groupData = await privateGroupsApi.getGroup(groupId);
       setGroup(groupData.group);
-      setAllUsers(usersData.users);
       setEditName(groupData.group.name);
       setEditDescription(groupData.group.description || '');
     } catch (error) {
@@ -72,13 +68,17 @@ export default function AdminManageGroupPage() {
   };
 
   const handleAddMember = async () => {
-    if (!addingUserId) return;
+    if (!addingUser) return;
     setAdding(true);
     try {
-      await privateGroupsApi.addMember(groupId, addingUserId);
+      const data = await privateGroupsApi.addMember(groupId, addingUser.id);
       await refreshUser();
-      setAddingUserId('');
-      await fetchData();
+      setAddingUser(null);
+      setGroup((prev) => prev && {
+        ...prev,
+        members: [...(prev.members || []), ...data.added],
+        member_count: data.member_count,
+      });
     } catch (error: any) {
       alert(error.message || 'Failed to add member');
     } finally {
@@ -89,9 +89,13 @@ export default function AdminManageGroupPage() {
   const handleRemoveMember = async (userId: string) => {
     setRemovingUserId(userId);
     try {
-      await privateGroupsApi.removeMember(groupId, userId);
+      const data = await privateGroupsApi.removeMember(groupId, userId);
       await refreshUser();
-      await fetchData();
+      setGroup((prev) => prev && {
+        ...prev,
+        members: (prev.members || []).filter((m) => m.user_id !== data.removed_user_id),
+        member_count: data.member_count,
+      });
     } catch (error: any) {
       alert(error.message || 'Failed to remove member');
     } finally {
@@ -111,11 +115,6 @@ export default function AdminManageGroupPage() {
 
   if (!user || !user.is_admin || !group) return null;
 
-  const memberUserIds = new Set(group.members?.map((m) => m.user_id) || []);
-  const verifiedNonMembers = allUsers
-    .filter((u) => u.is_verified && !memberUserIds.has(u.id))
-    .sort((a, b) => ((a.first_name || a.username) || '').localeCompare((b.first_name || b.username) || ''));
-
   const getDisplayName = (u: { first_name?: string; last_name?: string; username?: string }) => {
     if (u.first_name && u.last_name) return `${u.first_name} ${u.last_name}`;
     return u.username || '';
@@ -205,29 +204,33 @@ export default function AdminManageGroupPage() {
               Add Member
             </h3>
             <div className="flex flex-col md:flex-row gap-2">
-              <select
-                value={addingUserId}
-                onChange={(e) => setAddingUserId(e.target.value)}
-                className="flex-1 px-3 py-2 border border-gray-300 rounded text-sm text-gray-900 focus:ring-2 focus:ring-basketball-orange focus:border-transparent"
-              >
-                <option value="">Select a verified user...</option>
-                {verifiedNonMembers.map((u) => (
-                  <option key={u.id} value={u.id}>
-                    {getDisplayName(u)} (@{u.username})
-                  </option>
-                ))}
-              </select>
+              {addingUser ? (
+                <div className="flex-1 flex items-center justify-between px-3 py-2 border border-gray-300 rounded text-sm text-gray-900 bg-white">
+                  <span>{getSuggestionName(addingUser)} (@{addingUser.username})</span>
+                  <button
+                    onClick={() => setAddingUser(null)}
+                    className="text-gray-500 hover:text-red-600"
+                    aria-label="Clear selection"
+                  >
+                    ×
+                  </button>
+                </div>
+              ) : (
+                <UserSuggestInput
+                  excludeGroupId={groupId}
+                  includeInactive
+                  onSelect={setAddingUser}
+                  placeholder="Search verified users..."
+                />
+              )}
               <button
                 onClick={handleAddMember}
-                disabled={!addingUserId || adding}
+                disabled={!addingUser || adding}
                 className="px-4 py-2 bg-basketball-orange text-white rounded text-sm hover:bg-orange-600 disabled:opacity-50 whitespace-nowrap"
               >
                 {adding ? 'Adding...' : 'Add'}
               </button>
             </div>
-            {verifiedNonMembers.length === 0 && (
-              <p className="text-xs text-gray-500 mt-2">All verified users are already members.</p>
-            )}
           </div>
 
           {/* Members List */}
@@ -173,6 +173,9 @@ export default function AdminPrivateGroupsPage() {
                     )}
                     <p className="text-xs text-gray-500 mt-1">
                       {group.member_count} member{group.member_count !== 1 ? 's' : ''}
+                      {group.upcoming_run_count !== undefined && (
+                        <> · {group.upcoming_run_count} upcoming run{group.upcoming_run_count !== 1 ? 's' : ''}</>
+                      )}
                     </p>
                   </div>
                   <div className="flex gap-2">
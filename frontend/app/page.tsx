@@ -38,6 +38,13 @@ function HomeContent() {
     }
   }, []);
 
+  // Swap in the run returned by an RSVP instead of refetching every run
+  const handleRunUpdate = useCallback((updated: Run) => {
+    const replace = (list: Run[]) => list.map((r) => (r.id === updated.id ? updated : r));
+    setUpcomingRuns(replace);
+    setPastRuns(replace);
+  }, []);
+
   useEffect(() => {
     if (searchParams.get('signup') === 'success') {
       setShowSignupSuccess(true);
@@ -142,7 +149,7 @@ function HomeContent() {
                 </h2>
                 <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4 md:gap-6">
                   {upcomingRuns.map((run) => (
-                    <RunCard key={run.id} run={run} onUpdate={fetchRuns} />
+                    <RunCard key={run.id} run={run} onUpdate={handleRunUpdate} />
                   ))}
                 </div>
               </div>
@@ -155,7 +162,7 @@ function HomeContent() {
                 </h2>
                 <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4 md:gap-6">
                   {(showAllPastRuns ? pastRuns : pastRuns.slice(0, PAST_RUNS_LIMIT)).map((run) => (
-                    <RunCard key={run.id} run={run} onUpdate={fetchRuns} />
+                    <RunCard key={run.id} run={run} onUpdate={handleRunUpdate} />
                   ))}
                 </div>
                 {pastRuns.length > PAST_RUNS_LIMIT && (
@@ -49,6 +49,13 @@ export default function PrivateGroupRunsPage() {
     fetchGroupRuns();
   }, [user, authLoading, router, fetchGroupRuns]);
 
+  // Swap in the run returned by an RSVP instead of refetching every run
+  const handleRunUpdate = useCallback((updated: Run) => {
+    const replace = (list: Run[]) => list.map((r) => (r.id === updated.id ? updated : r));
+    setUpcomingRuns(replace);
+    setPastRuns(replace);
+  }, []);
+
   if (authLoading || loading) {
     return (
       <div className="container mx-auto px-4 py-12">
@@ -113,7 +120,7 @@ export default function PrivateGroupRunsPage() {
           </h2>
           <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4 md:gap-6">
             {upcomingRuns.map((run) => (
-              <RunCard key={run.id} run={run} onUpdate={fetchGroupRuns} />
+              <RunCard key={run.id} run={run} onUpdate={handleRunUpdate} />
             ))}
           </div>
         </div>
@@ -126,7 +133,7 @@ export default function PrivateGroupRunsPage() {
           </h2>
           <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4 md:gap-6">
             {(showAllPastRuns ? pastRuns : pastRuns.slice(0, PAST_RUNS_LIMIT)).map((run) => (
-              <RunCard key={run.id} run={run} onUpdate={fetchGroupRuns} />
+              <RunCard key={run.id} run={run} onUpdate={handleRunUpdate} />
             ))}
           </div>
           {pastRuns.length > PAST_RUNS_LIMIT && (
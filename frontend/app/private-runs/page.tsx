@@ -81,6 +81,9 @@ export default function PrivateRunsPage() {
                 )}
                 <div className="flex items-center gap-2 text-sm text-gray-500">
                   <span>{group.member_count} member{group.member_count !== 1 ? 's' : ''}</span>
+                  {group.upcoming_run_count !== undefined && group.upcoming_run_count > 0 && (
+                    <span>· {group.upcoming_run_count} upcoming run{group.upcoming_run_count !== 1 ? 's' : ''}</span>
+                  )}
                 </div>
               </Link>
             ))}
@@ -41,6 +41,12 @@ export default function ProfilePage() {
     }
   };
 
+  // Swap in the run returned by an RSVP instead of refetching every run
+  const handleRunUpdate = (updated: Run) => {
+    const replace = (list: Run[]) => list.map((r) => (r.id === updated.id ? updated : r));
+    setRuns((prev) => ({ upcoming: replace(prev.upcoming), history: replace(prev.history) }));
+  };
+
   if (authLoading || loading) {
     return (
       <div className="container mx-auto px-4 py-12">
@@ -124,7 +130,7 @@ export default function ProfilePage() {
           {runs.upcoming.length > 0 ? (
             <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4 md:gap-6">
               {runs.upcoming.map((run) => (
-                <RunCard key={run.id} run={run} onUpdate={fetchRuns} />
+                <RunCard key={run.id} run={run} onUpdate={handleRunUpdate} />
               ))}
             </div>
           ) : (
@@ -139,7 +145,7 @@ export default function ProfilePage() {
           {runs.history.length > 0 ? (
             <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4 md:gap-6">
               {runs.history.map((run) => (
-                <RunCard key={run.id} run={run} onUpdate={fetchRuns} />
+                <RunCard key={run.id} run={run} onUpdate={handleRunUpdate} />
               ))}
             </div>
           ) : (
@@ -0,0 +1,117 @@
+'use client';
+
+import { useEffect, useState } from 'react';
+import Link from 'next/link';
+import { adminApi } from '@/lib/api';
+import { SearchResults } from '@/types';
+
+// Wait for a pause in typing before querying the backend
+const SEARCH_DEBOUNCE_MS = 250;
+
+export default function AdminSearch() {
+  const [query, setQuery] = useState('');
+  const [results, setResults] = useState<SearchResults | null>(null);
+  const [searching, setSearching] = useState(false);
+
+  useEffect(() => {
+    if (!query.trim()) {
+      setResults(null);
+      return;
+    }
+
+    let cancelled = false;
+    const timer = setTimeout(async () => {
+      setSearching(true);
+      try {
+        const data = await adminApi.search(query.trim());
+        if (!cancelled) setResults(data.results);
+      } catch (error) {
+        console.error('Search failed:', error);
+      } finally {
+        if (!cancelled) setSearching(false);
+      }
+    }, SEARCH_DEBOUNCE_MS);
+
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [query]);
+
+  const hasResults = results && (results.runs?.length || results.users?.length || results.groups?.length);
+
+  return (
+    <div className="bg-white rounded-lg shadow-md p-4 md:p-6 mb-4 md:mb-6">
+      <input
+        type="search"
+        value={query}
+        onChange={(e) => setQuery(e.target.value)}
+        placeholder="Search runs, users and groups..."
+        className="w-full px-4 py-2 border border-gray-300 rounded-md focus:ring-2 focus:ring-basketball-orange focus:border-transparent text-gray-900"
+      />
+
+      {searching && !results && <p className="text-gray-500 text-sm mt-3">Searching...</p>}
+
+      {results && !hasResults && !searching && (
+        <p className="text-gray-500 text-sm mt-3">No matches</p>
+      )}
+
+      {results && hasResults ? (
+        <div className="mt-4 space-y-4 text-sm">
+          {results.runs && results.runs.length > 0 && (
+            <div>
+              <h3 className="font-semibold text-gray-700 mb-1">Runs</h3>
+              <ul className="space-y-1">
+                {results.runs.map((run) => (
+                  <li key={run.id}>
+                    <Link href={`/admin/edit-run/${run.id}`} className="text-basketball-orange hover:underline">
+                      {run.title}
+                    </Link>
+                    <span className="text-gray-500 ml-2">
+                      {run.date}{run.is_completed ? ' · completed' : ''}
+                    </span>
+                  </li>
+                ))}
+              </ul>
+            </div>
+          )}
+
+          {results.users && results.users.length > 0 && (
+            <div>
+              <h3 className="font-semibold text-gray-700 mb-1">Users</h3>
+              <ul className="space-y-1">
+                {results.users.map((u) => (
+                  <li key={u.id}>
+                    <Link href={`/users/${u.id}`} className="text-basketball-orange hover:underline">
+                      {u.first_name && u.last_name ? `${u.first_name} ${u.last_name}` : u.username}
+                    </Link>
+                    <span className="text-gray-500 ml-2">
+                      @{u.username}
+                      {!u.is_verified ? ' · unverified' : ''}
+                      {!u.is_active ? ' · inactive' : ''}
+                    </span>
+                  </li>
+                ))}
+              </ul>
+            </div>
+          )}
+
+          {results.groups && results.groups.length > 0 && (
+            <div>
+              <h3 className="font-semibold text-gray-700 mb-1">Groups</h3>
+              <ul className="space-y-1">
+                {results.groups.map((group) => (
+                  <li key={group.id}>
+                    <Link href={`/admin/private-groups/${group.id}`} className="text-basketball-orange hover:underline">
+                      {group.name}
+                    </Link>
+                  </li>
+                ))}
+              </ul>
+            </div>
+          )}
+        </div>
+      ) : null}
+    </div>
+  );
+}
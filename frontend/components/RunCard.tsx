@@ -9,7 +9,8 @@ import BadgeIcon from './BadgeIcon';
 
 interface RunCardProps {
   run: Run;
-  onUpdate?: () => void;
+  // Receives this run re-serialized after an RSVP so the parent can replace it in place
+  onUpdate?: (run: Run) => void;
 }
 
 export default function RunCard({ run, onUpdate }: RunCardProps) {
@@ -27,10 +28,12 @@ export default function RunCard({ run, onUpdate }: RunCardProps) {
 
     setUpdating(true);
     try {
-      await runsApi.updateRsvp(run.id, status);
-      setCurrentStatus(status);
-      if (onUpdate) {
-        onUpdate();
+      // Only this run comes back (roster included) - the list is not refetched
+      const response = await runsApi.updateRsvp(run.id, status, true);
+      // A confirm on a full run comes back as 'waitlisted'
+      setCurrentStatus(response.rsvp.status || status);
+      if (onUpdate && response.run) {
+        onUpdate(response.run);
       }
     } catch (error: any) {
       console.error('Failed to update RSVP:', error);
@@ -88,11 +91,12 @@ export default function RunCard({ run, onUpdate }: RunCardProps) {
   const isAtCapacity = run.capacity !== undefined && run.capacity !== null && 
     (run.participant_counts?.confirmed || 0) >= run.capacity;
   
-  // Check if user is already confirmed (they should still be able to interact with the button)
+  // Check if user is already confirmed or queued for a spot
   const isUserConfirmed = currentStatus === 'confirmed';
+  const isUserWaitlisted = currentStatus === 'waitlisted';
   
-  // Disable confirm button if at capacity and user is not already confirmed
-  const isConfirmDisabled = isAtCapacity && !isUserConfirmed;
+  // When the run is full, confirming joins the waitlist instead
+  const joinsWaitlist = isAtCapacity && !isUserConfirmed;
 
   // Helper function to format participant names with badges
   const formatParticipantNames = (
@@ -253,6 +257,18 @@ export default function RunCard({ run, onUpdate }: RunCardProps) {
                 </div>
               )}
             </div>
+            {(run.participant_counts?.waitlisted || 0) > 0 && (
+              <div className="flex-1">
+                <span className="font-semibold text-purple-600">
+                  Waitlist: {run.participant_counts?.waitlisted || 0}
+                </span>
+                {run.participants?.waitlisted && run.participants.waitlisted.length > 0 && (
+                  <div className="text-gray-600 text-xs mt-1 space-y-1">
+                    {formatParticipantNames(run.participants.waitlisted)}
+                  </div>
+                )}
+              </div>
+            )}
           </div>
         )}
       </div>
@@ -269,16 +285,24 @@ export default function RunCard({ run, onUpdate }: RunCardProps) {
             <div className="flex gap-2 overflow-hidden">
               <button
                 onClick={() => handleRsvp('confirmed')}
-                disabled={updating || isConfirmDisabled}
+                disabled={updating || isUserWaitlisted}
                 className={`flex-1 min-w-0 px-2 py-2 text-xs sm:text-sm rounded transition-all truncate ${
                   currentStatus === 'confirmed'
                     ? 'bg-green-600 text-white border-2 border-green-700 ring-2 ring-green-300'
-                    : isConfirmDisabled
-                    ? 'bg-gray-200 text-gray-500 border-2 border-transparent cursor-not-allowed'
+                    : isUserWaitlisted
+                    ? 'bg-purple-600 text-white border-2 border-purple-700 ring-2 ring-purple-300'
+                    : joinsWaitlist
+                    ? 'bg-purple-100 text-purple-700 hover:bg-purple-200 border-2 border-transparent'
                     : 'bg-green-100 text-green-700 hover:bg-green-200 border-2 border-transparent'
                 } ${updating ? 'opacity-50 cursor-not-allowed' : ''}`}
               >
-                {currentStatus === 'confirmed' ? '✓ Confirmed' : 'Confirm'}
+                {currentStatus === 'confirmed'
+                  ? '✓ Confirmed'
+                  : isUserWaitlisted
+                  ? '✓ Waitlisted'
+                  : joinsWaitlist
+                  ? 'Join Waitlist'
+                  : 'Confirm'}
               </button>
               <button
                 onClick={() => handleRsvp('interested')}
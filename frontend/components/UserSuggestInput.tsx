@@ -0,0 +1,99 @@
+'use client';
+
+import { useEffect, useState } from 'react';
+import { adminApi } from '@/lib/api';
+import { UserSuggestion } from '@/types';
+
+// Wait for a pause in typing before querying the backend
+const SUGGEST_DEBOUNCE_MS = 200;
+
+interface UserSuggestInputProps {
+  onSelect: (user: UserSuggestion) => void;
+  excludeRunId?: string;
+  excludeGroupId?: string;
+  badge?: string;
+  includeInactive?: boolean;
+  // Users already picked in the parent, hidden from the suggestions
+  excludeUserIds?: string[];
+  placeholder?: string;
+}
+
+export function getSuggestionName(user: UserSuggestion) {
+  if (user.first_name && user.last_name) {
+    return `${user.first_name} ${user.last_name}`;
+  }
+  return user.username;
+}
+
+export default function UserSuggestInput({
+  onSelect,
+  excludeRunId,
+  excludeGroupId,
+  badge,
+  includeInactive,
+  excludeUserIds = [],
+  placeholder = 'Type a name or username...',
+}: UserSuggestInputProps) {
+  const [query, setQuery] = useState('');
+  const [suggestions, setSuggestions] = useState<UserSuggestion[]>([]);
+
+  useEffect(() => {
+    if (!query.trim()) {
+      setSuggestions([]);
+      return;
+    }
+
+    let cancelled = false;
+    const timer = setTimeout(async () => {
+      try {
+        const data = await adminApi.suggestUsers(query.trim(), {
+          excludeRunId,
+          excludeGroupId,
+          badge,
+          includeInactive,
+        });
+        if (!cancelled) setSuggestions(data.users);
+      } catch (error) {
+        console.error('Failed to suggest users:', error);
+      }
+    }, SUGGEST_DEBOUNCE_MS);
+
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [query, excludeRunId, excludeGroupId, badge, includeInactive]);
+
+  const visible = suggestions.filter((u) => !excludeUserIds.includes(u.id));
+
+  return (
+    <div className="relative flex-1">
+      <input
+        type="text"
+        value={query}
+        onChange={(e) => setQuery(e.target.value)}
+        placeholder={placeholder}
+        className="w-full px-3 py-2 border border-gray-300 rounded text-sm text-gray-900 focus:ring-2 focus:ring-basketball-orange focus:border-transparent"
+      />
+      {query.trim() && visible.length > 0 && (
+        <ul className="absolute z-10 mt-1 w-full bg-white border border-gray-200 rounded shadow-lg max-h-60 overflow-y-auto">
+          {visible.map((u) => (
+            <li key={u.id}>
+              <button
+                type="button"
+                onClick={() => {
+                  onSelect(u);
+                  setQuery('');
+                  setSuggestions([]);
+                }}
+                className="w-full text-left px-3 py-2 text-sm text-gray-900 hover:bg-orange-50"
+              >
+                {getSuggestionName(u)} <span className="text-gray-500">(@{u.username})</span>
+              </button>
+            </li>
+          ))}
+        </ul>
+      )}
+    </div>
+  );
+}
@@ -1,5 +1,5 @@
 import { getToken, removeToken } from './auth';
-import { User, Run, Announcement, ApiError, Location, PrivateGroup, GroupCommunityMember } from '@/types';
+import { User, Run, Announcement, ApiError, Location, PrivateGroup, PrivateGroupMember, GroupCommunityMember, EmailDeadLetter, RsvpSummary, AdminAnalytics, SearchResults, UserSuggestion } from '@/types';
 
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || '';
 
@@ -117,8 +117,8 @@ export const runsApi = {
     });
   },
 
-  updateRsvp: async (runId: string, status: 'confirmed' | 'interested' | 'out') => {
-    return fetchApi<{ message: string; run: Run }>(`/api/runs/${runId}/rsvp`, {
+  updateRsvp: async (runId: string, status: 'confirmed' | 'interested' | 'out', includeRun = false) => {
+    return fetchApi<{ message: string; rsvp: RsvpSummary; run?: Run }>(`/api/runs/${runId}/rsvp${includeRun ? '?include_run=true' : ''}`, {
       method: 'POST',
       body: JSON.stringify({ status }),
     });
@@ -214,21 +214,21 @@ export const privateGroupsApi = {
   },
 
   addMember: async (groupId: string, userId: string) => {
-    return fetchApi<{ message: string; group: PrivateGroup }>(
+    return fetchApi<{ message: string; added: PrivateGroupMember[]; member_count: number }>(
       `/api/private-groups/${groupId}/members`,
       { method: 'POST', body: JSON.stringify({ user_id: userId }) }
     );
   },
 
   addMembers: async (groupId: string, userIds: string[]) => {
-    return fetchApi<{ message: string; group: PrivateGroup }>(
+    return fetchApi<{ message: string; added: PrivateGroupMember[]; member_count: number }>(
       `/api/private-groups/${groupId}/members`,
       { method: 'POST', body: JSON.stringify({ user_ids: userIds }) }
     );
   },
 
   removeMember: async (groupId: string, userId: string) => {
-    return fetchApi<{ message: string; group: PrivateGroup }>(
+    return fetchApi<{ message: string; removed_user_id: string; member_count: number }>(
       `/api/private-groups/${groupId}/members/${userId}`,
       { method: 'DELETE' }
     );
@@ -241,6 +241,25 @@ export const adminApi = {
     return fetchApi<{ users: User[] }>('/api/admin/users');
   },
 
+  suggestUsers: async (
+    query: string,
+    options: {
+      limit?: number;
+      excludeRunId?: string;
+      excludeGroupId?: string;
+      badge?: string;
+      includeInactive?: boolean;
+    } = {}
+  ) => {
+    const params = new URLSearchParams({ q: query });
+    if (options.limit) params.set('limit', String(options.limit));
+    if (options.excludeRunId) params.set('exclude_run_id', options.excludeRunId);
+    if (options.excludeGroupId) params.set('exclude_group_id', options.excludeGroupId);
+    if (options.badge) params.set('badge', options.badge);
+    if (options.includeInactive) params.set('include_inactive', 'true');
+    return fetchApi<{ users: UserSuggestion[] }>(`/api/admin/users/suggest?${params.toString()}`);
+  },
+
   verifyUser: async (userId: string, isVerified: boolean) => {
     return fetchApi<{ message: string; user: User }>(
       `/api/admin/users/${userId}/verify`,
@@ -283,17 +302,35 @@ export const adminApi = {
     });
   },
 
-  importRuns: async (runsData: any) => {
+  // dryRun validates every row and reports all errors without writing anything
+  importRuns: async (runsData: any, dryRun = false) => {
     return fetchApi<{
       message: string;
       imported_count: number;
+      error_count: number;
       errors: string[];
-    }>('/api/admin/runs/import', {
+      dry_run: boolean;
+    }>(`/api/admin/runs/import${dryRun ? '?dry_run=true' : ''}`, {
       method: 'POST',
       body: JSON.stringify(runsData),
     });
   },
 
+  // One run object per line; the backend streams and imports it in chunks
+  importRunsNdjson: async (ndjson: string, dryRun = false) => {
+    return fetchApi<{
+      message: string;
+      imported_count: number;
+      error_count: number;
+      errors: string[];
+      dry_run: boolean;
+    }>(`/api/admin/runs/import${dryRun ? '?dry_run=true' : ''}`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/x-ndjson' },
+      body: ndjson,
+    });
+  },
+
   assignBadge: async (userId: string, badge: 'regular' | 'plus_one' | null, referredBy?: string) => {
     return fetchApi<{ message: string; user: User }>(
       `/api/admin/users/${userId}/badge`,
@@ -351,21 +388,36 @@ export const adminApi = {
     );
   },
 
-  getRunRsvps: async (runId: string) => {
+  // includeAvailable=false skips the available_users list (use suggestUsers for pickers);
+  // availablePage pages through it instead of returning every user
+  getRunRsvps: async (
+    runId: string,
+    includeAvailable = true,
+    availablePage?: { limit: number; offset?: number }
+  ) => {
+    const params = new URLSearchParams();
+    if (!includeAvailable) params.set('include_available', 'false');
+    if (availablePage) {
+      params.set('limit', String(availablePage.limit));
+      params.set('offset', String(availablePage.offset || 0));
+    }
+    const query = params.toString();
     return fetchApi<{
       run_id: string;
       participants: {
         confirmed: Array<{ id: string; username: string; first_name?: string; last_name?: string; badge?: string; status: string }>;
         interested: Array<{ id: string; username: string; first_name?: string; last_name?: string; badge?: string; status: string }>;
         out: Array<{ id: string; username: string; first_name?: string; last_name?: string; badge?: string; status: string }>;
+        waitlisted: Array<{ id: string; username: string; first_name?: string; last_name?: string; badge?: string; status: string }>;
       };
-      available_users: Array<{ id: string; username: string; first_name?: string; last_name?: string; badge?: string }>;
+      available_users?: Array<{ id: string; username: string; first_name?: string; last_name?: string; badge?: string }>;
+      available_total?: number;
       capacity: number | null;
-    }>(`/api/admin/runs/${runId}/rsvps`);
+    }>(`/api/admin/runs/${runId}/rsvps${query ? `?${query}` : ''}`);
   },
 
   setUserRsvp: async (runId: string, userId: string, status: 'confirmed' | 'interested' | 'out' | null) => {
-    return fetchApi<{ message: string; run: Run }>(
+    return fetchApi<{ message: string; rsvp: RsvpSummary }>(
       `/api/admin/runs/${runId}/rsvp/${userId}`,
       {
         method: 'PUT',
@@ -373,5 +425,63 @@ export const adminApi = {
       }
     );
   },
+
+  setUserRsvps: async (
+    runId: string,
+    changes: Array<{ user_id: string; status: 'confirmed' | 'interested' | 'out' | null }>
+  ) => {
+    return fetchApi<{
+      message: string;
+      results: Array<{ user_id: string; status: RsvpSummary['status'] }>;
+      run: Omit<RsvpSummary, 'status'>;
+    }>(`/api/admin/runs/${runId}/rsvps`, {
+      method: 'PUT',
+      body: JSON.stringify({ changes }),
+    });
+  },
+
+  search: async (query: string, types?: Array<'runs' | 'users' | 'groups'>, limit?: number) => {
+    const params = new URLSearchParams({ q: query });
+    if (types) params.set('types', types.join(','));
+    if (limit) params.set('limit', String(limit));
+    return fetchApi<{ query: string; results: SearchResults }>(
+      `/api/admin/search?${params.toString()}`
+    );
+  },
+
+  getAnalytics: async (refresh = false) => {
+    return fetchApi<{ analytics: AdminAnalytics; cached: boolean }>(
+      `/api/admin/analytics${refresh ? '?refresh=true' : ''}`
+    );
+  },
+
+  // Streams a CSV/NDJSON export from the backend; resolves to a Blob for download
+  exportData: async (dataset: 'runs' | 'participations' | 'users', format: 'csv' | 'ndjson' = 'csv') => {
+    const token = getToken();
+    const response = await fetch(
+      `${API_BASE_URL}/api/admin/export/${dataset}?format=${format}`,
+      { headers: token ? { Authorization: `Bearer ${token}` } : {} }
+    );
+    if (!response.ok) {
+      const data = await response.json().catch(() => ({}));
+      throw new Error((data as ApiError).error || 'Export failed');
+    }
+    return response.blob();
+  },
+
+  getEmailDeadLetters: async (includeReplayed = false) => {
+    return fetchApi<{ dead_letters: EmailDeadLetter[] }>(
+      `/api/admin/email-dead-letters${includeReplayed ? '?include_replayed=true' : ''}`
+    );
+  },
+
+  replayEmailDeadLetter: async (deadLetterId: string) => {
+    return fetchApi<{ message: string; dead_letter: EmailDeadLetter }>(
+      `/api/admin/email-dead-letters/${deadLetterId}/replay`,
+      {
+        method: 'POST',
+      }
+    );
+  },
 };
 
@@ -58,6 +58,7 @@ export interface Run {
     confirmed?: Array<{username: string; first_name?: string; last_name?: string; badge?: string; attended?: boolean; no_show?: boolean}>;
     interested?: Array<{username: string; first_name?: string; last_name?: string; badge?: string; attended?: boolean; no_show?: boolean}>;
     out?: Array<{username: string; first_name?: string; last_name?: string; badge?: string; attended?: boolean; no_show?: boolean}>;
+    waitlisted?: Array<{username: string; first_name?: string; last_name?: string; badge?: string; attended?: boolean; no_show?: boolean}>;
     no_show?: Array<{username: string; first_name?: string; last_name?: string; badge?: string; attended?: boolean; no_show?: boolean}>;
     attended?: Array<{username: string; first_name?: string; last_name?: string; badge?: string; attended?: boolean}>;
   };
@@ -65,10 +66,19 @@ export interface Run {
     confirmed?: number;
     interested?: number;
     out?: number;
+    waitlisted?: number;
     no_show?: number;
     attended?: number;
   };
-  user_status?: 'confirmed' | 'interested' | 'out';
+  user_status?: 'confirmed' | 'interested' | 'out' | 'waitlisted';
+}
+
+export interface RsvpSummary {
+  run_id: string;
+  status: 'confirmed' | 'interested' | 'out' | 'waitlisted' | null;
+  capacity?: number;
+  participant_counts: Run['participant_counts'];
+  cost?: number;
 }
 
 export interface PrivateGroup {
@@ -78,6 +88,7 @@ export interface PrivateGroup {
   created_by: string;
   created_at: string;
   member_count?: number;
+  upcoming_run_count?: number;
   members?: PrivateGroupMember[];
 }
 
@@ -111,6 +122,65 @@ export interface Announcement {
   is_active: boolean;
 }
 
+export interface EmailDeadLetter {
+  id: string;
+  to: string;
+  subject: string;
+  attempts: number;
+  last_error?: string;
+  created_at: string;
+  replayed_at?: string;
+}
+
+export interface AdminAnalytics {
+  attendance_by_month: Array<{
+    month: string;
+    runs: number;
+    attendance: number;
+    unique_players: number;
+    average_attendance: number | null;
+  }>;
+  fill_rate_by_location: Array<{
+    location_id: string;
+    location: string;
+    runs: number;
+    confirmed: number;
+    capacity: number;
+    waitlisted: number;
+    fill_rate: number | null;
+  }>;
+  no_show_rate_by_badge: Array<{
+    badge: string | null;
+    confirmed: number;
+    attended: number;
+    no_shows: number;
+    no_show_rate: number | null;
+  }>;
+  computed_at: string;
+}
+
+export interface UserSuggestion {
+  id: string;
+  username: string;
+  first_name?: string;
+  last_name?: string;
+  badge?: string;
+}
+
+export interface SearchResults {
+  runs?: Array<{ id: string; title: string; date: string; start_time: string; is_completed: boolean }>;
+  users?: Array<{
+    id: string;
+    username: string;
+    first_name?: string;
+    last_name?: string;
+    badge?: string;
+    is_verified: boolean;
+    is_active: boolean;
+  }>;
+  groups?: Array<{ id: string; name: string }>;
+}
+
 export interface ApiError {
   error: string;
 }
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""
+Benchmark for rebuilding user stats (runs_attended_count / no_shows_count).
+
+Spins up the Flask app against a throwaway file-backed SQLite database (or
+the Postgres URL in BENCH_DATABASE_URL), bulk-loads synthetic users, runs and
+participations, then times utils.stats.recalculate_user_stats (one UPDATE).
+With --compare-legacy it also times the old per-user loop (two COUNT queries
+and a commit per user) and checks both produce the same stats.
+
+Usage (from the repo root):
+    python scripts/bench_user_stats.py --users 10000 --participations 50000 --compare-legacy
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='User stats recalculation benchmark')
+    parser.add_argument('--users', type=int, default=10000, help='Synthetic users')
+    parser.add_argument('--participations', type=int, default=50000, help='Synthetic run participations')
+    parser.add_argument('--runs-per-user', type=int, default=5, help='Used to size the run pool')
+    parser.add_argument('--compare-legacy', action='store_true', help='Also time the old per-user loop')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='stats_bench_')
+    os.environ['DATABASE_URL'] = os.getenv('BENCH_DATABASE_URL') or f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ.setdefault('ADMIN_PASSWORD', 'bench')
+    os.environ['EMAIL_QUEUE_PATH'] = os.path.join(workdir, 'email_queue.db')
+    os.environ.pop('RESEND_API_KEY', None)
+    sys.path.insert(0, BACKEND_DIR)
+
+    from datetime import date, time as dt_time
+    from sqlalchemy import insert
+    from app import app
+    from database import db
+    from models import User, Run, RunParticipant, Location
+    from utils.stats import recalculate_user_stats
+
+    random.seed(42)
+    with app.app_context():
+        admin_id = User.query.filter_by(username='zmann').first().id
+        location_id = Location.query.first().id
+
+        start = time.perf_counter()
+        user_ids = [str(uuid.uuid4()) for _ in range(args.users)]
+        db.session.execute(insert(User), [
+            {'id': user_id, 'username': f'bench{i}', 'email': f'bench{i}@example.com', 'password_hash': 'x', 'is_verified': True}
+            for i, user_id in enumerate(user_ids)
+        ])
+        run_count = max(1, args.participations // max(1, args.runs_per_user))
+        run_ids = [str(uuid.uuid4()) for _ in range(run_count)]
+        db.session.execute(insert(Run), [
+            {'id': run_id, 'title': f'Bench Run {i}', 'date': date(2020, 1, 1), 'start_time': dt_time(18, 0),
+             'end_time': dt_time(20, 0), 'location_id': location_id, 'created_by': admin_id,
+             'is_historical': True, 'is_completed': True}
+            for i, run_id in enumerate(run_ids)
+        ])
+        # Unique (run, user) pairs
+        pairs = set()
+        while len(pairs) < args.participations:
+            pairs.add((random.choice(run_ids), random.choice(user_ids)))
+        rows = []
+        for run_id, user_id in pairs:
+            attended = random.random() < 0.85
+            rows.append({'run_id': run_id, 'user_id': user_id, 'status': 'confirmed',
+                         'attended': attended, 'no_show': not attended and random.random() < 0.5})
+        db.session.execute(insert(RunParticipant), rows)
+        db.session.commit()
+        print(f"Loaded {args.users} users, {run_count} runs, {len(rows)} participations in {time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        updated = recalculate_user_stats()
+        db.session.commit()
+        elapsed = time.perf_counter() - start
+        print(f"set-based recalculate_user_stats: {updated} users in {elapsed:.3f}s")
+        set_based = dict(db.session.query(User.id, User.runs_attended_count + User.no_shows_count * 1000000).all())
+
+        if args.compare_legacy:
+            User.query.update({'runs_attended_count': 0, 'no_shows_count': 0})
+            db.session.commit()
+            start = time.perf_counter()
+            _legacy_recalculate_all_user_stats(db, User, RunParticipant)
+            legacy_elapsed = time.perf_counter() - start
+            print(f"legacy per-user loop: {legacy_elapsed:.3f}s ({legacy_elapsed / elapsed:.0f}x slower)")
+            legacy = dict(db.session.query(User.id, User.runs_attended_count + User.no_shows_count * 1000000).all())
+            if legacy != set_based:
+                print('FAIL: set-based stats differ from the legacy loop')
+                sys.exit(1)
+            print('OK: set-based stats match the legacy loop')
+
+
+def _legacy_recalculate_all_user_stats(db, User, RunParticipant):
+    """The previous implementation: two COUNT queries and a commit per user"""
+    for user in User.query.all():
+        user.runs_attended_count = RunParticipant.query.filter_by(user_id=user.id, attended=True).count()
+        user.no_shows_count = RunParticipant.query.filter_by(user_id=user.id, no_show=True).count()
+        db.session.commit()
+
+
+if __name__ == '__main__':
+    main()
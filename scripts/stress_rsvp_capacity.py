@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""
+Stress test for RSVP capacity enforcement.
+
+Spins up the Flask app against a throwaway file-backed SQLite database (or
+the Postgres URL in STRESS_DATABASE_URL), creates one run with a small
+capacity, then has many threads confirm at the same time. Confirms past
+capacity land on the waitlist. Reports confirms per second and fails if the
+run ends up over capacity or the waitlist does not hold everyone else.
+
+Usage (from the repo root):
+    python scripts/stress_rsvp_capacity.py --users 200 --capacity 15 --threads 16
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Concurrent RSVP confirm stress test')
+    parser.add_argument('--users', type=int, default=200, help='Users racing to confirm')
+    parser.add_argument('--capacity', type=int, default=15, help='Run capacity')
+    parser.add_argument('--threads', type=int, default=16, help='Concurrent request threads')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='rsvp_stress_')
+    os.environ['DATABASE_URL'] = os.getenv('STRESS_DATABASE_URL') or f"sqlite:///{os.path.join(workdir, 'stress.db')}"
+    os.environ.setdefault('ADMIN_PASSWORD', 'stress-test')
+    os.environ['EMAIL_QUEUE_PATH'] = os.path.join(workdir, 'email_queue.db')
+    os.environ.pop('RESEND_API_KEY', None)
+    sys.path.insert(0, BACKEND_DIR)
+
+    from datetime import date, time as dt_time, timedelta
+    from app import app
+    from database import db
+    from models import User, Run, RunParticipant, Location
+    from middleware import generate_token
+
+    with app.app_context():
+        admin = User.query.filter_by(username='zmann').first()
+        run = Run(
+            title='Stress Run',
+            date=date.today() + timedelta(days=7),
+            start_time=dt_time(18, 0),
+            end_time=dt_time(20, 0),
+            location_id=Location.query.first().id,
+            capacity=args.capacity,
+            created_by=admin.id
+        )
+        db.session.add(run)
+        users = [
+            User(username=f'stress{i}', email=f'stress{i}@example.com', password_hash='x', is_verified=True)
+            for i in range(args.users)
+        ]
+        db.session.add_all(users)
+        db.session.commit()
+        run_id = run.id
+        tokens = [generate_token(user) for user in users]
+
+    client_local = threading.local()
+    results = {'confirmed': 0, 'waitlisted': 0, 'errors': 0}
+    results_lock = threading.Lock()
+
+    def confirm(token):
+        if not hasattr(client_local, 'client'):
+            client_local.client = app.test_client()
+        response = client_local.client.post(
+            f'/api/runs/{run_id}/rsvp',
+            json={'status': 'confirmed'},
+            headers={'Authorization': f'Bearer {token}'}
+        )
+        with results_lock:
+            if response.status_code == 200 and response.get_json()['rsvp']['status'] == 'waitlisted':
+                results['waitlisted'] += 1
+            elif response.status_code == 200:
+                results['confirmed'] += 1
+            else:
+                results['errors'] += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        list(pool.map(confirm, tokens))
+    elapsed = time.perf_counter() - start
+
+    with app.app_context():
+        stored = RunParticipant.query.filter_by(run_id=run_id, status='confirmed').count()
+        waitlisted = RunParticipant.query.filter_by(run_id=run_id, status='waitlisted').count()
+
+    print(f"{args.users} confirm requests in {elapsed:.2f}s ({args.users / elapsed:.1f} req/s) on {args.threads} threads")
+    print(f"accepted={results['confirmed']} waitlisted={results['waitlisted']} errors={results['errors']}")
+    print(f"confirmed in database: {stored} / capacity {args.capacity}, waitlisted: {waitlisted}")
+
+    if stored > args.capacity or results['confirmed'] != stored or results['waitlisted'] != waitlisted:
+        print('FAIL: capacity was not held exactly')
+        sys.exit(1)
+    print('OK: capacity held exactly')
+
+
+if __name__ == '__main__':
+    main()